@@ -829,7 +829,10 @@ async def test_keyword_analyzer():
     agent = KeywordAnalyzerAgent(gemini, seo_tools)
     agent.set_progress_callback(progress_callback)
     
-    result = await agent.execute(test_input)
+    try:
+        result = await agent.execute(test_input)
+    finally:
+        await seo_tools.aclose()
     
     print("\nKeyword Analysis Results:")
     print("-" * 30)
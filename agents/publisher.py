@@ -340,9 +340,10 @@ class PublisherAgent(BaseAgent):
     async def _publish_to_wordpress(self, post_data: Dict) -> Dict:
         """Actually publish to WordPress"""
         
+        wp = None
         try:
             # Initialize WordPress API
-            wp = WordPressAPI(
+            wp = await WordPressAPI.create(
                 url=self.wp_config["url"],
                 username=self.wp_config["username"],
                 password=self.wp_config["password"],
@@ -350,17 +351,29 @@ class PublisherAgent(BaseAgent):
             )
             
             # Test connection
-            if not wp.test_connection():
+            if not await wp.test_connection():
                 raise Exception("WordPress connection failed")
             
+            # Create categories and tags (one batch request each, concurrently)
+            category_ids, tag_ids = await asyncio.gather(
+                self._resolve_terms(
+                    wp.create_categories_batch, wp.get_or_create_category,
+                    post_data.get("categories", []), "categories"
+                ),
+                self._resolve_terms(
+                    wp.create_tags_batch, wp.get_or_create_tag,
+                    post_data.get("tags", []), "tags"
+                )
+            )
+            
             # Create the post
-            result = wp.create_post(
+            result = await wp.create_post(
                 title=post_data["title"],
                 content=post_data["content"],
                 status=post_data["status"],
                 excerpt=post_data["excerpt"],
-                categories=[],  # We'll need to create categories first
-                tags=[],  # We'll need to create tags first
+                categories=[cid for cid in category_ids if cid],
+                tags=[tid for tid in tag_ids if tid],
                 meta=post_data.get("meta", {})
             )
             
@@ -380,6 +393,30 @@ class PublisherAgent(BaseAgent):
                 "error": str(e),
                 "post_data": post_data
             }
+        finally:
+            if wp is not None:
+                await wp.aclose()
+    
+    async def _resolve_terms(self, create_batch, get_or_create, names: List[str], label: str) -> List[int]:
+        """Resolve term IDs via the batch endpoint, falling back to per-term lookups"""
+        
+        if not names:
+            return []
+        
+        try:
+            return await create_batch(names)
+        except Exception as e:
+            # Batch API may be disabled or blocked; a failed term must not block the post
+            self.logger.warning(f"Batch creation of {label} failed, falling back to per-term requests: {str(e)}")
+        
+        async def _one(name: str) -> int:
+            try:
+                return await get_or_create(name)
+            except Exception as e:
+                self.logger.warning(f"Could not resolve {label} term '{name}': {str(e)}")
+                return 0
+        
+        return list(await asyncio.gather(*(_one(name) for name in names)))
     
     def _setup_basic_tracking(self, publish_result: Dict) -> Dict:
         """Setup basic tracking without API calls"""
@@ -2,21 +2,54 @@
 
 import asyncio
 import logging
+import os
+import sys
+import traceback
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Dict, List, Any, Optional, Callable
 import uuid
 
+# Mock agent simulated work: MOCK_AGENT_SLEEP_MS restores wall-clock sleeps,
+# otherwise mocks only yield to the event loop
+MOCK_AGENT_SLEEP_MS = float(os.getenv("MOCK_AGENT_SLEEP_MS", "0"))
+
 # Event system
+@dataclass(slots=True)
 class PipelineEvent:
-    def __init__(self, event_type: str, data: Dict[str, Any], timestamp: str = None):
-        self.event_type = event_type
-        self.data = data
-        self.timestamp = timestamp or datetime.now().isoformat()
+    event_type: str
+    data: Dict[str, Any]
+    timestamp: str = field(default_factory=lambda: datetime.now().isoformat())
     
     def __str__(self):
         return f"Event: {self.event_type} - {self.data}"
 
+class _LazyTB:
+    """Traceback captured at failure time, formatted only when read
+    
+    Keeps frame summaries (TracebackException), not the traceback itself, so the
+    failed agent's frames and locals are freed with the exception.
+    """
+    __slots__ = ("summary", "exc_name")
+    
+    def __init__(self, exc_info):
+        exc_type, exc, tb = exc_info
+        self.summary = traceback.TracebackException(exc_type, exc, tb, lookup_lines=False)
+        self.exc_name = exc_type.__name__
+    
+    def __str__(self):
+        return "".join(self.summary.format())
+    
+    def __repr__(self):
+        return f"<traceback {self.exc_name}: {self.summary}>"
+
+@dataclass(slots=True)
+class AgentLocalConfig:
+    """Minimal config exposed by mock agents"""
+    name: str
+    timeout: int = 60
+
 class EventBus:
     def __init__(self):
         self.listeners = {}
@@ -91,11 +124,12 @@ class PipelineOrchestrator:
             # Mock agent class
             class MockAgent:
                 def __init__(self, config, progress_callback=None):
-                    self.config = type('Config', (), {
-                        'name': agent_config['name'],
-                        'timeout': agent_config.get('timeout', 60)
-                    })()
+                    self.config = AgentLocalConfig(
+                        name=agent_config['name'],
+                        timeout=agent_config.get('timeout', 60)
+                    )
                     self.progress_callback = progress_callback
+                    self._simulate_yields = agent_config.get('simulate_yields', 0)
                 
                 async def execute(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
                     # Simulate progress
@@ -108,13 +142,18 @@ class PipelineOrchestrator:
                             message=f"Mock {self.config.name} processing..."
                         )
                     
-                    await asyncio.sleep(0.1)  # Simulate work
+                    # Simulate work
+                    if MOCK_AGENT_SLEEP_MS:
+                        await asyncio.sleep(MOCK_AGENT_SLEEP_MS / 1000)
+                    else:
+                        for _ in range(self._simulate_yields):
+                            await asyncio.sleep(0)
                     
                     # Return mock result
                     return {
                         f"{agent_name}_result": f"Mock result from {agent_name}",
                         "status": "completed",
-                        "processing_time": 0.1
+                        "processing_time": MOCK_AGENT_SLEEP_MS / 1000
                     }
             
             return MockAgent(agent_config, progress_callback)
@@ -172,7 +211,6 @@ class PipelineOrchestrator:
             error_msg = f"Agent {agent_name} failed: {str(e)}"
             self.errors.append(error_msg)
             
-            import traceback
             self.event_bus.publish(PipelineEvent(
                 "agent_agent_failed",  # Note: keeping original event name for consistency
                 {
@@ -180,7 +218,7 @@ class PipelineOrchestrator:
                     "agent_data": {
                         "error": error_msg,
                         "processing_time": (datetime.now() - start_time).total_seconds(),
-                        "traceback": traceback.format_exc()
+                        "traceback": _LazyTB(sys.exc_info())
                     },
                     "timestamp": datetime.now().isoformat()
                 }
@@ -196,9 +234,8 @@ class PipelineOrchestrator:
         pipeline_output = {
             "pipeline_id": str(uuid.uuid4()),
             "generated_at": self.start_time.isoformat(),
-            "language": "english",
-            **input_data
-        }
+            "language": "english"
+        } | input_data
         
         # Pipeline started event
         self.event_bus.publish(PipelineEvent(
@@ -227,7 +264,7 @@ class PipelineOrchestrator:
                     self.results[agent_name] = agent_result
                     
                     # Merge agent output into pipeline
-                    pipeline_output.update(agent_result)
+                    pipeline_output |= agent_result
                     
                 except Exception as e:
                     print(f"Agent {agent_name} failed with exception: {e}")
@@ -52,7 +52,7 @@ except ImportError:
     RICH_AVAILABLE = True
 
 
-@dataclass
+@dataclass(slots=True)
 class PipelineConfig:
     """Pipeline configuration"""
     # Required fields
@@ -100,6 +100,9 @@ class PipelineOrchestrator:
         self.start_time = None
         self.end_time = None
         
+        # All console output while agents run, printed in order off the event loop
+        self._console_queue: Optional[asyncio.Queue] = None
+        
         # Initialize agents
         self._initialize_agents()
         
@@ -158,7 +161,24 @@ class PipelineOrchestrator:
         """Progress callback for agents"""
         # Simple console output for now
         icon = "⚙️" if status == "processing" else "✅" if status == "completed" else "🔄"
-        self.console.print(f"  {icon} [{progress:3d}%] {current_step}", end="\r")
+        self._print(f"  {icon} [{progress:3d}%] {current_step}", end="\r")
+    
+    def _print(self, *args, **kwargs):
+        """Queue a console print while the pipeline runs, print directly otherwise"""
+        if self._console_queue is not None:
+            self._console_queue.put_nowait((args, kwargs))
+        else:
+            self.console.print(*args, **kwargs)
+    
+    async def _drain_console(self):
+        """
+        Single console consumer - prints queued output in order until the None sentinel
+        
+        Prints run in a worker thread so slow terminals don't block the loop.
+        """
+        while (item := await self._console_queue.get()) is not None:
+            args, kwargs = item
+            await asyncio.to_thread(self.console.print, *args, **kwargs)
         
     async def run_pipeline(self) -> Dict[str, Any]:
         """
@@ -167,7 +187,7 @@ class PipelineOrchestrator:
         self.start_time = datetime.now()
         
         # Print header
-        self._print_header()
+        await asyncio.to_thread(self._print_header)
         
         # Initialize pipeline data
         self.pipeline_data = {
@@ -192,98 +212,136 @@ class PipelineOrchestrator:
             # Add main task
             main_task = progress.add_task("[cyan]Pipeline Progress", total=7)
             
-            # Execute each agent
+            # Execute each agent - pipeline key and agent instance resolved up front
             agent_names = [
-                ("1_market_research", "🔍 Market Research", "Analyzing market and competition..."),
-                ("2_keyword_analyzer", "🔑 Keyword Analysis", "Finding best keywords..."),
-                ("3_content_planner", "📋 Content Planning", "Creating content structure..."),
-                ("4_seo_optimizer", "🎯 SEO Optimization", "Optimizing for search engines..."),
-                ("5_content_writer", "✍️ Content Writing", "Writing the article..."),
-                ("6_quality_checker", "✨ Quality Check", "Checking content quality..."),
-                ("7_publisher", "🚀 Publishing", "Publishing to WordPress...")
+                (agent_key, display_name, description, agent_key.split('_', 1)[1], self.agents[agent_key])
+                for agent_key, display_name, description in (
+                    ("1_market_research", "🔍 Market Research", "Analyzing market and competition..."),
+                    ("2_keyword_analyzer", "🔑 Keyword Analysis", "Finding best keywords..."),
+                    ("3_content_planner", "📋 Content Planning", "Creating content structure..."),
+                    ("4_seo_optimizer", "🎯 SEO Optimization", "Optimizing for search engines..."),
+                    ("5_content_writer", "✍️ Content Writing", "Writing the article..."),
+                    ("6_quality_checker", "✨ Quality Check", "Checking content quality..."),
+                    ("7_publisher", "🚀 Publishing", "Publishing to WordPress...")
+                )
             ]
             
-            for agent_key, display_name, description in agent_names:
+            # Agents run while a single consumer prints their output - console IO
+            # overlaps the next agent's execution, and lines keep their order
+            self._console_queue = asyncio.Queue()
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    tg.create_task(self._drain_console())
+                    tg.create_task(self._run_agents(agent_names, progress, main_task))
+            finally:
+                self._console_queue = None
+        
+        # Finalize
+        self.end_time = datetime.now()
+        duration = (self.end_time - self.start_time).total_seconds()
+        
+        # Print summary
+        await asyncio.to_thread(self._print_summary, duration)
+        
+        # Save results
+        self._save_results()
+        
+        return {
+            "success": len(self.errors) == 0,
+            "duration": duration,
+            "agents_completed": len(self.agent_results),
+            "errors": self.errors,
+            "pipeline_data": self.pipeline_data,
+            "agent_results": self.agent_results
+        }
+    
+    async def _run_agents(self, agent_names: List[tuple], progress: Progress, main_task):
+        """Producer - execute agents in order and merge their data"""
+        try:
+            for agent_key, display_name, description, pipeline_key, agent in agent_names:
                 # Skip certain agents if configured
                 if agent_key == "6_quality_checker" and self.config.skip_quality_check:
-                    self.console.print(f"\n[yellow]⏭️ Skipping {display_name}[/yellow]")
-                    progress.update(main_task, advance=1)
+                    self._report("skipped", agent_key, display_name, None, progress, main_task)
                     continue
                     
                 if agent_key == "7_publisher" and self.config.skip_publishing:
-                    self.console.print(f"\n[yellow]⏭️ Skipping {display_name}[/yellow]")
-                    progress.update(main_task, advance=1)
+                    self._report("skipped", agent_key, display_name, None, progress, main_task)
                     continue
                 
-                # Print stage header    
-                self.console.print(f"\n[bold blue]{display_name}[/bold blue]")
-                self.console.print(f"[dim]{description}[/dim]")
+                self._report("started", agent_key, display_name, description, progress, main_task)
                 
                 try:
                     # Execute agent
-                    agent = self.agents[agent_key]
                     result = await agent.execute(self.pipeline_data)
                     
                     if result.success:
-                        # Store results
+                        # Store results before the next agent reads pipeline_data
                         self.agent_results[agent_key] = result
-                        self.pipeline_data[agent_key.split('_', 1)[1]] = result.data
-                        
-                        # Success message
-                        self.console.print(f"[green]✅ {display_name} completed![/green]")
-                        
-                        # Show key metrics
-                        if agent_key == "2_keyword_analyzer":
-                            summary = result.data.get("analysis_summary", {})
-                            self.console.print(f"   [dim]Found {summary.get('total_keywords_analyzed', 0)} keywords[/dim]")
-                        elif agent_key == "5_content_writer":
-                            summary = result.data.get("writing_summary", {})
-                            self.console.print(f"   [dim]Wrote {summary.get('total_word_count', 0)} words[/dim]")
-                        elif agent_key == "7_publisher":
-                            pub_summary = result.data.get("publication_summary", {})
-                            if pub_summary.get("post_id"):
-                                self.console.print(f"   [dim]Post ID: {pub_summary['post_id']}[/dim]")
-                                self.console.print(f"   [dim]URL: {pub_summary.get('post_url', 'N/A')}[/dim]")
+                        self.pipeline_data[pipeline_key] = result.data
+                        self._report("completed", agent_key, display_name, result, progress, main_task)
                     else:
-                        # Failure
                         self.errors.append(f"{display_name} failed: {result.errors}")
-                        self.console.print(f"[red]❌ {display_name} failed![/red]")
-                        
-                        # Continue anyway
-                        if agent_key not in ["5_content_writer", "7_publisher"]:
-                            self.console.print("[yellow]   Continuing with limited data...[/yellow]")
+                        self._report("failed", agent_key, display_name, result, progress, main_task)
                         
                 except Exception as e:
                     self.errors.append(f"{display_name} exception: {str(e)}")
-                    self.console.print(f"[red]❌ {display_name} crashed: {str(e)}[/red]")
                     self.logger.error(f"{agent_key} exception", exc_info=True)
+                    self._report("crashed", agent_key, display_name, e, progress, main_task)
                     
                     # Critical agents - stop if they fail
                     if agent_key in ["5_content_writer"]:
-                        self.console.print("[red]⛔ Cannot continue without content![/red]")
                         break
-                
-                # Update progress
-                progress.update(main_task, advance=1)
-        
-        # Finalize
-        self.end_time = datetime.now()
-        duration = (self.end_time - self.start_time).total_seconds()
-        
-        # Print summary
-        self._print_summary(duration)
-        
-        # Save results
-        self._save_results()
+        finally:
+            # Agents are done - let the console consumer finish
+            self._console_queue.put_nowait(None)
+    
+    def _report(self, state: str, agent_key: str, display_name: str, payload: Any, progress: Progress, main_task):
+        """Queue an agent's console output (in run order, with its progress lines) and advance progress"""
+        if state == "skipped":
+            self._print(f"\n[yellow]⏭️ Skipping {display_name}[/yellow]")
+            progress.update(main_task, advance=1)
+            return
+        
+        if state == "started":
+            # Print stage header
+            self._print(f"\n[bold blue]{display_name}[/bold blue]")
+            self._print(f"[dim]{payload}[/dim]")
+            return
+        
+        if state == "completed":
+            # Success message
+            self._print(f"[green]✅ {display_name} completed![/green]")
+            
+            # Show key metrics
+            if agent_key == "2_keyword_analyzer":
+                summary = payload.data.get("analysis_summary", {})
+                self._print(f"   [dim]Found {summary.get('total_keywords_analyzed', 0)} keywords[/dim]")
+            elif agent_key == "5_content_writer":
+                summary = payload.data.get("writing_summary", {})
+                self._print(f"   [dim]Wrote {summary.get('total_word_count', 0)} words[/dim]")
+            elif agent_key == "7_publisher":
+                pub_summary = payload.data.get("publication_summary", {})
+                if pub_summary.get("post_id"):
+                    self._print(f"   [dim]Post ID: {pub_summary['post_id']}[/dim]")
+                    self._print(f"   [dim]URL: {pub_summary.get('post_url', 'N/A')}[/dim]")
+        elif state == "failed":
+            self._print(f"[red]❌ {display_name} failed![/red]")
+            
+            # Continue anyway
+            if agent_key not in ["5_content_writer", "7_publisher"]:
+                self._print("[yellow]   Continuing with limited data...[/yellow]")
+        else:
+            self._print(f"[red]❌ {display_name} crashed: {str(payload)}[/red]")
+            if agent_key in ["5_content_writer"]:
+                self._print("[red]⛔ Cannot continue without content![/red]")
         
-        return {
-            "success": len(self.errors) == 0,
-            "duration": duration,
-            "agents_completed": len(self.agent_results),
-            "errors": self.errors,
-            "pipeline_data": self.pipeline_data,
-            "agent_results": self.agent_results
-        }
+        # Update progress
+        progress.update(main_task, advance=1)
+    
+    async def aclose(self):
+        """Close the services' HTTP sessions and cache store"""
+        await self.seo_tools.aclose()
+        await self.gemini.aclose()
     
     def _print_header(self):
         """Print beautiful header"""
@@ -432,6 +490,8 @@ async def main():
     except Exception as e:
         console.print(f"\n[red]❌ Pipeline failed: {str(e)}[/red]")
         logging.error("Pipeline failed", exc_info=True)
+    finally:
+        await orchestrator.aclose()
 
 
 if __name__ == "__main__":
@@ -11,32 +11,31 @@ Free SEO Tools Service - AI SEO Blog Generator
 import asyncio
 import aiohttp
 import logging
-from typing import Dict, List, Any, Optional
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 import json
+import random
+import re
 import time
-from urllib.parse import quote_plus
+from urllib.parse import quote_plus, urlparse, unquote
 import warnings
 
+from utils.rate_limiter import AsyncTokenBucket
+
 # Pandas FutureWarning'i sustur
 warnings.filterwarnings('ignore', category=FutureWarning)
 
 # Ücretsiz kütüphaneler
 try:
     from pytrends.request import TrendReq
+    import numpy as np  # pytrends/pandas dependency
     PYTRENDS_AVAILABLE = True
 except ImportError:
     PYTRENDS_AVAILABLE = False
     print("⚠️ pytrends not installed. Run: pip install pytrends")
 
-try:
-    from googlesearch import search
-    GOOGLESEARCH_AVAILABLE = True
-except ImportError:
-    GOOGLESEARCH_AVAILABLE = False
-    print("⚠️ googlesearch-python not installed. Run: pip install googlesearch-python")
-
 try:
     from bs4 import BeautifulSoup
     import requests
@@ -45,8 +44,55 @@ except ImportError:
     SCRAPING_AVAILABLE = False
     print("⚠️ BeautifulSoup not installed. Run: pip install beautifulsoup4 requests")
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
 
-@dataclass
+try:
+    import brotli  # noqa: F401 - aiohttp br response decoding
+    ACCEPT_ENCODING = 'br, gzip, deflate'
+except ImportError:
+    ACCEPT_ENCODING = 'gzip, deflate'
+
+try:
+    import lxml  # noqa: F401 - BeautifulSoup için hızlı parser
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
+# Precompiled patterns
+_RESULT_STATS_RE = re.compile(rb'id="result-stats"[^>]*>([^<]+)')
+_RESULT_COUNT_RE = re.compile(r'[\d,]+')
+# Sonuç anchor'ları: doğrudan <a href="https://..."> (modern UA) ya da /url?q=https://...& (basit HTML)
+_SERP_URL_RE = re.compile(r'<a\s[^>]*?href="(?:/url\?q=)?(https?://[^"&]+)')
+
+# Ana keyword + modifier'lar, question-based modifier'lar sonda
+_CONTENT_GAP_MODIFIERS = (
+    "how to", "best", "top", "vs", "review", "guide", "tutorial", "tips", "for beginners",
+    "what is", "why", "when to use", "where to buy"
+)
+
+# Static mock fallback data
+_MOCK_AUTOCOMPLETE_SUFFIXES = (
+    "review", "best", "guide", "how to", "tips", "tutorial", "for beginners", "2024"
+)
+_MOCK_COMPETITORS = (
+    "example.com",
+    "bestreviews.com",
+    "topguide.org",
+    "expertadvice.net",
+    "prosandcons.com",
+    "buyersguide.org",
+    "techreview.com",
+    "comparison.net",
+    "ultimate-guide.com",
+    "trusted-source.org"
+)
+
+
+@dataclass(slots=True, frozen=True)
 class FreeKeywordData:
     """Ücretsiz keyword verisi yapısı"""
     keyword: str
@@ -90,12 +136,11 @@ class FreeSEOToolsService:
                 self.logger.warning(f"Pytrends initialization failed: {e}")
                 self.pytrends = None
             
-        # Rate limiting için bekleme süreleri
-        self.delays = {
-            'trends': 1.5,  # Google Trends arası bekleme (biraz artırıldı)
-            'autocomplete': 0.5,  # Autocomplete arası bekleme
-            'search': 2.0,  # Google Search arası bekleme
-            'scraping': 1.0  # Web scraping arası bekleme
+        # Rate limiting - endpoint başına token bucket (rate istek/sn, burst kapasitesi)
+        self.buckets = {
+            'trends': AsyncTokenBucket(rate=0.66, capacity=3),
+            'autocomplete': AsyncTokenBucket(rate=2.0, capacity=5),
+            'search': AsyncTokenBucket(rate=0.5, capacity=2)
         }
         
         # User agents for scraping
@@ -104,12 +149,77 @@ class FreeSEOToolsService:
             'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         ]
         
-        # Request session for better performance
-        self.session = None
+        # Request session for better performance - lazily created, shared by all calls
+        self.session: Optional[aiohttp.ClientSession] = None
+        
+        # TTL cache (saniye) - aynı sorgular tekrar Google'a gitmesin
+        self.cache_ttl = {
+            'trends': 900,
+            'autocomplete': 3600,
+            'serp': 1800
+        }
+        self._cache: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
+        self._cache_max_size = 2048
+        
+        # Google Trends istek kuyruğu - worker ilk istekte başlatılır
+        self._trends_queue: Optional[asyncio.Queue] = None
+        self._trends_worker_task: Optional[asyncio.Task] = None
+        
+        # Aynı anda analiz edilen keyword sayısı sınırı
+        self.keyword_semaphore = asyncio.Semaphore(5)
         
         self.logger.info("Free SEO Tools Service initialized")
         self._check_dependencies()
     
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Paylaşılan HTTP session'ı al (keep-alive ile bağlantı tekrar kullanımı)"""
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=50, limit_per_host=10, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=10)
+            )
+        return self.session
+    
+    def _cache_get(self, key: Tuple, ttl: float) -> Any:
+        """Cache'ten değer al, süresi dolmuşsa None döndür"""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        
+        stored_at, value = entry
+        if time.monotonic() - stored_at >= ttl:
+            del self._cache[key]
+            return None
+        
+        self._cache.move_to_end(key)
+        return value
+    
+    def _cache_put(self, key: Tuple, value: Any):
+        """Cache'e değer yaz, limit aşılırsa en eskiyi at"""
+        self._cache[key] = (time.monotonic(), value)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._cache_max_size:
+            self._cache.popitem(last=False)
+    
+    async def aclose(self):
+        """HTTP session'ı ve Trends worker'ını kapat"""
+        task, self._trends_worker_task = self._trends_worker_task, None
+        if task and not task.done():
+            task.cancel()
+            # Worker'ın bekleyen çağıranları serbest bırakmasını bekle (aynı loop'taysa)
+            if task.get_loop() is asyncio.get_running_loop():
+                await asyncio.wait([task])
+        
+        if self.session and not self.session.closed:
+            await self.session.close()
+        self.session = None
+    
     def _check_dependencies(self):
         """Bağımlılıkları kontrol et"""
         status = []
@@ -118,11 +228,6 @@ class FreeSEOToolsService:
         else:
             status.append("❌ pytrends")
             
-        if GOOGLESEARCH_AVAILABLE:
-            status.append("✅ googlesearch")
-        else:
-            status.append("❌ googlesearch")
-            
         if SCRAPING_AVAILABLE:
             status.append("✅ beautifulsoup4")
         else:
@@ -155,58 +260,123 @@ class FreeSEOToolsService:
             if not clean_keywords:
                 return {}
             
-            # Build payload with error handling
-            try:
-                self.pytrends.build_payload(clean_keywords, cat=0, timeframe=timeframe, geo='', gprop='')
-            except Exception as e:
-                self.logger.error(f"Failed to build pytrends payload: {e}")
-                return await self._mock_trends_data(keywords)
-            
-            # Interest over time
-            trends_data = {}
+            cache_key = ('trends', tuple(sorted(clean_keywords)), timeframe)
+            cached = self._cache_get(cache_key, self.cache_ttl['trends'])
+            if cached is not None:
+                return cached
             
-            try:
-                interest_over_time = self.pytrends.interest_over_time()
-                
-                if interest_over_time is not None and not interest_over_time.empty:
-                    for keyword in clean_keywords:
-                        if keyword in interest_over_time.columns:
-                            trend_values = interest_over_time[keyword].tolist()
-                            current_score = int(trend_values[-1]) if trend_values else 50
-                            
-                            trends_data[keyword] = {
-                                'trend_score': current_score,
-                                'trend_data': [int(v) for v in trend_values[-12:]],  # Son 12 veri noktası
-                                'related_queries': []
-                            }
-            except Exception as e:
-                self.logger.error(f"Failed to get interest over time: {e}")
+            # Trends istekleri tek kuyruktan, bucket hızında işlenir
+            self._ensure_trends_worker()
+            future = asyncio.get_running_loop().create_future()
+            await self._trends_queue.put((future, clean_keywords, timeframe))
+            trends_data = await future
             
-            # Related queries - separate try block
-            try:
-                related_queries = self.pytrends.related_queries()
-                
-                for keyword in clean_keywords:
-                    if keyword in related_queries and keyword in trends_data:
-                        top_queries = related_queries[keyword].get('top', None)
-                        if top_queries is not None and not top_queries.empty:
-                            trends_data[keyword]['related_queries'] = top_queries['query'].tolist()[:10]
-            except Exception as e:
-                self.logger.warning(f"Failed to get related queries: {e}")
-                # Continue without related queries
-            
-            # Rate limiting
-            await asyncio.sleep(self.delays['trends'])
+            if not trends_data:
+                return await self._mock_trends_data(keywords)
             
-            return trends_data if trends_data else await self._mock_trends_data(keywords)
+            self._cache_put(cache_key, trends_data)
+            return trends_data
             
         except Exception as e:
             self.logger.error(f"Google Trends error: {str(e)}")
             return await self._mock_trends_data(keywords)
     
+    def _ensure_trends_worker(self):
+        """Trends kuyruğu worker'ını (gerekirse) çalışan event loop'ta başlat"""
+        task = self._trends_worker_task
+        if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+            self._trends_queue = asyncio.Queue()
+            self._trends_worker_task = asyncio.create_task(self._trends_worker())
+    
+    async def _trends_worker(self):
+        """Kuyruktaki Trends isteklerini sırayla, rate limit'e uyarak çalıştır"""
+        # Kuyruk yerel tutulur: yeni loop için açılan kuyruk bu worker'ı etkilemez
+        queue = self._trends_queue
+        future = None
+        try:
+            while True:
+                future, clean_keywords, timeframe = await queue.get()
+                try:
+                    await self.buckets['trends'].acquire()
+                    result = await self._trends_call(clean_keywords, timeframe)
+                    if not future.done():
+                        future.set_result(result)
+                except Exception as e:
+                    if not future.done():
+                        future.set_exception(e)
+        finally:
+            # İptal (aclose) ya da beklenmeyen çıkış: bekleyen çağıranlar asılı kalmasın,
+            # get_google_trends hatayı yakalayıp mock veriye düşer
+            pending = [future] if future is not None else []
+            while not queue.empty():
+                pending.append(queue.get_nowait()[0])
+            for waiting in pending:
+                if not waiting.done():
+                    waiting.set_exception(RuntimeError("Google Trends worker stopped"))
+    
+    async def _trends_call(self, clean_keywords: List[str], timeframe: str) -> Dict[str, Any]:
+        """
+        pytrends ile tek bir Trends isteği yap
+        
+        pytrends blocking çalışır, çağrılar thread'de yapılır. pytrends client'ı
+        thread-safe değil; tek Trends worker'ı çağrıları zaten sıraya koyar.
+        
+        Returns:
+            Dict: Trend verileri, veri alınamazsa boş dict
+        """
+        
+        # Build payload with error handling
+        try:
+            await asyncio.to_thread(
+                self.pytrends.build_payload, clean_keywords, cat=0, timeframe=timeframe, geo='', gprop=''
+            )
+        except Exception as e:
+            self.logger.error(f"Failed to build pytrends payload: {e}")
+            return {}
+        
+        # Interest over time
+        trends_data = {}
+        
+        try:
+            interest_over_time = await asyncio.to_thread(self.pytrends.interest_over_time)
+            
+            if interest_over_time is not None and not interest_over_time.empty:
+                for keyword in clean_keywords:
+                    if keyword in interest_over_time.columns:
+                        trend_values = interest_over_time[keyword].to_numpy(dtype=np.int32)
+                        current_score = int(trend_values[-1]) if trend_values.size else 50
+                        
+                        trends_data[keyword] = {
+                            'trend_score': current_score,
+                            'trend_data': trend_values[-12:].tolist(),  # Son 12 veri noktası
+                            'related_queries': []
+                        }
+        except Exception as e:
+            self.logger.error(f"Failed to get interest over time: {e}")
+        
+        # Related queries - separate try block
+        try:
+            related_queries = await asyncio.to_thread(self.pytrends.related_queries)
+            
+            for keyword in clean_keywords:
+                if keyword in related_queries and keyword in trends_data:
+                    top_queries = related_queries[keyword].get('top', None)
+                    if top_queries is not None and not top_queries.empty:
+                        trends_data[keyword]['related_queries'] = top_queries['query'].tolist()[:10]
+        except Exception as e:
+            self.logger.warning(f"Failed to get related queries: {e}")
+            # Continue without related queries
+        
+        return trends_data
+    
     async def get_google_autocomplete(self, keyword: str, language: str = 'en') -> List[str]:
         """Google Autocomplete önerilerini al"""
         
+        cache_key = ('autocomplete', keyword, language)
+        cached = self._cache_get(cache_key, self.cache_ttl['autocomplete'])
+        if cached is not None:
+            return cached
+        
         suggestions = []
         
         try:
@@ -218,28 +388,25 @@ class FreeSEOToolsService:
                 'hl': language
             }
             
-            async with aiohttp.ClientSession() as session:
-                # Headers ekle
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-                }
-                async with session.get(url, params=params, headers=headers, timeout=10) as response:
-                    if response.status == 200:
-                        # Content type kontrolü yapma, direkt parse et
-                        text = await response.text()
-                        
-                        # JSONP formatında gelebilir, temizle
-                        if text.startswith('window.'):
-                            text = text.split('(', 1)[1].rsplit(')', 1)[0]
-                        
-                        import json
-                        data = json.loads(text)
-                        
-                        if isinstance(data, list) and len(data) > 1:
-                            suggestions = data[1][:10] if isinstance(data[1], list) else []
+            await self.buckets['autocomplete'].acquire()
+            session = await self._get_session()
+            
+            # Headers ekle
+            headers = {
+                'User-Agent': random.choice(self.user_agents),
+                'Accept-Encoding': ACCEPT_ENCODING
+            }
+            async with session.get(url, params=params, headers=headers) as response:
+                if response.status == 200:
+                    # Content type kontrolü yapma, ham byte'ları direkt parse et
+                    # (client=chrome düz JSON döndürür, JSONP değil)
+                    data = _json_loads(await response.read())
+                    
+                    if isinstance(data, list) and len(data) > 1:
+                        suggestions = data[1][:10] if isinstance(data[1], list) else []
+                    
+                    self._cache_put(cache_key, suggestions)
             
-            # Rate limiting
-            await asyncio.sleep(self.delays['autocomplete'])
         
         except Exception as e:
             self.logger.warning(f"Autocomplete fallback for '{keyword}': {str(e)}")
@@ -247,6 +414,99 @@ class FreeSEOToolsService:
         
         return suggestions
     
+    async def _fetch_google_search(self, keyword: str, num_results: int = 10) -> Optional[bytes]:
+        """
+        Google arama sonuç sayfasını paylaşılan session üzerinden indir
+        
+        Returns:
+            Optional[bytes]: Ham HTML, başarısızsa None
+        """
+        url = "https://www.google.com/search"
+        params = {'q': keyword, 'num': num_results, 'hl': 'en'}
+        
+        headers = {
+            'User-Agent': random.choice(self.user_agents),
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.5',
+            'Accept-Encoding': ACCEPT_ENCODING,
+            'Connection': 'keep-alive',
+        }
+        
+        await self.buckets['search'].acquire()
+        session = await self._get_session()
+        async with session.get(url, params=params, headers=headers) as response:
+            if response.status != 200:
+                self.logger.warning(f"Google search returned {response.status} for '{keyword}'")
+                return None
+            return await response.read()
+    
+    async def _fetch_and_parse_serp(self, keyword: str) -> Tuple[int, List[str]]:
+        """
+        Tek SERP isteğinden hem sonuç sayısını hem competitor domain'lerini çıkar
+        
+        Returns:
+            Tuple[int, List[str]]: (tahmini sonuç sayısı, competitor domain listesi)
+        """
+        
+        cache_key = ('serp', keyword)
+        cached = self._cache_get(cache_key, self.cache_ttl['serp'])
+        if cached is not None:
+            return cached
+        
+        html = await self._fetch_google_search(keyword)
+        if html is None:
+            return 0, []
+        
+        count = await self._parse_results_count(html)
+        competitors = self._parse_competitors(html)
+        if not competitors:
+            # Sessizce mock'a düşme: sayfa geldi ama markup tanınmadı (consent sayfası, yeni layout vb.)
+            self.logger.warning(f"No competitors parsed from SERP for '{keyword}' - falling back to mock competitors")
+        
+        if count or competitors:
+            self._cache_put(cache_key, (count, competitors))
+        
+        return count, competitors
+    
+    async def _parse_results_count(self, html: bytes) -> int:
+        """SERP HTML'inden "About 1,234,567 results" sayısını çıkar"""
+        # Hızlı yol: result-stats metnini ham byte'lardan regex ile al
+        match = _RESULT_STATS_RE.search(html)
+        if match:
+            text = match.group(1).decode('utf-8', errors='ignore')
+        elif SCRAPING_AVAILABLE:
+            # Fallback: parse'ı event loop dışında yap
+            soup = await asyncio.to_thread(BeautifulSoup, html, HTML_PARSER)
+            
+            # Sonuç sayısını bul - multiple selectors for reliability
+            result_stats = soup.find('div', {'id': 'result-stats'})
+            if not result_stats:
+                result_stats = soup.find('div', string=lambda text: text and 'results' in text.lower())
+            text = result_stats.text if result_stats else ''
+        else:
+            text = ''
+        
+        # "About 1,234,567 results" formatından sayıyı çıkar
+        numbers = _RESULT_COUNT_RE.findall(text)
+        if numbers:
+            try:
+                return int(numbers[0].replace(',', ''))
+            except ValueError:
+                pass
+        return 0
+    
+    def _parse_competitors(self, html: bytes) -> List[str]:
+        """SERP HTML'indeki sonuç anchor'larından domain listesi çıkar (Google'ın kendi linkleri hariç)"""
+        competitors = []
+        seen = set()
+        for link in _SERP_URL_RE.findall(html.decode('utf-8', errors='ignore')):
+            # Domain'i çıkar, clean domain (remove www. prefix)
+            domain = urlparse(unquote(link)).netloc.replace('www.', '')
+            if domain and 'google' not in domain and 'gstatic.' not in domain and domain not in seen:
+                seen.add(domain)
+                competitors.append(domain)
+        return competitors
+    
     async def get_search_results_count(self, keyword: str) -> int:
         """
         Google'da tahmini sonuç sayısını al
@@ -258,47 +518,10 @@ class FreeSEOToolsService:
             int: Tahmini sonuç sayısı
         """
         
-        if not SCRAPING_AVAILABLE:
-            return self._mock_search_count(keyword)
-        
         try:
-            # Google search URL
-            url = f"https://www.google.com/search"
-            params = {'q': keyword, 'hl': 'en'}
-            
-            headers = {
-                'User-Agent': self.user_agents[0],
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.5',
-                'Accept-Encoding': 'gzip, deflate',
-                'Connection': 'keep-alive',
-            }
-            
-            response = requests.get(url, params=params, headers=headers, timeout=10)
-            
-            if response.status_code == 200:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # Sonuç sayısını bul - multiple selectors for reliability
-                result_stats = soup.find('div', {'id': 'result-stats'})
-                if not result_stats:
-                    result_stats = soup.find('div', string=lambda text: text and 'results' in text.lower())
-                
-                if result_stats:
-                    text = result_stats.text
-                    # "About 1,234,567 results" formatından sayıyı çıkar
-                    import re
-                    numbers = re.findall(r'[\d,]+', text)
-                    if numbers:
-                        count_str = numbers[0].replace(',', '')
-                        try:
-                            return int(count_str)
-                        except ValueError:
-                            pass
-            
-            # Rate limiting
-            await asyncio.sleep(self.delays['scraping'])
-            
+            count, _ = await self._fetch_and_parse_serp(keyword)
+            if count:
+                return count
         except Exception as e:
             self.logger.error(f"Search count error: {str(e)}")
         
@@ -316,36 +539,39 @@ class FreeSEOToolsService:
             List[str]: Competitor domain listesi
         """
         
-        if not GOOGLESEARCH_AVAILABLE:
-            return self._mock_competitors(keyword)
-        
         competitors = []
         
         try:
-            # Google search ile URL'leri al
-            search_results = search(keyword, num_results=num_results, lang='en', safe='off')
-            
-            for url in search_results:
-                # Domain'i çıkar
-                from urllib.parse import urlparse
-                parsed = urlparse(url)
-                domain = parsed.netloc
-                
-                # Clean domain (remove www. prefix)
-                if domain:
-                    domain = domain.replace('www.', '')
-                    if domain not in competitors:
-                        competitors.append(domain)
-            
-            # Rate limiting
-            await asyncio.sleep(self.delays['search'])
-            
+            _, competitors = await self._fetch_and_parse_serp(keyword)
         except Exception as e:
             self.logger.error(f"SERP competitors error: {str(e)}")
-            competitors = self._mock_competitors(keyword)
         
         return competitors[:num_results] if competitors else self._mock_competitors(keyword)
     
+    async def get_serp_overview(self, keyword: str, num_results: int = 10) -> Tuple[int, List[str]]:
+        """
+        Sonuç sayısı ve competitor'ları tek SERP isteğinden al
+        
+        Args:
+            keyword: Arama terimi
+            num_results: Kaç competitor alınacak
+        
+        Returns:
+            Tuple[int, List[str]]: (tahmini sonuç sayısı, competitor domain listesi)
+        """
+        
+        count, competitors = 0, []
+        
+        try:
+            count, competitors = await self._fetch_and_parse_serp(keyword)
+        except Exception as e:
+            self.logger.error(f"SERP overview error: {str(e)}")
+        
+        return (
+            count or self._mock_search_count(keyword),
+            competitors[:num_results] if competitors else self._mock_competitors(keyword)
+        )
+    
     async def analyze_keyword(self, keyword: str) -> FreeKeywordData:
         """
         Tek bir keyword için tüm ücretsiz analizleri yap
@@ -370,12 +596,11 @@ class FreeSEOToolsService:
                 top_competitors=[]
             )
         
-        # Paralel olarak tüm verileri topla
+        # Paralel olarak tüm verileri topla - sonuç sayısı ve competitor'lar tek SERP isteğinden
         tasks = [
             self.get_google_trends([keyword]),
             self.get_google_autocomplete(keyword),
-            self.get_search_results_count(keyword),
-            self.get_serp_competitors(keyword)
+            self._fetch_and_parse_serp(keyword)
         ]
         
         try:
@@ -403,12 +628,10 @@ class FreeSEOToolsService:
             autocomplete = results[1]
         
         search_count = 0
-        if not isinstance(results[2], Exception):
-            search_count = results[2]
-        
         competitors = []
-        if not isinstance(results[3], Exception):
-            competitors = results[3]
+        if not isinstance(results[2], Exception):
+            search_count, competitors = results[2]
+            competitors = competitors[:10]
         
         return FreeKeywordData(
             keyword=keyword,
@@ -431,39 +654,49 @@ class FreeSEOToolsService:
             List[FreeKeywordData]: Analiz sonuçları
         """
         
-        results = []
-        
         # Clean and validate keywords
         clean_keywords = [k.strip() for k in keywords if k.strip()]
         
         if not clean_keywords:
             return []
         
-        # Batch process Google Trends (max 5 at a time)
-        if len(clean_keywords) <= 5:
-            trends_batch = await self.get_google_trends(clean_keywords)
-        else:
-            trends_batch = {}
-            for i in range(0, len(clean_keywords), 5):
-                batch = clean_keywords[i:i+5]
-                batch_trends = await self.get_google_trends(batch)
-                trends_batch.update(batch_trends)
-                if i + 5 < len(clean_keywords):
-                    await asyncio.sleep(1)  # Extra delay between batches
-        
-        # Process each keyword
-        for keyword in clean_keywords:
-            self.logger.info(f"Analyzing keyword: {keyword}")
-            
-            # Get individual data
-            autocomplete = await self.get_google_autocomplete(keyword)
-            search_count = await self.get_search_results_count(keyword)
-            competitors = await self.get_serp_competitors(keyword, 5)
-            
+        # Batch process Google Trends (max 5 at a time) - pacing is done by the trends queue
+        trends_batch = {}
+        for batch_trends in await asyncio.gather(*(
+            self.get_google_trends(clean_keywords[i:i+5])
+            for i in range(0, len(clean_keywords), 5)
+        )):
+            trends_batch.update(batch_trends)
+        
+        # Process keywords concurrently, bounded by the semaphore
+        async def _analyze_one(keyword: str):
+            async with self.keyword_semaphore:
+                self.logger.info(f"Analyzing keyword: {keyword}")
+                autocomplete, serp = await asyncio.gather(
+                    self.get_google_autocomplete(keyword),
+                    self._fetch_and_parse_serp(keyword),
+                    return_exceptions=True
+                )
+                
+                if isinstance(serp, Exception):
+                    self.logger.error(f"SERP error for '{keyword}': {serp}")
+                    serp = (0, [])
+                search_count, competitors = serp
+                
+                return (
+                    autocomplete if not isinstance(autocomplete, Exception) else self._mock_autocomplete(keyword),
+                    search_count or self._mock_search_count(keyword),
+                    competitors[:5] or self._mock_competitors(keyword)
+                )
+        
+        gathered = await asyncio.gather(*(_analyze_one(k) for k in clean_keywords))
+        
+        results = []
+        for keyword, (autocomplete, search_count, competitors) in zip(clean_keywords, gathered):
             # Get trends data from batch
             keyword_trends = trends_batch.get(keyword.lower(), {})
             
-            result = FreeKeywordData(
+            results.append(FreeKeywordData(
                 keyword=keyword,
                 trend_score=keyword_trends.get('trend_score', 50),
                 trend_data=keyword_trends.get('trend_data', []),
@@ -471,13 +704,7 @@ class FreeSEOToolsService:
                 suggestions=autocomplete,
                 search_results_count=search_count,
                 top_competitors=competitors
-            )
-            
-            results.append(result)
-            
-            # Rate limiting between keywords
-            if clean_keywords.index(keyword) < len(clean_keywords) - 1:
-                await asyncio.sleep(0.5)
+            ))
         
         return results
     
@@ -500,29 +727,16 @@ class FreeSEOToolsService:
         # Related queries ve suggestions topla
         keyword_data = await self.analyze_keyword(main_keyword)
         
-        # Long-tail keyword'ler için autocomplete kullan
-        all_suggestions = []
-        
-        # Ana keyword + modifier'lar
-        modifiers = ['how to', 'best', 'top', 'vs', 'review', 'guide', 'tutorial', 'tips', 'for beginners']
-        
-        # Batch process modifiers to avoid rate limiting
-        for modifier in modifiers:
-            modified_keyword = f"{modifier} {main_keyword}"
-            suggestions = await self.get_google_autocomplete(modified_keyword)
-            all_suggestions.extend(suggestions)
-            await asyncio.sleep(0.3)  # Small delay between requests
-        
-        # Question-based modifiers
-        question_modifiers = ['what is', 'why', 'when to use', 'where to buy']
-        for modifier in question_modifiers:
-            modified_keyword = f"{modifier} {main_keyword}"
-            suggestions = await self.get_google_autocomplete(modified_keyword)
-            all_suggestions.extend(suggestions)
-            await asyncio.sleep(0.3)
+        # Long-tail keyword'ler için autocomplete kullan - tüm modifier'lar paralel,
+        # hız sınırını autocomplete bucket'ı uygular
+        batches = await asyncio.gather(
+            *(self.get_google_autocomplete(f"{modifier} {main_keyword}") for modifier in _CONTENT_GAP_MODIFIERS),
+            return_exceptions=True
+        )
+        all_suggestions = [s for batch in batches if not isinstance(batch, Exception) for s in batch]
         
-        # Unique suggestions
-        unique_suggestions = list(set(all_suggestions))
+        # Unique suggestions - keep first-seen (most relevant) order
+        unique_suggestions = list(dict.fromkeys(all_suggestions))
         
         return {
             'main_keyword': main_keyword,
@@ -536,8 +750,6 @@ class FreeSEOToolsService:
     # Mock functions for fallback
     async def _mock_trends_data(self, keywords: List[str]) -> Dict[str, Any]:
         """Mock trends data"""
-        import random
-        
         trends_data = {}
         for keyword in keywords:
             base_score = random.randint(40, 90)
@@ -560,44 +772,25 @@ class FreeSEOToolsService:
     
     def _mock_autocomplete(self, keyword: str) -> List[str]:
         """Mock autocomplete suggestions"""
-        suggestions = [
-            f"{keyword} review",
-            f"{keyword} best",
-            f"{keyword} guide",
-            f"{keyword} how to",
-            f"{keyword} tips",
-            f"{keyword} tutorial",
-            f"{keyword} for beginners",
-            f"{keyword} 2024",
-            f"{keyword} vs competitors",
-            f"cheap {keyword}"
-        ]
-        return suggestions[:8]
+        return [f"{keyword} {suffix}" for suffix in _MOCK_AUTOCOMPLETE_SUFFIXES]
     
     def _mock_search_count(self, keyword: str) -> int:
         """Mock search result count"""
-        import random
         # More realistic numbers based on keyword length
         base = 1000000 if len(keyword.split()) > 2 else 5000000
         return random.randint(base // 10, base)
     
     def _mock_competitors(self, keyword: str) -> List[str]:
         """Mock competitor domains"""
-        return [
-            "example.com",
-            "bestreviews.com",
-            "topguide.org",
-            "expertadvice.net",
-            "prosandcons.com",
-            "buyersguide.org",
-            "techreview.com",
-            "comparison.net",
-            "ultimate-guide.com",
-            "trusted-source.org"
-        ][:5]
+        return list(_MOCK_COMPETITORS[:5])
 
 
 # Integration with existing SEO Tools
+def _competition_band(trend_score: int) -> str:
+    """Trend skorundan rekabet seviyesi"""
+    return 'high' if trend_score > 70 else 'medium' if trend_score > 40 else 'low'
+
+
 class HybridSEOService:
     """
     Hybrid SEO Service - Free + Paid tools kombine
@@ -609,6 +802,16 @@ class HybridSEOService:
         self.free_tools = FreeSEOToolsService()
         self.logger = logging.getLogger("HybridSEOService")
     
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+    
+    async def aclose(self):
+        """Alttaki free tools servisinin HTTP session'ını kapat"""
+        await self.free_tools.aclose()
+    
     async def get_keyword_data(self, keywords: List[str]) -> List[Dict[str, Any]]:
         """
         Keyword data topla - önce ücretsiz, sonra paid (varsa)
@@ -618,22 +821,21 @@ class HybridSEOService:
         free_data = await self.free_tools.analyze_multiple_keywords(keywords)
         
         # Format for compatibility
-        results = []
-        for data in free_data:
-            results.append({
+        return [
+            {
                 'keyword': data.keyword,
                 'metrics': {
                     'trend_score': data.trend_score,
                     'search_volume_estimate': data.search_results_count,
-                    'competition': 'high' if data.trend_score > 70 else 'medium' if data.trend_score > 40 else 'low'
+                    'competition': _competition_band(data.trend_score)
                 },
                 'suggestions': data.suggestions,
                 'related': data.related_queries,
                 'competitors': data.top_competitors,
                 'trend_data': data.trend_data
-            })
-        
-        return results
+            }
+            for data in free_data
+        ]
 
 
 # Test function
@@ -644,41 +846,44 @@ async def test_free_seo_tools():
     
     service = FreeSEOToolsService()
     
-    # Test 1: Google Trends
-    print("\n1. Testing Google Trends...")
-    trends = await service.get_google_trends(["python programming", "javascript"])
-    for keyword, data in trends.items():
-        print(f"  {keyword}: Score={data['trend_score']}, Related={len(data['related_queries'])}")
-    
-    # Test 2: Google Autocomplete
-    print("\n2. Testing Google Autocomplete...")
-    suggestions = await service.get_google_autocomplete("best gaming")
-    print(f"  Suggestions ({len(suggestions)}): {suggestions[:5]}")
-    
-    # Test 3: Search Results Count
-    print("\n3. Testing Search Results Count...")
-    count = await service.get_search_results_count("artificial intelligence")
-    print(f"  Estimated results: {count:,}")
-    
-    # Test 4: SERP Competitors
-    print("\n4. Testing SERP Competitors...")
-    competitors = await service.get_serp_competitors("best laptops 2024", 5)
-    print(f"  Top competitors: {competitors}")
-    
-    # Test 5: Full Keyword Analysis
-    print("\n5. Testing Full Keyword Analysis...")
-    analysis = await service.analyze_keyword("machine learning tutorial")
-    print(f"  Keyword: {analysis.keyword}")
-    print(f"  Trend Score: {analysis.trend_score}")
-    print(f"  Suggestions: {len(analysis.suggestions)}")
-    print(f"  Competitors: {len(analysis.top_competitors)}")
-    
-    # Test 6: Content Gap Analysis
-    print("\n6. Testing Content Gap Analysis...")
-    gaps = await service.find_content_gaps("web development")
-    print(f"  Content opportunities: {len(gaps['content_opportunities'])}")
-    print(f"  Total found: {gaps['total_opportunities_found']}")
-    print(f"  Sample opportunities: {gaps['content_opportunities'][:3]}")
+    try:
+        # Test 1: Google Trends
+        print("\n1. Testing Google Trends...")
+        trends = await service.get_google_trends(["python programming", "javascript"])
+        for keyword, data in trends.items():
+            print(f"  {keyword}: Score={data['trend_score']}, Related={len(data['related_queries'])}")
+        
+        # Test 2: Google Autocomplete
+        print("\n2. Testing Google Autocomplete...")
+        suggestions = await service.get_google_autocomplete("best gaming")
+        print(f"  Suggestions ({len(suggestions)}): {suggestions[:5]}")
+        
+        # Test 3: Search Results Count
+        print("\n3. Testing Search Results Count...")
+        count = await service.get_search_results_count("artificial intelligence")
+        print(f"  Estimated results: {count:,}")
+        
+        # Test 4: SERP Competitors
+        print("\n4. Testing SERP Competitors...")
+        competitors = await service.get_serp_competitors("best laptops 2024", 5)
+        print(f"  Top competitors: {competitors}")
+        
+        # Test 5: Full Keyword Analysis
+        print("\n5. Testing Full Keyword Analysis...")
+        analysis = await service.analyze_keyword("machine learning tutorial")
+        print(f"  Keyword: {analysis.keyword}")
+        print(f"  Trend Score: {analysis.trend_score}")
+        print(f"  Suggestions: {len(analysis.suggestions)}")
+        print(f"  Competitors: {len(analysis.top_competitors)}")
+        
+        # Test 6: Content Gap Analysis
+        print("\n6. Testing Content Gap Analysis...")
+        gaps = await service.find_content_gaps("web development")
+        print(f"  Content opportunities: {len(gaps['content_opportunities'])}")
+        print(f"  Total found: {gaps['total_opportunities_found']}")
+        print(f"  Sample opportunities: {gaps['content_opportunities'][:3]}")
+    finally:
+        await service.aclose()
     
     print("\n✅ Free SEO Tools test completed!")
 
@@ -687,13 +892,10 @@ if __name__ == "__main__":
     # Test için gerekli kütüphaneleri kontrol et
     print("Checking dependencies...")
     print(f"pytrends: {'✅' if PYTRENDS_AVAILABLE else '❌'}")
-    print(f"googlesearch: {'✅' if GOOGLESEARCH_AVAILABLE else '❌'}")
     print(f"beautifulsoup4: {'✅' if SCRAPING_AVAILABLE else '❌'}")
     
     if not PYTRENDS_AVAILABLE:
         print("\n📦 Install: pip install pytrends")
-    if not GOOGLESEARCH_AVAILABLE:
-        print("📦 Install: pip install googlesearch-python")
     if not SCRAPING_AVAILABLE:
         print("📦 Install: pip install beautifulsoup4 requests")
     
@@ -5,16 +5,379 @@ Handles all AI model interactions for the SEO blog generator
 
 import os
 import json
+import time
 import asyncio
+import bisect
+import hashlib
+import functools
+import importlib.util
 import logging
-from typing import Dict, List, Any, Optional
-from datetime import datetime, timedelta
+import sqlite3
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Dict, List, Any, Optional, Sequence, Tuple
+from datetime import datetime
 from dotenv import load_dotenv
-import google.generativeai as genai
-from google.generativeai.types import HarmCategory, HarmBlockThreshold
 load_dotenv()
 logger = logging.getLogger(__name__)
 
+# google.generativeai (gRPC + protobuf) is imported when the first GeminiService is
+# created; only check that it is installed so importers can still fall back to mocks
+if importlib.util.find_spec("google.generativeai") is None:
+    raise ImportError("google-generativeai is not installed")
+
+# Optional semantic prompt cache dependencies (sentence_transformers and faiss
+# are imported by the first cacheable call, in a worker thread)
+try:
+    import numpy as np
+    SEMANTIC_CACHE_AVAILABLE = importlib.util.find_spec("sentence_transformers") is not None
+except ImportError:
+    SEMANTIC_CACHE_AVAILABLE = False
+
+FAISS_AVAILABLE = importlib.util.find_spec("faiss") is not None
+
+# Optional fast JSON (prompt serialization and response parsing)
+try:
+    import orjson
+    _json_loads = orjson.loads
+    
+    def _dumps(obj: Any, sort_keys: bool = False) -> str:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option).decode()
+except ImportError:
+    _json_loads = json.loads
+    
+    def _dumps(obj: Any, sort_keys: bool = False) -> str:
+        return json.dumps(obj, indent=2, sort_keys=sort_keys)
+
+
+# Worker threads for embeddings and cache store IO, sized to the request budget; shared by
+# every GeminiService and never shut down by one, so closing a service can't break another
+_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix="gemini")
+
+
+class _SemanticPartition:
+    """Embeddings and responses cached under one set of generation parameters"""
+    
+    def __init__(self, dim: int, faiss: Any = None):
+        # Inner product over unit vectors == cosine similarity; numpy scan without faiss
+        self.index = faiss.IndexFlatIP(dim) if faiss is not None else None
+        self.embeddings = np.empty((0, dim), dtype=np.float32)
+        self.responses: List[str] = []
+        self.timestamps: List[float] = []  # insert order, so oldest first
+    
+    def append(self, vectors: "np.ndarray", responses: List[str], timestamps: List[float]):
+        if self.index is not None:
+            self.index.add(np.ascontiguousarray(vectors, dtype=np.float32))
+        else:
+            self.embeddings = np.vstack([self.embeddings, vectors])
+        self.responses.extend(responses)
+        self.timestamps.extend(timestamps)
+    
+    def drop_oldest(self, count: int):
+        if self.index is not None:
+            self.index.remove_ids(np.arange(count, dtype=np.int64))
+        else:
+            self.embeddings = self.embeddings[count:]
+        del self.responses[:count]
+        del self.timestamps[:count]
+
+
+class SemanticCache:
+    """
+    Embedding based prompt cache
+    Returns a stored response when a new prompt is a near-duplicate of a cached one
+    
+    Entries are partitioned by a key over the generation parameters and calling task;
+    a response is only ever returned to a call with the same key. Entries expire after
+    ttl seconds, and the oldest are evicted once maxsize entries are stored.
+    
+    Construction is cheap: the encoder (and faiss) are loaded by the first embed() call,
+    which runs in a worker thread.
+    """
+    
+    def __init__(self, model_name: str = 'all-MiniLM-L6-v2', threshold: float = 0.87, dim: int = 384,
+                 maxsize: int = 4096, ttl: float = 3600):
+        self.model_name = model_name
+        self.encoder = None
+        self.disabled = False
+        self._faiss = None
+        self._load_lock = threading.Lock()
+        self._pending_rows: List[tuple] = []  # persisted rows, indexed once faiss is resolved
+        self.threshold = threshold
+        self.dim = dim
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.partitions: Dict[str, _SemanticPartition] = {}
+        self._size = 0
+        
+        # Identical texts skip the encoder; bytes keep entries hashable and compact
+        self._embed_lru = functools.lru_cache(maxsize=2048)(self._raw_embed)
+    
+    def __len__(self) -> int:
+        return self._size + len(self._pending_rows)
+    
+    def _ensure_loaded(self) -> bool:
+        """Load the encoder and faiss on first use; False if the cache is unusable"""
+        if self.encoder is not None or self.disabled:
+            return not self.disabled
+        
+        with self._load_lock:
+            if self.encoder is None and not self.disabled:
+                try:
+                    from sentence_transformers import SentenceTransformer
+                    if FAISS_AVAILABLE:
+                        import faiss
+                        self._faiss = faiss
+                    encoder = SentenceTransformer(self.model_name)
+                except Exception as e:
+                    logger.warning(f"Semantic cache disabled: {str(e)}")
+                    self.disabled = True
+                    return False
+                
+                rows, self._pending_rows = self._pending_rows, []
+                self._ingest(rows)
+                self.encoder = encoder
+        return not self.disabled
+    
+    def _raw_embed(self, text: str) -> Optional[bytes]:
+        # The encoder truncates long inputs, so prompts differing only past the window
+        # would embed identically; those are left to the exact cache
+        if len(self.encoder.tokenizer(text, truncation=False)["input_ids"]) > self.encoder.max_seq_length:
+            return None
+        return self.encoder.encode(text, normalize_embeddings=True).astype(np.float32).tobytes()
+    
+    def embed(self, text: str) -> Optional["np.ndarray"]:
+        """Unit-length embedding of text, None if it is too long to embed faithfully"""
+        if not self._ensure_loaded():
+            return None
+        blob = self._embed_lru(text)
+        return None if blob is None else np.frombuffer(blob, dtype=np.float32)
+    
+    def lookup(self, key: str, embedding: "np.ndarray") -> Optional[str]:
+        """Most similar cached response under key, if it clears the similarity threshold"""
+        part = self.partitions.get(key)
+        if part is None:
+            return None
+        self._expire(part, time.time())
+        if not part.responses:
+            return None
+        
+        if part.index is not None:
+            sims, ids = part.index.search(embedding.reshape(1, self.dim), 1)
+            best, score = int(ids[0, 0]), float(sims[0, 0])
+        else:
+            sims = part.embeddings @ embedding
+            best = int(np.argmax(sims))
+            score = sims[best]
+        return part.responses[best] if score >= self.threshold else None
+    
+    def _partition(self, key: str) -> _SemanticPartition:
+        part = self.partitions.get(key)
+        if part is None:
+            part = self.partitions[key] = _SemanticPartition(self.dim, self._faiss)
+        return part
+    
+    def _expire(self, part: _SemanticPartition, now: float):
+        """Drop the partition's entries older than ttl"""
+        count = bisect.bisect_left(part.timestamps, now - self.ttl)
+        if count:
+            part.drop_oldest(count)
+            self._size -= count
+    
+    def _evict(self, now: float):
+        """Expire old entries, then drop the oldest entries across partitions down to maxsize"""
+        for part in self.partitions.values():
+            self._expire(part, now)
+        while self._size > self.maxsize:
+            oldest = min((part for part in self.partitions.values() if part.timestamps),
+                         key=lambda part: part.timestamps[0])
+            oldest.drop_oldest(1)
+            self._size -= 1
+    
+    def add(self, key: str, embedding: "np.ndarray", response: str, inserted_at: float):
+        """Store a response under its partition key and prompt embedding"""
+        self._partition(key).append(embedding.reshape(1, self.dim), [response], [inserted_at])
+        self._size += 1
+        self._evict(inserted_at)
+    
+    def load(self, rows: List[tuple]):
+        """Bulk load (partition key, embedding bytes, response, timestamp) rows persisted by a previous run"""
+        if self.encoder is None:
+            self._pending_rows.extend(rows)
+        else:
+            self._ingest(rows)
+    
+    def _ingest(self, rows: List[tuple]):
+        grouped: Dict[str, Tuple[list, list, list]] = {}
+        for key, blob, response, inserted_at in sorted(rows, key=lambda row: row[3]):
+            vector = np.frombuffer(blob, dtype=np.float32)
+            if vector.shape[0] == self.dim:  # skip rows written by a different encoder
+                vectors, responses, timestamps = grouped.setdefault(key, ([], [], []))
+                vectors.append(vector)
+                responses.append(response)
+                timestamps.append(inserted_at)
+        
+        for key, (vectors, responses, timestamps) in grouped.items():
+            self._partition(key).append(np.stack(vectors), responses, timestamps)
+            self._size += len(responses)
+        self._evict(time.time())
+
+
+class CacheStore:
+    """
+    SQLite backing store for the exact and semantic prompt caches
+    Lets a fresh process start with the previous run's cache warm
+    """
+    
+    def __init__(self, path: str):
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self.conn:
+            self.conn.execute("CREATE TABLE IF NOT EXISTS exact(k TEXT PRIMARY KEY, v TEXT, ts REAL)")
+            self.conn.execute(
+                "CREATE TABLE IF NOT EXISTS semantic(id INTEGER PRIMARY KEY, part TEXT, emb BLOB, v TEXT, ts REAL)"
+            )
+    
+    def load_exact(self, since: float, limit: int) -> List[tuple]:
+        """Newest unexpired (key, response, timestamp) rows, oldest first"""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT k, v, ts FROM exact WHERE ts >= ? ORDER BY ts DESC LIMIT ?", (since, limit)
+            ).fetchall()
+        return rows[::-1]
+    
+    def load_semantic(self, since: float, limit: int) -> List[tuple]:
+        """Newest unexpired (partition key, embedding bytes, response, timestamp) rows, oldest first"""
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT part, emb, v, ts FROM semantic WHERE ts >= ? ORDER BY id DESC LIMIT ?", (since, limit)
+            ).fetchall()
+        return rows[::-1]
+    
+    def put_exact(self, key: str, response: str, ts: float):
+        try:
+            with self._lock, self.conn:
+                self.conn.execute("INSERT OR REPLACE INTO exact(k, v, ts) VALUES (?, ?, ?)", (key, response, ts))
+        except sqlite3.Error as e:
+            logger.warning(f"Cache store write failed: {str(e)}")
+    
+    def put_semantic(self, key: str, embedding: bytes, response: str, ts: float):
+        try:
+            with self._lock, self.conn:
+                self.conn.execute(
+                    "INSERT INTO semantic(part, emb, v, ts) VALUES (?, ?, ?, ?)", (key, embedding, response, ts)
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Cache store write failed: {str(e)}")
+    
+    def sweep(self, before: float, semantic_keep: int):
+        """Drop expired rows and all but the newest semantic_keep semantic rows"""
+        try:
+            with self._lock, self.conn:
+                self.conn.execute("DELETE FROM exact WHERE ts < ?", (before,))
+                self.conn.execute("DELETE FROM semantic WHERE ts < ?", (before,))
+                self.conn.execute(
+                    "DELETE FROM semantic WHERE id <= (SELECT id FROM semantic ORDER BY id DESC LIMIT 1 OFFSET ?)",
+                    (semantic_keep,)
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Cache store sweep failed: {str(e)}")
+    
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+
+class NonJSONResponseError(Exception):
+    """Streamed response was aborted because it does not start like JSON"""
+    
+    def __init__(self, partial_text: str):
+        super().__init__("Response is not JSON")
+        self.partial_text = partial_text
+
+
+# Static parts of the enhanced prompt
+_PROMPT_HEADER = """
+You are an expert AI agent specializing in SEO-optimized content creation for e-commerce and product promotion.
+
+Current task: """
+
+_PROMPT_GUIDELINES = """
+Guidelines:
+- Focus on e-commerce and product promotion content
+- Prioritize SEO best practices and user experience
+- Ensure content is engaging, trustworthy, and conversion-focused
+- Use data-driven insights when available
+- Follow Google's E-A-T (Expertise, Authoritativeness, Trustworthiness) guidelines
+- Optimize for both search engines and human readers
+
+Please provide detailed, actionable, and high-quality output.
+"""
+
+
+# Reasoning steps per agent (tuples so the formatted list can be memoized)
+_MARKET_RESEARCH_STEPS = (
+    "Analyze target audience characteristics",
+    "Research market size and trends",
+    "Identify key competitors",
+    "Find content gaps and opportunities",
+    "Determine optimal sales angles",
+)
+
+_KEYWORD_ANALYSIS_STEPS = (
+    "Analyze seed keywords for expansion opportunities",
+    "Research commercial intent and search behavior",
+    "Identify long-tail and LSI keyword variations",
+    "Evaluate competition levels and ranking difficulty",
+    "Prioritize keywords by value and fit",
+)
+
+_CONTENT_STRUCTURE_STEPS = (
+    "Analyze target keywords for content themes",
+    "Structure content for user journey and conversions",
+    "Plan heading hierarchy for SEO and readability",
+    "Determine optimal CTA and image placement",
+    "Create FAQ section addressing user concerns",
+)
+
+_CONTENT_WRITING_STEPS = (
+    "Analyze content structure and requirements",
+    "Plan content flow for engagement and conversions",
+    "Write compelling introduction with hook",
+    "Develop main content sections with expertise",
+    "Create strong conclusions with clear CTAs",
+    "Add FAQ section addressing user concerns",
+)
+
+
+_FULL_PIPELINE_KEYS = ("market_research", "keywords", "structure", "content")
+
+
+@functools.lru_cache(maxsize=32)
+def _format_steps(steps: Tuple[str, ...]) -> str:
+    """Numbered reasoning step list for the chain of thought prompt"""
+    return "\n".join(f"{i+1}. {step}" for i, step in enumerate(steps))
+
+
+@functools.lru_cache(maxsize=256)
+def _enhanced_prompt_cached(prompt: str, context_json: str) -> str:
+    """Assemble the enhanced prompt; memoized on (prompt, serialized context)"""
+    context_block = f"\nAvailable context:\n{context_json}\n\n" if context_json else ""
+    return "".join((_PROMPT_HEADER, prompt, "\n\n", context_block, _PROMPT_GUIDELINES))
+
+
+def _strip_code_fence(text: str) -> str:
+    """Remove a surrounding ```json ... ``` fence from a model response"""
+    if text.startswith("```"):
+        text = text.split("\n", 1)[1] if "\n" in text else ""
+        if text.rstrip().endswith("```"):
+            text = text.rstrip()[:-3]
+    return text.strip()
+
 
 class GeminiService:
     """
@@ -27,7 +390,10 @@ class GeminiService:
         if not self.api_key:
             raise ValueError("GOOGLE_AI_API_KEY environment variable is required")
         
-        # Configure Gemini
+        # Configure Gemini (deferred import, see module top)
+        import google.generativeai as genai
+        from google.generativeai.types import HarmCategory, HarmBlockThreshold
+        self._genai = genai
         genai.configure(api_key=self.api_key)
         
         # Initialize models
@@ -50,29 +416,217 @@ class GeminiService:
             max_output_tokens=8192,
         )
         
-        # Rate limiting
-        self.last_request_time = None
-        self.min_request_interval = 4.0  # 15 requests per minute (free tier)
+        # Per-call generation configs, keyed by (temperature, max_tokens)
+        self._config_cache: Dict[Tuple[float, int], Any] = {}
+        
+        # Rate limiting - token bucket, 15 requests per minute (free tier) with bursts up to 15
+        self._capacity = 15.0
+        self._tokens = self._capacity
+        self._refill = 15 / 60.0  # tokens per second
+        self._last = time.monotonic()
+        self._tb_lock = asyncio.Lock()
+        
+        # Cache store writes still running on the shared executor
+        self._pending_writes: set = set()
+        
+        # Response caches - only used for low temperature (deterministic) calls
+        self.cache_max_temperature = 0.3
+        
+        # Upper bound for a streamed JSON generation
+        self.stream_timeout = float(os.getenv('GEMINI_STREAM_TIMEOUT', '120'))
+        
+        # L1: exact prompt match, key -> (response, insert timestamp)
+        self._exact_cache: OrderedDict = OrderedDict()
+        self.exact_cache_maxsize = 1024
+        self.exact_cache_ttl = 3600
+        
+        # L2: semantic (near-duplicate) prompt match - opt-in, and only for calls that pass cache_task
+        self.semantic_cache = None
+        self.semantic_cache_maxsize = 4096
+        if SEMANTIC_CACHE_AVAILABLE and os.getenv('GEMINI_SEMANTIC_CACHE', 'false').lower() == 'true':
+            try:
+                self.semantic_cache = SemanticCache(maxsize=self.semantic_cache_maxsize, ttl=self.exact_cache_ttl)
+            except Exception as e:
+                logger.warning(f"Semantic cache disabled: {str(e)}")
+        
+        # Disk persistence for both caches (GEMINI_CACHE_DB="" disables it)
+        self.cache_store = None
+        self.cache_sweep_interval = 300
+        self._sweep_task: Optional[asyncio.Task] = None
+        cache_db = os.getenv('GEMINI_CACHE_DB', '.gemini_cache.db')
+        if cache_db:
+            try:
+                self.cache_store = CacheStore(cache_db)
+                self._load_persisted_caches()
+            except sqlite3.Error as e:
+                logger.warning(f"Persistent cache disabled: {str(e)}")
+                self.cache_store = None
+        
+        # Opt-in: load the semantic cache encoder in the background instead of on the
+        # first cacheable request (also available as an explicit `await warmup()`)
+        self._warmup_task: Optional[asyncio.Task] = None
+        if os.getenv('GEMINI_WARMUP', 'false').lower() == 'true':
+            try:
+                self._warmup_task = asyncio.get_running_loop().create_task(self.warmup())
+            except RuntimeError:
+                pass  # no running loop (sync construction) - first request warms up instead
         
         logger.info(f"GeminiService initialized with model: {self.model_name}")
 
     async def _rate_limit(self):
-        """Implement rate limiting for Gemini API free tier"""
-        if self.last_request_time:
-            elapsed = (datetime.now() - self.last_request_time).total_seconds()
-            if elapsed < self.min_request_interval:
-                sleep_time = self.min_request_interval - elapsed
-                logger.info(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
-                await asyncio.sleep(sleep_time)
+        """Implement rate limiting for Gemini API free tier (token bucket)"""
+        while True:
+            async with self._tb_lock:
+                now = time.monotonic()
+                self._tokens = min(self._capacity, self._tokens + (now - self._last) * self._refill)
+                self._last = now
+                
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                
+                sleep_time = (1 - self._tokens) / self._refill
+            
+            # Sleep outside the lock, then re-check the bucket
+            logger.info(f"Rate limiting: sleeping for {sleep_time:.2f} seconds")
+            await asyncio.sleep(sleep_time)
+
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+    
+    async def aclose(self):
+        """Stop the cache sweep, then close without blocking the event loop"""
+        if self._warmup_task and not self._warmup_task.done():
+            self._warmup_task.cancel()
+        self._warmup_task = None
+        if self._sweep_task and not self._sweep_task.done():
+            self._sweep_task.cancel()
+        self._sweep_task = None
+        await asyncio.to_thread(self.close)
+    
+    def close(self):
+        """Wait for pending cache writes, then release the cache store"""
+        wait(list(self._pending_writes))
+        if self.cache_store:
+            self.cache_store.close()
+            self.cache_store = None
+    
+    async def warmup(self):
+        """
+        Load the semantic cache encoder ahead of real traffic
+        
+        Makes no Gemini request, so it costs neither quota nor a rate limit token.
+        """
+        if self.semantic_cache is None:
+            return
+        try:
+            await asyncio.get_running_loop().run_in_executor(_EXECUTOR, self.semantic_cache.embed, "warmup")
+            logger.debug("GeminiService warmup completed")
+        except Exception as e:
+            logger.debug(f"GeminiService warmup failed: {str(e)}")
+    
+    def _load_persisted_caches(self):
+        """Warm the in-memory caches from the SQLite store"""
+        since = time.time() - self.exact_cache_ttl
+        for key, response, inserted_at in self.cache_store.load_exact(since, self.exact_cache_maxsize):
+            self._exact_cache[key] = (response, inserted_at)
+        
+        if self.semantic_cache is not None:
+            self.semantic_cache.load(self.cache_store.load_semantic(since, self.semantic_cache_maxsize))
+        
+        logger.info(
+            f"Loaded {len(self._exact_cache)} exact and "
+            f"{len(self.semantic_cache) if self.semantic_cache is not None else 0} semantic cache entries"
+        )
+    
+    def _persist(self, fn, *args):
+        """Run a cache store write off the event loop without waiting for it"""
+        future = _EXECUTOR.submit(fn, *args)
+        self._pending_writes.add(future)
+        future.add_done_callback(self._write_done)
+        self._ensure_sweeper()
+    
+    def _write_done(self, future: Future):
+        """Forget a finished cache store write and log it if it failed"""
+        self._pending_writes.discard(future)
+        if not future.cancelled() and future.exception() is not None:
+            logger.warning(f"Cache store write failed: {future.exception()!r}")
+    
+    def _ensure_sweeper(self):
+        """Start the periodic cache store TTL sweep on first use"""
+        if self._sweep_task is None or self._sweep_task.done():
+            self._sweep_task = asyncio.create_task(self._sweep_loop())
+    
+    async def _sweep_loop(self):
+        while self.cache_store:
+            await asyncio.sleep(self.cache_sweep_interval)
+            if not self.cache_store:
+                return
+            await asyncio.get_running_loop().run_in_executor(
+                _EXECUTOR,
+                self.cache_store.sweep,
+                time.time() - self.exact_cache_ttl,
+                self.semantic_cache_maxsize
+            )
+
+    def _generation_config(self, temperature: float, max_tokens: int) -> Any:
+        """GenerationConfig for these parameters, built once per distinct pair"""
+        key = (temperature, max_tokens)
+        config = self._config_cache.get(key)
+        if config is None:
+            config = self._genai.types.GenerationConfig(
+                temperature=temperature,
+                max_output_tokens=max_tokens,
+                top_p=0.8,
+                top_k=40,
+            )
+            self._config_cache[key] = config
+        return config
+
+    def _exact_cache_key(self, enhanced_prompt: str, temperature: float, max_tokens: int) -> str:
+        """SHA256 key over everything that determines the response"""
+        payload = json.dumps(
+            {"m": self.model_name, "p": enhanced_prompt, "t": temperature, "n": max_tokens},
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+    
+    def _exact_cache_get(self, key: str) -> Optional[str]:
+        """Cached response for key, None if missing or expired"""
+        entry = self._exact_cache.get(key)
+        if entry is None:
+            return None
+        
+        response, inserted_at = entry
+        if time.time() - inserted_at >= self.exact_cache_ttl:
+            del self._exact_cache[key]
+            return None
+        
+        self._exact_cache.move_to_end(key)
+        return response
+    
+    def _exact_cache_put(self, key: str, response: str):
+        """Store response, evicting the least recently used entry when full"""
+        now = time.time()
+        self._exact_cache[key] = (response, now)
+        self._exact_cache.move_to_end(key)
+        if len(self._exact_cache) > self.exact_cache_maxsize:
+            self._exact_cache.popitem(last=False)
         
-        self.last_request_time = datetime.now()
+        if self.cache_store:
+            self._persist(self.cache_store.put_exact, key, response, now)
 
     async def generate_content(
         self, 
         prompt: str, 
         context: Optional[Dict[str, Any]] = None,
         temperature: float = 0.7,
-        max_tokens: int = 4096
+        max_tokens: int = 4096,
+        json_mode: bool = False,
+        cache_task: Optional[str] = None
     ) -> str:
         """
         Generate content using Gemini with context awareness
@@ -82,49 +636,143 @@ class GeminiService:
             context: Additional context data (keywords, market research, etc.)
             temperature: Creativity level (0.0-1.0)
             max_tokens: Maximum response length
+            json_mode: Stream the response and abort early if it is not JSON
+            cache_task: Name of the calling task; enables the semantic cache for this
+                call, with hits limited to the same task and generation parameters
             
         Returns:
             Generated content as string
+            
+        Raises:
+            NonJSONResponseError: json_mode response did not start with JSON
         """
-        await self._rate_limit()
-        
         try:
             # Build enhanced prompt with context
             enhanced_prompt = self._build_enhanced_prompt(prompt, context)
             
-            # Configure generation for this request
-            config = genai.types.GenerationConfig(
-                temperature=temperature,
-                max_output_tokens=max_tokens,
-                top_p=0.8,
-                top_k=40,
-            )
+            use_cache = temperature <= self.cache_max_temperature
             
-            # Generate content
-            response = await asyncio.to_thread(
-                self.model.generate_content,
-                enhanced_prompt,
-                generation_config=config,
-                safety_settings=self.safety_settings
-            )
+            # Exact cache lookup (creative calls bypass the caches)
+            cache_key = None
+            if use_cache:
+                cache_key = self._exact_cache_key(enhanced_prompt, temperature, max_tokens)
+                cached = self._exact_cache_get(cache_key)
+                if cached is not None:
+                    logger.info("Exact cache hit")
+                    return cached
+            
+            # Semantic cache lookup, partitioned by everything besides the prompt that shapes the response
+            embedding = None
+            if self.semantic_cache is not None and use_cache and cache_task:
+                semantic_key = json.dumps([self.model_name, temperature, max_tokens, json_mode, cache_task])
+                embedding = await asyncio.get_running_loop().run_in_executor(
+                    _EXECUTOR, self.semantic_cache.embed, enhanced_prompt
+                )
+                cached = self.semantic_cache.lookup(semantic_key, embedding) if embedding is not None else None
+                if cached is not None:
+                    logger.info("Semantic cache hit")
+                    return cached
             
-            if response.candidates and response.candidates[0].content:
-                content = response.candidates[0].content.parts[0].text
-                logger.info(f"Generated content: {len(content)} characters")
-                return content.strip()
+            await self._rate_limit()
+            
+            # Generation config for this request (reused per (temperature, max_tokens))
+            config = self._generation_config(temperature, max_tokens)
+            
+            if json_mode:
+                content = await self._generate_json_stream(enhanced_prompt, config)
             else:
-                logger.error("No content generated or content blocked by safety filters")
-                return ""
+                # Generate content (native async client, no worker thread)
+                response = await self.model.generate_content_async(
+                    enhanced_prompt,
+                    generation_config=config,
+                    safety_settings=self.safety_settings
+                )
                 
+                if not (response.candidates and response.candidates[0].content):
+                    logger.error("No content generated or content blocked by safety filters")
+                    return ""
+                content = response.candidates[0].content.parts[0].text.strip()
+            
+            logger.info(f"Generated content: {len(content)} characters")
+            
+            if cache_key is not None and content:
+                self._exact_cache_put(cache_key, content)
+            if embedding is not None and content:
+                now = time.time()
+                self.semantic_cache.add(semantic_key, embedding, content, now)
+                if self.cache_store:
+                    self._persist(self.cache_store.put_semantic, semantic_key, embedding.tobytes(), content, now)
+            return content
+                
+        except NonJSONResponseError:
+            raise
         except Exception as e:
             logger.error(f"Error generating content: {str(e)}")
             raise
 
+    async def _generate_json_stream(self, enhanced_prompt: str, config: Any) -> str:
+        """
+        Stream a response expected to be JSON
+        
+        Stops as soon as the first non-whitespace output shows it is not JSON
+        (a leading code fence is allowed), instead of waiting for the full generation.
+        """
+        chunks: List[str] = []
+        checked = False
+        
+        async with asyncio.timeout(self.stream_timeout):
+            response = await self.model.generate_content_async(
+                enhanced_prompt,
+                generation_config=config,
+                safety_settings=self.safety_settings,
+                stream=True
+            )
+            
+            async for chunk in response:
+                if not chunk.parts:
+                    continue
+                chunks.append(chunk.text)
+                
+                if not checked:
+                    head = "".join(chunks).lstrip()
+                    if head:
+                        checked = True
+                        if head[0] not in "{`":
+                            logger.warning("Streamed response is not JSON - aborting generation")
+                            raise NonJSONResponseError("".join(chunks).strip())
+        
+        return "".join(chunks).strip()
+
+    async def batch_generate(
+        self,
+        prompts: List[str],
+        max_in_flight: int = 8,
+        **kwargs
+    ) -> List[Any]:
+        """
+        Generate content for many prompts with at most max_in_flight requests running
+        
+        Args:
+            prompts: Prompts to generate content for
+            max_in_flight: Concurrency limit
+            **kwargs: Passed through to generate_content
+            
+        Returns:
+            Results in prompt order; failed prompts return their exception
+        """
+        semaphore = asyncio.Semaphore(max_in_flight)
+        
+        async def _one(prompt: str) -> str:
+            async with semaphore:
+                return await self.generate_content(prompt, **kwargs)
+        
+        return await asyncio.gather(*(_one(p) for p in prompts), return_exceptions=True)
+
     async def chain_of_thought_reasoning(
         self, 
         task: str, 
         context: Dict[str, Any],
-        reasoning_steps: List[str]
+        reasoning_steps: Sequence[str]
     ) -> Dict[str, Any]:
         """
         Implement chain of thought reasoning for complex tasks
@@ -137,16 +785,14 @@ class GeminiService:
         Returns:
             Structured reasoning result with steps and final answer
         """
-        await self._rate_limit()
-        
         reasoning_prompt = f"""
 You are an expert AI agent working on: {task}
 
 Context available:
-{json.dumps(context, indent=2)}
+{_dumps(context)}
 
 Please follow this chain of thought reasoning process:
-{chr(10).join(f"{i+1}. {step}" for i, step in enumerate(reasoning_steps))}
+{_format_steps(tuple(reasoning_steps))}
 
 For each step, provide:
 1. Your analysis
@@ -173,19 +819,35 @@ Format your response as JSON with this structure:
 """
         
         try:
+            # Context is already serialized into reasoning_prompt; don't append it twice
             response = await self.generate_content(
                 reasoning_prompt, 
-                context,
+                None,
                 temperature=0.3,  # Lower temperature for reasoning
-                max_tokens=6000
+                max_tokens=6000,
+                json_mode=True,
+                cache_task=task
             )
             
             # Parse JSON response
-            reasoning_result = json.loads(response)
+            reasoning_result = _json_loads(_strip_code_fence(response))
             logger.info(f"Chain of thought completed with {len(reasoning_result.get('reasoning_steps', []))} steps")
             return reasoning_result
             
+        except NonJSONResponseError as e:
+            logger.error("Chain of thought response is not JSON")
+            return {
+                "reasoning_steps": [],
+                "final_conclusion": e.partial_text,
+                "confidence_score": 0.5,
+                "recommendations": []
+            }
         except json.JSONDecodeError:
+            repaired = await self._repair_json(response)
+            if repaired is not None:
+                logger.info("Chain of thought response repaired to valid JSON")
+                return repaired
+            
             logger.error("Failed to parse chain of thought response as JSON")
             return {
                 "reasoning_steps": [],
@@ -197,6 +859,28 @@ Format your response as JSON with this structure:
             logger.error(f"Error in chain of thought reasoning: {str(e)}")
             raise
 
+    async def _repair_json(self, text: str) -> Optional[Dict[str, Any]]:
+        """
+        Ask the model to convert a malformed JSON response into valid JSON
+        
+        Much cheaper than re-running the reasoning; returns None if the repair also fails.
+        Repair prompts differ only in the payload, so they never use the semantic cache.
+        """
+        try:
+            repaired = await self.generate_content(
+                f"Return ONLY valid JSON equivalent to:\n{text}\nNo prose.",
+                temperature=0.0,
+                max_tokens=min(6000, max(512, len(text) // 2)),
+                json_mode=True
+            )
+            result = _json_loads(_strip_code_fence(repaired))
+            return result if isinstance(result, dict) else None
+        except (NonJSONResponseError, json.JSONDecodeError):
+            return None
+        except Exception as e:
+            logger.warning(f"JSON repair failed: {str(e)}")
+            return None
+
     async def analyze_market_research(self, niche: str, target_audience: str) -> Dict[str, Any]:
         """Market Research Agent functionality"""
         prompt = f"""
@@ -216,13 +900,7 @@ Return as JSON with detailed analysis.
         
         context = {"niche": niche, "target_audience": target_audience}
         
-        reasoning_steps = [
-            "Analyze target audience characteristics",
-            "Research market size and trends",
-            "Identify key competitors",
-            "Find content gaps and opportunities",
-            "Determine optimal sales angles"
-        ]
+        reasoning_steps = _MARKET_RESEARCH_STEPS
         
         return await self.chain_of_thought_reasoning(
             f"Market research for {niche}",
@@ -258,13 +936,7 @@ Return as JSON with structured keyword data.
             "seed_keywords": seed_keywords
         }
         
-        reasoning_steps = [
-            "Analyze seed keywords for expansion opportunities",
-            "Research commercial intent and search behavior",
-            "Identify long-tail and LSI keyword variations",
-            "Evaluate competition levels and ranking difficulty",
-            "Prioritize keywords by value and fit"
-        ]
+        reasoning_steps = _KEYWORD_ANALYSIS_STEPS
         
         return await self.chain_of_thought_reasoning(
             f"Keyword analysis for {niche}",
@@ -272,6 +944,23 @@ Return as JSON with structured keyword data.
             reasoning_steps
         )
 
+    async def run_agents_parallel(
+        self,
+        niche: str,
+        target_audience: str,
+        seed_keywords: List[str]
+    ) -> List[Dict[str, Any]]:
+        """
+        Run the independent market research and keyword analysis steps concurrently
+        
+        Returns:
+            [market_research, keyword_analysis]
+        """
+        return await asyncio.gather(
+            self.analyze_market_research(niche, target_audience),
+            self.analyze_keywords(niche, seed_keywords)
+        )
+
     async def create_content_structure(
         self, 
         target_keywords: List[str], 
@@ -283,7 +972,7 @@ Return as JSON with structured keyword data.
 Create a comprehensive article structure for target keywords: {', '.join(target_keywords)}
 
 Based on market research insights:
-{json.dumps(market_research, indent=2)}
+{_dumps(market_research)}
 
 Target word count: {word_count_target} words
 
@@ -309,13 +998,7 @@ Return as JSON with complete structure.
             "word_count_target": word_count_target
         }
         
-        reasoning_steps = [
-            "Analyze target keywords for content themes",
-            "Structure content for user journey and conversions",
-            "Plan heading hierarchy for SEO and readability",
-            "Determine optimal CTA and image placement",
-            "Create FAQ section addressing user concerns"
-        ]
+        reasoning_steps = _CONTENT_STRUCTURE_STEPS
         
         return await self.chain_of_thought_reasoning(
             f"Content structure for {', '.join(target_keywords)}",
@@ -333,10 +1016,10 @@ Return as JSON with complete structure.
         """Content Writer Agent functionality"""
         prompt = f"""
 Write a comprehensive, SEO-optimized article based on this structure:
-{json.dumps(content_structure, indent=2)}
+{_dumps(content_structure)}
 
 Target keywords: {', '.join(target_keywords)}
-Market research: {json.dumps(market_research, indent=2)}
+Market research: {_dumps(market_research)}
 Tone: {tone}
 
 Requirements:
@@ -370,14 +1053,7 @@ Return as JSON with:
             "tone": tone
         }
         
-        reasoning_steps = [
-            "Analyze content structure and requirements",
-            "Plan content flow for engagement and conversions",
-            "Write compelling introduction with hook",
-            "Develop main content sections with expertise",
-            "Create strong conclusions with clear CTAs",
-            "Add FAQ section addressing user concerns"
-        ]
+        reasoning_steps = _CONTENT_WRITING_STEPS
         
         return await self.chain_of_thought_reasoning(
             f"Content writing for {', '.join(target_keywords)}",
@@ -385,35 +1061,77 @@ Return as JSON with:
             reasoning_steps
         )
 
-    def _build_enhanced_prompt(self, prompt: str, context: Optional[Dict[str, Any]] = None) -> str:
-        """Build enhanced prompt with context and instructions"""
-        enhanced_prompt = f"""
-You are an expert AI agent specializing in SEO-optimized content creation for e-commerce and product promotion.
+    async def full_pipeline(
+        self,
+        niche: str,
+        target_audience: str,
+        seed_keywords: List[str],
+        word_count_target: int = 2000
+    ) -> Dict[str, Any]:
+        """
+        Market research, keywords, structure and article in a single Gemini call
+        
+        Saves three round-trips (and rate limit tokens) over calling the agent
+        methods one by one. Falls back to the per-agent methods if the combined
+        response can't be parsed.
+        
+        Returns:
+            Dict with market_research, keywords, structure and content keys
+        """
+        prompt = f"""
+Plan and write an SEO-optimized article for the {niche} niche targeting {target_audience}.
+Seed keywords: {', '.join(seed_keywords)}
+Target word count: {word_count_target} words
 
-Current task: {prompt}
+Work through these stages in order, using the output of each earlier stage as context for the next:
+1. market_research - audience, market trends, competitors, content gaps, pain points, sales angles
+2. keywords - primary, long-tail, LSI, commercial intent and question keywords with
+   search volume, competition and commercial intent estimates (high/medium/low)
+3. structure - title variations, meta description (155 characters max), H1-H4 heading
+   structure with word count distribution, CTA and image placement, 2 FAQ questions
+4. content - the complete article in markdown following the structure, as an object with
+   full_content, meta_description, title, word_count, keyword_density, readability_score
 
+Return ONLY a JSON object with the keys "market_research", "keywords", "structure" and "content".
 """
         
-        if context:
-            enhanced_prompt += f"""
-Available context:
-{json.dumps(context, indent=2)}
-
-"""
+        try:
+            response = await self.generate_content(
+                prompt,
+                temperature=0.3,
+                max_tokens=8192,
+                json_mode=True
+            )
+            try:
+                result = _json_loads(_strip_code_fence(response))
+            except json.JSONDecodeError:
+                result = await self._repair_json(response)
+            
+            if isinstance(result, dict) and all(key in result for key in _FULL_PIPELINE_KEYS):
+                return result
+            logger.warning("Combined pipeline response incomplete - running agents separately")
+        except NonJSONResponseError:
+            logger.warning("Combined pipeline response is not JSON - running agents separately")
         
-        enhanced_prompt += """
-Guidelines:
-- Focus on e-commerce and product promotion content
-- Prioritize SEO best practices and user experience
-- Ensure content is engaging, trustworthy, and conversion-focused
-- Use data-driven insights when available
-- Follow Google's E-A-T (Expertise, Authoritativeness, Trustworthiness) guidelines
-- Optimize for both search engines and human readers
+        market_research, keywords = await self.run_agents_parallel(niche, target_audience, seed_keywords)
+        structure = await self.create_content_structure(seed_keywords, market_research, word_count_target)
+        content = await self.write_content(structure, seed_keywords, market_research)
+        return {
+            "market_research": market_research,
+            "keywords": keywords,
+            "structure": structure,
+            "content": content
+        }
 
-Please provide detailed, actionable, and high-quality output.
-"""
+    def _build_enhanced_prompt(self, prompt: str, context: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Build enhanced prompt with context and instructions
         
-        return enhanced_prompt
+        Context is serialized in full; data already embedded in prompt (for example
+        large research dicts) should not be passed again as context.
+        """
+        context_json = _dumps(context, sort_keys=True) if context else ""
+        return _enhanced_prompt_cached(prompt, context_json)
 
     async def health_check(self) -> Dict[str, Any]:
         """Check if Gemini service is working properly"""
@@ -460,18 +1178,13 @@ if __name__ == "__main__":
         health = await service.health_check()
         print("Health check:", health)
         
-        # Test market research
-        market_research = await service.analyze_market_research(
-            niche="wireless earbuds",
-            target_audience="fitness enthusiasts"
-        )
-        print("Market research completed")
-        
-        # Test keyword analysis
-        keywords = await service.analyze_keywords(
+        # Test market research + keyword analysis (independent, run concurrently)
+        market_research, keywords = await service.run_agents_parallel(
             niche="wireless earbuds",
+            target_audience="fitness enthusiasts",
             seed_keywords=["wireless earbuds", "bluetooth headphones", "sports earbuds"]
         )
+        print("Market research completed")
         print("Keyword analysis completed")
     
     # Run tests
@@ -11,18 +11,68 @@ Bu service SEO araçları ve API'lerini yönetir:
 
 import asyncio
 import aiohttp
+import functools
 import logging
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
-from datetime import datetime
+from typing import Dict, List, Any, Optional, Tuple, Callable, Awaitable
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, replace
 import json
 import os
+import re
+import time
+from itertools import islice
 from urllib.parse import quote_plus
 from dotenv import load_dotenv
 
+from tenacity import (
+    AsyncRetrying, RetryCallState, before_sleep_log, retry_if_exception_type,
+    stop_after_attempt, wait_exponential_jitter
+)
+
+from utils.rate_limiter import AsyncTokenBucket
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 # .env dosyasını yükle
 load_dotenv()
 
+# Cümle sonu: boşluk veya metin sonundan önce gelen . ! ? dizisi
+_SENTENCE_END_RE = re.compile(r"[.!?]+(?=\s|$)")
+
+# Ortalama cümle uzunluğu üst sınırı -> readability skoru
+_READABILITY_BANDS = ((15, 90), (20, 80), (25, 70))
+
+# Mock keyword research varyasyonları
+_MOCK_KEYWORD_TEMPLATES = (
+    "best {0}",
+    "{0} review",
+    "{0} guide",
+    "how to choose {0}",
+    "{0} comparison",
+    "top {0}",
+    "{0} tips",
+    "{0} for beginners"
+)
+
+
+@functools.lru_cache(maxsize=128)
+def _keyword_pattern(keywords: Tuple[str, ...]) -> "re.Pattern[str]":
+    """
+    Tüm keyword'leri tek geçişte bulan regex
+    
+    Her keyword kendi lookahead grubunda denenir: aynı yerde başlayan keyword'lerin
+    hepsi sayılır ("gaming mouse" içindeki "gaming" hem "gaming" hem "gaming mouse" için).
+    İlk lookahead sadece bir keyword'ün başladığı konumlarda eşleşme üretir.
+    """
+    bounded = [rf"{re.escape(keyword)}(?!\w)" for keyword in keywords]
+    groups = "".join(f"(?:(?=({pattern})))?" for pattern in bounded)
+    return re.compile(rf"(?<!\w)(?={'|'.join(bounded)}){groups}")
+
+
 # Import free SEO tools
 try:
     from services.free_seo_tools import FreeSEOToolsService, HybridSEOService
@@ -31,7 +81,27 @@ except ImportError:
     FREE_TOOLS_AVAILABLE = False
     print("⚠️ free_seo_tools.py not found in services/")
 
-@dataclass
+
+class SEOAPIError(Exception):
+    """SEO API isteği başarısız oldu (retry'lar tükendi veya retry edilemez hata)"""
+
+
+class RateLimitError(SEOAPIError):
+    """API 429 döndü - Retry-After header'ı (saniye) varsa taşır"""
+    
+    def __init__(self, retry_after: Optional[str] = None):
+        super().__init__(f"Rate limited (Retry-After: {retry_after})")
+        try:
+            self.retry_after = float(retry_after) if retry_after else None
+        except ValueError:  # HTTP-date formatı - backoff'a bırak
+            self.retry_after = None
+
+
+class TransientError(SEOAPIError):
+    """API geçici bir hata döndü (5xx)"""
+
+
+@dataclass(slots=True)
 class KeywordData:
     """Keyword bilgi yapısı"""
     keyword: str
@@ -54,7 +124,7 @@ class KeywordData:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class CompetitorData:
     """Competitor analiz yapısı"""
     domain: str
@@ -98,21 +168,17 @@ class SEOToolsService:
         else:
             self.logger.warning("SERPAPI_KEY not found in environment variables")
         
-        # Free tools integration
+        # Free tools integration (servisler ilk kullanımda oluşturulur)
         if FREE_TOOLS_AVAILABLE:
-            self.free_service = FreeSEOToolsService()
-            self.hybrid_service = HybridSEOService()
             self.logger.info("Free SEO Tools integrated successfully")
         else:
-            self.free_service = None
-            self.hybrid_service = None
             self.logger.warning("Free SEO Tools not available")
         
-        # Rate limiting
-        self.rate_limits = {
-            'semrush': {'calls': 0, 'reset_time': datetime.now()},
-            'ahrefs': {'calls': 0, 'reset_time': datetime.now()},
-            'serpapi': {'calls': 0, 'reset_time': datetime.now()}
+        # Rate limiting - provider başına token bucket (istek/saniye)
+        self._limiters = {
+            'semrush': AsyncTokenBucket(rate=10, capacity=10),
+            'ahrefs': AsyncTokenBucket(rate=5, capacity=5),
+            'serpapi': AsyncTokenBucket(rate=5, capacity=5)
         }
         
         # Mock mode for development
@@ -124,27 +190,185 @@ class SEOToolsService:
         if self.mock_mode and not self.use_free_tools:
             self.logger.warning("SEO Tools running in MOCK MODE - no real API keys found")
         
+        # Provider başına eşzamanlı istek limiti (429 önlemek için)
+        self._sem = {
+            'semrush': asyncio.Semaphore(10),
+            'ahrefs': asyncio.Semaphore(5),
+            'serpapi': asyncio.Semaphore(5)
+        }
+        
+        # Response cache - (provider, keyword, country/location) -> sonuç
+        # Hacim verileri yavaş değişir, SERP daha oynak
+        self.cache_ttl = {
+            'semrush': 12 * 3600,
+            'ahrefs': 12 * 3600,
+            'serpapi': 3600
+        }
+        self._cache: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
+        self._cache_max_size = 10000
+        
+        # Devam eden istekler - aynı key için eşzamanlı çağrılar tek isteği paylaşır
+        self._inflight: Dict[Tuple, asyncio.Future] = {}
+        
+        # 429/5xx/timeout için deneme sayısı ve Retry-After yoksa bekleme (1s'den 60s'ye)
+        self.max_retries = 6
+        self._backoff = wait_exponential_jitter(initial=1, max=60)
+        
+        # Paylaşılan HTTP session (ilk istekte oluşturulur)
+        self.session: Optional[aiohttp.ClientSession] = None
+        
         self.logger.info("SEO Tools Service initialized")
 
-    async def _make_api_request(self, url: str, params: Dict[str, Any] = None, 
-                               headers: Dict[str, str] = None) -> Dict[str, Any]:
-        """Generic API request handler"""
+    @functools.cached_property
+    def free_service(self) -> Optional["FreeSEOToolsService"]:
+        """Free SEO tools servisi, ilk erişimde oluşturulur"""
+        return FreeSEOToolsService() if FREE_TOOLS_AVAILABLE else None
+    
+    @functools.cached_property
+    def hybrid_service(self) -> Optional["HybridSEOService"]:
+        """Hybrid SEO servisi, ilk erişimde oluşturulur"""
+        return HybridSEOService() if FREE_TOOLS_AVAILABLE else None
+
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Paylaşılan HTTP session'ı al (keep-alive ile bağlantı tekrar kullanımı)"""
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=100, ttl_dns_cache=300, keepalive_timeout=60),
+                timeout=aiohttp.ClientTimeout(total=30)
+            )
+        return self.session
+    
+    async def aclose(self):
+        """HTTP session'ı ve free tools servislerini kapat"""
+        if self.session and not self.session.closed:
+            await self.session.close()
+        self.session = None
+        
+        # Sadece oluşturulmuş servisleri kapat (cached_property'yi tetiklemeden)
+        if self.__dict__.get('free_service'):
+            await self.free_service.aclose()
+        if self.__dict__.get('hybrid_service'):
+            await self.hybrid_service.aclose()
+
+    def _cache_get(self, key: Tuple, ttl: float) -> Any:
+        """Cache'ten değer al, süresi dolmuşsa None döndür"""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        
+        stored_at, value = entry
+        if time.monotonic() - stored_at >= ttl:
+            del self._cache[key]
+            return None
+        
+        self._cache.move_to_end(key)
+        return value
+    
+    def _cache_put(self, key: Tuple, value: Any):
+        """Cache'e değer yaz, limit aşılırsa en eskiyi at"""
+        self._cache[key] = (time.monotonic(), value)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._cache_max_size:
+            self._cache.popitem(last=False)
+    
+    def cache_clear(self):
+        """Response cache'i temizle"""
+        self._cache.clear()
+    
+    async def _single_flight(self, key: Tuple, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Aynı key için devam eden bir istek varsa onun sonucunu bekle, yoksa isteği başlat"""
+        while (inflight := self._inflight.get(key)) is not None:
+            try:
+                # shield: bekleyen bir çağıranın iptali paylaşılan isteği iptal etmesin
+                return await asyncio.shield(inflight)
+            except asyncio.CancelledError:
+                # İptal edilen biz değil isteğin sahibiyse hatayı devralma, isteği yeniden başlat
+                if not inflight.cancelled() or asyncio.current_task().cancelling():
+                    raise
+        
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, params=params, headers=headers, timeout=30) as response:
-                    if response.status == 200:
-                        return await response.json()
-                    else:
-                        self.logger.error(f"API request failed: {response.status} - {await response.text()}")
-                        return {"error": f"API request failed with status {response.status}"}
-        
-        except asyncio.TimeoutError:
-            self.logger.error("API request timed out")
-            return {"error": "Request timed out"}
-        
+            result = await fetch()
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
         except Exception as e:
-            self.logger.error(f"API request error: {str(e)}")
-            return {"error": str(e)}
+            future.set_exception(e)
+            future.exception()  # bekleyen yoksa "never retrieved" uyarısını önle
+            raise
+        finally:
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+    
+    @staticmethod
+    def _copy_keywords(keywords: List[KeywordData]) -> List[KeywordData]:
+        """Cache'teki listeyi koru - merge işlemi KeywordData'yı değiştirir"""
+        return [replace(kw, related_keywords=list(kw.related_keywords)) for kw in keywords]
+    
+    async def _make_api_request(self, provider: str, url: str, params: Dict[str, Any] = None,
+                               headers: Dict[str, str] = None) -> Dict[str, Any]:
+        """
+        Generic API request handler - 429/5xx/timeout'ta exponential backoff ile retry
+        
+        Her deneme provider'ın token bucket'ından yeni token alır ve semaphore'u sadece
+        istek sürerken tutar; backoff beklemesinde slot diğer isteklere bırakılır.
+        
+        Raises:
+            SEOAPIError: İstek retry'lardan sonra da başarısız olursa
+        """
+        try:
+            async for attempt in AsyncRetrying(
+                retry=retry_if_exception_type((RateLimitError, TransientError, asyncio.TimeoutError)),
+                wait=self._retry_wait,
+                stop=stop_after_attempt(self.max_retries),
+                before_sleep=before_sleep_log(self.logger, logging.WARNING),
+                reraise=True
+            ):
+                with attempt:
+                    await self._limiters[provider].acquire()
+                    async with self._sem[provider]:
+                        return await self._request_once(url, params, headers)
+        
+        except (RateLimitError, TransientError, asyncio.TimeoutError) as e:
+            raise SEOAPIError(f"API request failed after {self.max_retries} attempts: {e!r}") from e
+        
+        except aiohttp.ClientResponseError as e:
+            raise SEOAPIError(f"API request failed with status {e.status}") from e
+        
+        except (aiohttp.ClientError, ValueError) as e:  # bağlantı hatası / geçersiz JSON
+            raise SEOAPIError(f"API request error: {str(e)}") from e
+    
+    async def _request_once(self, url: str, params: Optional[Dict[str, Any]],
+                            headers: Optional[Dict[str, str]]) -> Dict[str, Any]:
+        """Tek API isteği; retry edilebilir hataları exception olarak yükseltir"""
+        session = await self._get_session()
+        async with session.get(url, params=params, headers=headers) as response:
+            if response.status == 429:
+                raise RateLimitError(response.headers.get('Retry-After'))
+            if response.status >= 500:
+                raise TransientError(f"API request failed with status {response.status}")
+            if response.status >= 400:
+                self.logger.error(f"API request failed: {response.status} - {await response.text()}")
+            response.raise_for_status()
+            
+            # Ham byte'lar doğrudan parse edilir (bytes -> str decode adımı yok)
+            return _json_loads(await response.read())
+    
+    def _retry_wait(self, retry_state: RetryCallState) -> float:
+        """Retry-After varsa ona uy, yoksa exponential backoff + jitter (max 60s)"""
+        retry_after = getattr(retry_state.outcome.exception(), 'retry_after', None)
+        if retry_after is not None:
+            return min(retry_after, 60.0)
+        return self._backoff(retry_state)
     
     async def research_keywords(self, seed_keywords: List[str], 
                                country: str = "US", language: str = "en") -> List[KeywordData]:
@@ -183,20 +407,20 @@ class SEOToolsService:
         if self.mock_mode:
             return await self._mock_keyword_research(seed_keywords)
         
-        all_keywords = []
-        
-        # SEMrush API ile keyword research
+        # SEMrush ve Ahrefs aynı anda sorgulanır
+        tasks = []
         if self.semrush_api_key:
-            semrush_results = await self._semrush_keyword_research(seed_keywords, country)
-            all_keywords.extend(semrush_results)
-        
-        # Ahrefs API ile keyword research
+            tasks.append(self._semrush_keyword_research(seed_keywords, country))
         if self.ahrefs_api_key:
-            ahrefs_results = await self._ahrefs_keyword_research(seed_keywords, country)
-            all_keywords.extend(ahrefs_results)
+            tasks.append(self._ahrefs_keyword_research(seed_keywords, country))
+        
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        all_keywords = self._flatten_batches(results, "Keyword provider")
         
         # Duplicate'leri temizle ve birleştir
         unique_keywords = {}
+        # Çakışan keyword'lerin related listeleri sıralı set (dict) olarak biriktirilir
+        related: Dict[str, Dict[str, None]] = {}
         for kw in all_keywords:
             if kw.keyword not in unique_keywords:
                 unique_keywords[kw.keyword] = kw
@@ -204,16 +428,19 @@ class SEOToolsService:
                 # Birden fazla source'dan gelen data'yı birleştir
                 existing = unique_keywords[kw.keyword]
                 existing.search_volume = max(existing.search_volume, kw.search_volume)
-                existing.related_keywords.extend(kw.related_keywords)
-                existing.related_keywords = list(set(existing.related_keywords))
+                if kw.keyword not in related:
+                    related[kw.keyword] = dict.fromkeys(existing.related_keywords)
+                related[kw.keyword].update(dict.fromkeys(kw.related_keywords))
+        
+        for keyword, merged in related.items():
+            unique_keywords[keyword].related_keywords = list(merged)
         
         return list(unique_keywords.values())
     
     async def _semrush_keyword_research(self, keywords: List[str], country: str) -> List[KeywordData]:
         """SEMrush API ile keyword research"""
-        results = []
         
-        for keyword in keywords:
+        async def _request_one(keyword: str, cache_key: Tuple) -> List[KeywordData]:
             url = "https://api.semrush.com/"
             params = {
                 'type': 'phrase_related',
@@ -224,33 +451,43 @@ class SEOToolsService:
                 'display_limit': 100
             }
             
-            response = await self._make_api_request(url, params)
+            response = await self._make_api_request('semrush', url, params)
             
-            if 'error' not in response:
-                # SEMrush response'unu parse et
-                for item in response.get('data', []):
-                    try:
-                        kw_data = KeywordData(
-                            keyword=item.get('Ph', ''),
-                            search_volume=int(item.get('Nq', 0)),
-                            difficulty=float(item.get('Kd', 0)),
-                            cpc=float(item.get('Cp', 0)),
-                            competition=item.get('Co', 'low'),
-                            trend=[],  # Trend data ayrı API call gerektirir
-                            related_keywords=[]
-                        )
-                        results.append(kw_data)
-                    except (ValueError, KeyError) as e:
-                        self.logger.warning(f"Failed to parse SEMrush data: {e}")
-                        continue
-        
-        return results
+            results = []
+            # SEMrush response'unu parse et
+            for item in response.get('data', []):
+                try:
+                    kw_data = KeywordData(
+                        keyword=item.get('Ph', ''),
+                        search_volume=int(item.get('Nq', 0)),
+                        difficulty=float(item.get('Kd', 0)),
+                        cpc=float(item.get('Cp', 0)),
+                        competition=item.get('Co', 'low'),
+                        trend=[],  # Trend data ayrı API call gerektirir
+                        related_keywords=[]
+                    )
+                    results.append(kw_data)
+                except (ValueError, KeyError) as e:
+                    self.logger.warning(f"Failed to parse SEMrush data: {e}")
+                    continue
+            self._cache_put(cache_key, self._copy_keywords(results))
+            return results
+        
+        async def _fetch_one(keyword: str) -> List[KeywordData]:
+            cache_key = ('semrush', keyword.lower(), country.lower())
+            cached = self._cache_get(cache_key, self.cache_ttl['semrush'])
+            if cached is None:
+                cached = await self._single_flight(cache_key, lambda: _request_one(keyword, cache_key))
+            return self._copy_keywords(cached)
+        
+        # Keyword'ler sınırlı worker havuzu ile paralel sorgulanır
+        batches = await self._map_bounded(_fetch_one, keywords)
+        return self._flatten_batches(batches, "SEMrush")
     
     async def _ahrefs_keyword_research(self, keywords: List[str], country: str) -> List[KeywordData]:
         """Ahrefs API ile keyword research"""
-        results = []
         
-        for keyword in keywords:
+        async def _request_one(keyword: str, cache_key: Tuple) -> List[KeywordData]:
             url = "https://apiv2.ahrefs.com"
             headers = {
                 'Authorization': f'Bearer {self.ahrefs_api_key}',
@@ -262,26 +499,77 @@ class SEOToolsService:
                 'mode': 'exact'
             }
             
-            response = await self._make_api_request(url, params, headers)
+            response = await self._make_api_request('ahrefs', url, params, headers)
             
-            if 'error' not in response:
-                # Ahrefs response'unu parse et
-                for item in response.get('keywords', []):
-                    try:
-                        kw_data = KeywordData(
-                            keyword=item.get('keyword', ''),
-                            search_volume=int(item.get('search_volume', 0)),
-                            difficulty=float(item.get('difficulty', 0)),
-                            cpc=float(item.get('cpc', 0)),
-                            competition='medium',  # Ahrefs competition mapping
-                            trend=[],
-                            related_keywords=[]
-                        )
-                        results.append(kw_data)
-                    except (ValueError, KeyError) as e:
-                        self.logger.warning(f"Failed to parse Ahrefs data: {e}")
-                        continue
+            results = []
+            # Ahrefs response'unu parse et
+            for item in response.get('keywords', []):
+                try:
+                    kw_data = KeywordData(
+                        keyword=item.get('keyword', ''),
+                        search_volume=int(item.get('search_volume', 0)),
+                        difficulty=float(item.get('difficulty', 0)),
+                        cpc=float(item.get('cpc', 0)),
+                        competition='medium',  # Ahrefs competition mapping
+                        trend=[],
+                        related_keywords=[]
+                    )
+                    results.append(kw_data)
+                except (ValueError, KeyError) as e:
+                    self.logger.warning(f"Failed to parse Ahrefs data: {e}")
+                    continue
+            self._cache_put(cache_key, self._copy_keywords(results))
+            return results
+        
+        async def _fetch_one(keyword: str) -> List[KeywordData]:
+            cache_key = ('ahrefs', keyword.lower(), country.lower())
+            cached = self._cache_get(cache_key, self.cache_ttl['ahrefs'])
+            if cached is None:
+                cached = await self._single_flight(cache_key, lambda: _request_one(keyword, cache_key))
+            return self._copy_keywords(cached)
+        
+        # Keyword'ler sınırlı worker havuzu ile paralel sorgulanır
+        batches = await self._map_bounded(_fetch_one, keywords)
+        return self._flatten_batches(batches, "Ahrefs")
+    
+    async def _map_bounded(self, fetch: Callable[[Any], Awaitable[Any]], items: List[Any],
+                           workers: int = 10, queue_size: int = 50) -> List[Any]:
+        """
+        fetch'i items üzerinde bounded queue + worker havuzu ile çalıştır
         
+        Yüzlerce keyword için de coroutine'ler baştan oluşturulmaz. Sonuçlar girdi
+        sırasıyla döner; hata veren item'ın yerinde exception bulunur
+        (gather(return_exceptions=True) gibi).
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        results: List[Any] = [None] * len(items)
+        worker_count = min(workers, len(items))
+        
+        async def producer():
+            for job in enumerate(items):
+                await queue.put(job)
+            for _ in range(worker_count):
+                await queue.put(None)  # worker'ları durdur
+        
+        async def worker():
+            while (job := await queue.get()) is not None:
+                index, item = job
+                try:
+                    results[index] = await fetch(item)
+                except Exception as e:
+                    results[index] = e
+        
+        await asyncio.gather(producer(), *(worker() for _ in range(worker_count)))
+        return results
+    
+    def _flatten_batches(self, batches: List[Any], provider: str) -> List[KeywordData]:
+        """Keyword başına sonuçları tek listede topla, hata dönenleri logla"""
+        results = []
+        for batch in batches:
+            if isinstance(batch, Exception):
+                self.logger.error(f"{provider} keyword request failed: {batch}")
+                continue
+            results.extend(batch)
         return results
     
     async def _mock_keyword_research(self, keywords: List[str]) -> List[KeywordData]:
@@ -290,16 +578,7 @@ class SEOToolsService:
         
         for base_keyword in keywords:
             # Her keyword için 5-10 related keyword üret
-            variations = [
-                f"best {base_keyword}",
-                f"{base_keyword} review",
-                f"{base_keyword} guide",
-                f"how to choose {base_keyword}",
-                f"{base_keyword} comparison",
-                f"top {base_keyword}",
-                f"{base_keyword} tips",
-                f"{base_keyword} for beginners"
-            ]
+            variations = [template.format(base_keyword) for template in _MOCK_KEYWORD_TEMPLATES]
             
             for i, variation in enumerate(variations):
                 mock_data = KeywordData(
@@ -383,10 +662,11 @@ class SEOToolsService:
         
         # Use free tools if available
         if self.use_free_tools and self.free_service:
-            competitors = await self.free_service.get_serp_competitors(keyword, 10)
+            # Sonuç sayısı ve competitor'lar aynı SERP isteğinden gelir
+            total_results, competitors = await self.free_service.get_serp_overview(keyword, 10)
             return {
                 "keyword": keyword,
-                "total_results": await self.free_service.get_search_results_count(keyword),
+                "total_results": total_results,
                 "top_10_results": [
                     {
                         "position": i+1,
@@ -404,6 +684,15 @@ class SEOToolsService:
     
     async def _serpapi_analysis(self, keyword: str, location: str) -> Dict[str, Any]:
         """SERPAPI ile SERP analysis"""
+        cache_key = ('serpapi', keyword.lower(), location.lower())
+        cached = self._cache_get(cache_key, self.cache_ttl['serpapi'])
+        if cached is not None:
+            return cached
+        
+        return await self._single_flight(cache_key, lambda: self._serpapi_request(keyword, location, cache_key))
+    
+    async def _serpapi_request(self, keyword: str, location: str, cache_key: Tuple) -> Dict[str, Any]:
+        """SERPAPI isteği ve response parse"""
         try:
             url = "https://serpapi.com/search"
             params = {
@@ -415,44 +704,51 @@ class SEOToolsService:
                 'gl': 'us'
             }
             
-            response = await self._make_api_request(url, params)
+            response = await self._make_api_request('serpapi', url, params)
             
-            if 'error' not in response:
-                # Parse SERPAPI response
-                organic_results = response.get('organic_results', [])
-                
-                return {
-                    "keyword": keyword,
-                    "total_results": response.get('search_information', {}).get('total_results', 0),
-                    "top_10_results": [
-                        {
-                            "position": result.get('position', i+1),
-                            "title": result.get('title', ''),
-                            "url": result.get('link', ''),
-                            "domain": result.get('displayed_link', ''),
-                            "snippet": result.get('snippet', '')
-                        }
-                        for i, result in enumerate(organic_results[:10])
-                    ],
-                    "featured_snippets": response.get('answer_box', {}),
-                    "people_also_ask": [
-                        q.get('question', '') 
-                        for q in response.get('people_also_ask', [])
-                    ],
-                    "related_searches": [
-                        s.get('query', '') 
-                        for s in response.get('related_searches', [])
-                    ],
-                    "source": "serpapi"
-                }
-            else:
-                self.logger.error(f"SERPAPI error: {response}")
-                return await self._mock_serp_analysis(keyword)
-                
+            # Parse SERPAPI response
+            people_also_ask, related_searches = self._serpapi_related(response)
+            
+            analysis = {
+                "keyword": keyword,
+                "total_results": response.get('search_information', {}).get('total_results', 0),
+                "top_10_results": list(self._iter_top_results(response.get('organic_results', ()))),
+                "featured_snippets": response.get('answer_box', {}),
+                "people_also_ask": people_also_ask,
+                "related_searches": related_searches,
+                "source": "serpapi"
+            }
+            self._cache_put(cache_key, analysis)
+            return analysis
+        
+        except SEOAPIError as e:
+            self.logger.error(f"SERPAPI error: {str(e)}")
+            return await self._mock_serp_analysis(keyword)
+        
         except Exception as e:
             self.logger.error(f"SERPAPI analysis error: {str(e)}")
             return await self._mock_serp_analysis(keyword)
     
+    @staticmethod
+    def _iter_top_results(organic_results, limit: int = 10):
+        """SERPAPI organic_results'tan ilk `limit` sonucu üret (listeyi kopyalamadan)"""
+        for i, result in enumerate(islice(organic_results, limit)):
+            yield {
+                "position": result.get('position', i+1),
+                "title": result.get('title', ''),
+                "url": result.get('link', ''),
+                "domain": result.get('displayed_link', ''),
+                "snippet": result.get('snippet', '')
+            }
+    
+    @staticmethod
+    def _serpapi_related(response: Dict[str, Any]) -> Tuple[List[str], List[str]]:
+        """People also ask soruları ve related search sorguları"""
+        return (
+            [q.get('question', '') for q in response.get('people_also_ask', ())],
+            [s.get('query', '') for s in response.get('related_searches', ())]
+        )
+    
     async def _mock_serp_analysis(self, keyword: str) -> Dict[str, Any]:
         """Mock SERP analysis"""
         await asyncio.sleep(0.2)
@@ -490,12 +786,18 @@ class SEOToolsService:
             Dict: Optimization önerileri
         """
         
-        # Content analysis
+        # Content analysis - tüm keyword'ler tek regex geçişinde sayılır
         word_count = len(content.split())
+        keywords_lower = tuple(sorted({kw.lower() for kw in target_keywords if kw.strip()}))
+        keyword_counts = Counter(
+            keyword
+            for m in _keyword_pattern(keywords_lower).finditer(content.lower())
+            for keyword in m.groups() if keyword is not None
+        ) if keywords_lower else Counter()
         keyword_density = {}
         
         for keyword in target_keywords:
-            occurrences = content.lower().count(keyword.lower())
+            occurrences = keyword_counts[keyword.lower()]
             density = (occurrences / word_count) * 100 if word_count > 0 else 0
             keyword_density[keyword] = {
                 'occurrences': occurrences,
@@ -519,7 +821,7 @@ class SEOToolsService:
             "keyword_density": keyword_density,
             "optimization_suggestions": suggestions,
             "seo_score": self._calculate_seo_score(word_count, keyword_density),
-            "readability_score": self._calculate_readability_score(content)
+            "readability_score": self._calculate_readability_score(content, word_count)
         }
     
     def _calculate_seo_score(self, word_count: int, keyword_density: Dict[str, Any]) -> float:
@@ -547,10 +849,13 @@ class SEOToolsService:
         
         return min(score, 100)
     
-    def _calculate_readability_score(self, content: str) -> float:
-        """Simple readability score calculation"""
-        sentences = len([s for s in content.split('.') if s.strip()])
-        words = len(content.split())
+    def _calculate_readability_score(self, content: str, word_count: Optional[int] = None) -> float:
+        """Simple readability score calculation (word_count verilirse content tekrar bölünmez)"""
+        sentences = len(_SENTENCE_END_RE.findall(content))
+        stripped = content.rstrip()
+        if stripped and stripped[-1] not in '.!?':
+            sentences += 1  # noktalama ile bitmeyen son cümle
+        words = word_count if word_count is not None else len(content.split())
         
         if sentences == 0:
             return 0
@@ -558,14 +863,10 @@ class SEOToolsService:
         avg_sentence_length = words / sentences
         
         # Simple readability metric (higher is better)
-        if avg_sentence_length <= 15:
-            return 90
-        elif avg_sentence_length <= 20:
-            return 80
-        elif avg_sentence_length <= 25:
-            return 70
-        else:
-            return 60
+        for max_length, score in _READABILITY_BANDS:
+            if avg_sentence_length <= max_length:
+                return score
+        return 60
 
 
 # Test function
@@ -576,39 +877,42 @@ async def test_seo_tools():
     
     service = SEOToolsService()
     
-    # API key status
-    print("\n📋 API Status:")
-    print(f"  SERPAPI: {'✅' if service.serpapi_key else '❌'}")
-    print(f"  Free Tools: {'✅' if service.use_free_tools else '❌'}")
-    print(f"  Mock Mode: {'✅' if service.mock_mode else '❌'}")
-    
-    # Test 1: Keyword research
-    print("\n1. Testing Keyword Research...")
-    keywords = await service.research_keywords(["gaming mouse", "wireless headset"])
-    print(f"Found {len(keywords)} keywords")
-    if keywords:
-        print(f"Sample keyword: {keywords[0].keyword} - Volume: {keywords[0].search_volume}")
-    
-    # Test 2: Competitor analysis
-    print("\n2. Testing Competitor Analysis...")
-    competitor = await service.analyze_competitors("example.com", ["gaming mouse"])
-    print(f"Domain: {competitor.domain} - Authority: {competitor.authority_score}")
-    
-    # Test 3: SERP analysis
-    print("\n3. Testing SERP Analysis...")
-    serp = await service.get_serp_analysis("best gaming mouse")
-    print(f"SERP results: {len(serp.get('top_10_results', []))}")
-    print(f"Source: {serp.get('source', 'unknown')}")
-    
-    # Test 4: Content optimization
-    print("\n4. Testing Content Optimization...")
-    sample_content = "This is a sample content about gaming mouse. The best gaming mouse should have good DPI and comfortable design."
-    optimization = await service.get_content_optimization_suggestions(
-        sample_content, 
-        ["gaming mouse", "DPI"]
-    )
-    print(f"SEO Score: {optimization['seo_score']}")
-    print(f"Suggestions: {len(optimization['optimization_suggestions'])}")
+    try:
+        # API key status
+        print("\n📋 API Status:")
+        print(f"  SERPAPI: {'✅' if service.serpapi_key else '❌'}")
+        print(f"  Free Tools: {'✅' if service.use_free_tools else '❌'}")
+        print(f"  Mock Mode: {'✅' if service.mock_mode else '❌'}")
+        
+        # Test 1: Keyword research
+        print("\n1. Testing Keyword Research...")
+        keywords = await service.research_keywords(["gaming mouse", "wireless headset"])
+        print(f"Found {len(keywords)} keywords")
+        if keywords:
+            print(f"Sample keyword: {keywords[0].keyword} - Volume: {keywords[0].search_volume}")
+        
+        # Test 2: Competitor analysis
+        print("\n2. Testing Competitor Analysis...")
+        competitor = await service.analyze_competitors("example.com", ["gaming mouse"])
+        print(f"Domain: {competitor.domain} - Authority: {competitor.authority_score}")
+        
+        # Test 3: SERP analysis
+        print("\n3. Testing SERP Analysis...")
+        serp = await service.get_serp_analysis("best gaming mouse")
+        print(f"SERP results: {len(serp.get('top_10_results', []))}")
+        print(f"Source: {serp.get('source', 'unknown')}")
+        
+        # Test 4: Content optimization
+        print("\n4. Testing Content Optimization...")
+        sample_content = "This is a sample content about gaming mouse. The best gaming mouse should have good DPI and comfortable design."
+        optimization = await service.get_content_optimization_suggestions(
+            sample_content, 
+            ["gaming mouse", "DPI"]
+        )
+        print(f"SEO Score: {optimization['seo_score']}")
+        print(f"Suggestions: {len(optimization['optimization_suggestions'])}")
+    finally:
+        await service.aclose()
     
     print("\n✅ SEO Tools Service test completed!")
 
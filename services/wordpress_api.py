@@ -1,19 +1,100 @@
 """
 WordPress REST API Service - Full Implementation
-JWT ve Basic Auth destekli
+JWT ve Basic Auth destekli (aiohttp, async)
 """
 
-import requests
+import aiohttp
+import asyncio
 import json
 import base64
-from typing import Dict, Any, Optional, List
+import html
+import mimetypes
+import os
+import random
+import re
+import time
+from typing import Dict, Any, Optional, List, Tuple, Mapping, Union
 from datetime import datetime
+from email.utils import parsedate_to_datetime
+from urllib.parse import quote
+from yarl import URL
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+try:
+    import brotli  # noqa: F401 - aiohttp br response decoding
+    ACCEPT_ENCODING = 'br, gzip, deflate'
+except ImportError:
+    ACCEPT_ENCODING = 'gzip, deflate'
+
+# WP 5.6+ batch framework: tek istekte en fazla 25 alt istek
+BATCH_MAX_REQUESTS = 25
+
+# Yazma yanıtlarında sadece kullanılan alanlar (rendered content, _links vs. dönmez)
+POST_FIELDS = {'_fields': 'id,link,status'}
+ID_FIELDS = {'_fields': 'id'}
+
+# Geçici hatalarda retry: 429/503 sunucunun isteği işlemediğini bildirir; diğer 5xx
+# sadece idempotent metodlarda tekrarlanır (POST tekrarı çift post oluşturabilir)
+MAX_RETRIES = 5
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+NON_IDEMPOTENT_RETRY_STATUSES = frozenset({429, 503})
+
+# JWT token cache (instance'lar arası): (base_url, username) -> (token, expires_at monotonic)
+JWT_DEFAULT_TTL = 23 * 3600  # jwt-auth eklentisi varsayılanı 24 saat
+_jwt_tokens: Dict[Tuple[str, str], Tuple[str, float]] = {}
+
+_MAX_AGE_RE = re.compile(r"max-age=(\d+)")
+
+
+def _max_age(cache_control: Optional[str]) -> int:
+    """Cache-Control başlığından max-age (saniye); no-store/no-cache = 0"""
+    if not cache_control or 'no-store' in cache_control or 'no-cache' in cache_control:
+        return 0
+    match = _MAX_AGE_RE.search(cache_control)
+    return int(match.group(1)) if match else 0
+
+
+def _jwt_ttl(token: str) -> float:
+    """Token'ın kalan ömrü (saniye): `exp` claim'inden, okunamazsa varsayılan TTL"""
+    try:
+        payload = token.split('.')[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + '=' * (-len(payload) % 4)))
+        # Saat farkı için 60 sn pay bırak
+        return float(claims['exp']) - time.time() - 60
+    except (IndexError, KeyError, TypeError, ValueError):
+        return JWT_DEFAULT_TTL
+
+
+def _retry_after(value: Optional[str]) -> Optional[float]:
+    """Retry-After başlığı: saniye ya da HTTP tarihi"""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
 
 class WordPressAPI:
     def __init__(self, url: str, username: str, password: str, use_jwt: bool = False):
         """
         WordPress API bağlantısı
         
+        Network işlemi yapmaz; bağlantı ve JWT token için `await WordPressAPI.create(...)` kullanın.
+        
         Args:
             url: WordPress site URL
             username: Admin kullanıcı adı
@@ -22,15 +103,32 @@ class WordPressAPI:
         """
         self.base_url = url.rstrip('/')
         self.api_url = f"{self.base_url}/wp-json/wp/v2"
+        self.batch_url = f"{self.base_url}/wp-json/batch/v1"
+        
+        # Sabit endpoint'ler (query dahil) bir kez parse edilir; aiohttp URL nesnesini tekrar işlemez
+        self._token_url = URL(f"{self.base_url}/wp-json/jwt-auth/v1/token")
+        self._batch_url = URL(self.batch_url).with_query(validation='require-all-validate')
+        self._posts_url = URL(f"{self.api_url}/posts").with_query(POST_FIELDS)
+        self._media_url = URL(f"{self.api_url}/media").with_query(ID_FIELDS)
+        self._term_urls = {
+            taxonomy: URL(f"{self.api_url}/{taxonomy}").with_query(ID_FIELDS)
+            for taxonomy in ('tags', 'categories')
+        }
         self.username = username
         self.password = password
         self.use_jwt = use_jwt
+        self.session: Optional[aiohttp.ClientSession] = None
+        
+        # GET cache: (url, params) -> (etag, last_modified, expires_at, body)
+        self._get_cache: Dict[Tuple, Tuple[Optional[str], Optional[str], float, Any]] = {}
+        # Taksonomi terim ID'leri: (taxonomy, isim.lower()) -> id (instance ömrü boyunca)
+        self._term_cache: Dict[Tuple[str, str], int] = {}
         
         if use_jwt:
-            self.token = self._get_jwt_token()
+            # Token create() içinde alınır
             self.headers = {
-                'Authorization': f'Bearer {self.token}',
-                'Content-Type': 'application/json'
+                'Content-Type': 'application/json',
+                'Accept-Encoding': ACCEPT_ENCODING
             }
         else:
             # Basic Authentication
@@ -38,33 +136,224 @@ class WordPressAPI:
             encoded = base64.b64encode(credentials.encode()).decode('ascii')
             self.headers = {
                 'Authorization': f'Basic {encoded}',
-                'Content-Type': 'application/json'
+                'Content-Type': 'application/json',
+                'Accept-Encoding': ACCEPT_ENCODING
             }
     
-    def _get_jwt_token(self) -> str:
-        """JWT token al"""
-        response = requests.post(
-            f"{self.base_url}/wp-json/jwt-auth/v1/token",
+    @classmethod
+    async def create(cls, url: str, username: str, password: str, use_jwt: bool = False) -> 'WordPressAPI':
+        """Async factory: paylaşılan session'ı aç, gerekiyorsa JWT token al"""
+        self = cls(url, username, password, use_jwt)
+        # Authorization her istekte _send'de eklenir: token isteği onsuz gitmeli
+        self.session = aiohttp.ClientSession(
+            headers={k: v for k, v in self.headers.items() if k != 'Authorization'},
+            # Tek host'a keep-alive havuzu: post/tag/medya istekleri TCP+TLS bağlantılarını tekrar kullanır
+            connector=aiohttp.TCPConnector(limit=20, limit_per_host=20, ttl_dns_cache=300,
+                                           keepalive_timeout=30),
+            timeout=aiohttp.ClientTimeout(total=60)
+        )
+        
+        if use_jwt:
+            try:
+                self._set_token(await self._get_jwt_token())
+            except Exception:
+                await self.aclose()
+                raise
+        
+        return self
+    
+    async def aclose(self):
+        """HTTP session'ı kapat"""
+        if self.session and not self.session.closed:
+            await self.session.close()
+        self.session = None
+    
+    async def __aenter__(self) -> 'WordPressAPI':
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+    
+    async def _get_jwt_token(self, force_refresh: bool = False) -> str:
+        """JWT token al (süresi dolmadıysa cache'ten)"""
+        key = (self.base_url, self.username)
+        cached = _jwt_tokens.get(key)
+        if cached and not force_refresh and time.monotonic() < cached[1]:
+            return cached[0]
+        
+        # Süresi dolmuş Bearer header'ı gönderilmez: jwt-auth onu doğrulayıp token isteğini reddeder
+        status, body, _ = await self._send(
+            'POST',
+            self._token_url,
             json={
                 'username': self.username,
                 'password': self.password
-            }
+            },
+            auth=False
         )
-        if response.status_code == 200:
-            return response.json()['token']
-        raise Exception(f"JWT token alınamadı: {response.text}")
+        if status == 200:
+            token = body['token']
+            _jwt_tokens[key] = (token, time.monotonic() + _jwt_ttl(token))
+            return token
+        raise Exception(f"JWT token alınamadı: {body}")
+    
+    def _set_token(self, token: str):
+        """Bearer token'ı sonraki isteklerin Authorization header'ına yaz"""
+        self.token = token
+        self.headers['Authorization'] = f'Bearer {token}'
+    
+    def _retry_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Retry-After varsa ona uy, yoksa exponential backoff + jitter (max 60s)"""
+        if retry_after is not None:
+            return min(retry_after, 60.0)
+        return min(0.5 * 2 ** attempt, 60.0) + random.uniform(0, 0.5)
     
-    def test_connection(self) -> bool:
+    async def _request(self, method: str, url: Union[str, URL], **kwargs) -> Tuple[int, Any, Mapping[str, str]]:
+        """HTTP isteği; JWT kullanılıyorsa 401'de token'ı bir kez yenileyip tekrar dener"""
+        status, body, headers = await self._send(method, url, **kwargs)
+        if status == 401 and self.use_jwt:
+            self._set_token(await self._get_jwt_token(force_refresh=True))
+            status, body, headers = await self._send(method, url, **kwargs)
+        return status, body, headers
+    
+    async def _send(self, method: str, url: Union[str, URL], *, params: Dict[str, Any] = None,
+                    json: Any = None, data: Any = None,
+                    headers: Dict[str, str] = None, auth: bool = True) -> Tuple[int, Any, Mapping[str, str]]:
+        """
+        HTTP isteği; 429/5xx ve bağlantı hatalarında Retry-After'a uyarak tekrar dener
+        
+        `data` callable olabilir: her denemede yeni gövde üretir (aiohttp gönderdiği
+        dosyayı kapattığı için tekrar denemede dosya yeniden açılmalı). Factory
+        (ör. open) thread'de çalışır; dosya okumasını aiohttp zaten executor'da yapar
+        
+        `auth=False` Authorization header'ı olmadan gönderir (JWT token isteği)
+        
+        Returns:
+            (status, body, headers) - body JSON ise parse edilmiş, değilse metin
+        """
+        if auth and 'Authorization' in self.headers:
+            headers = {'Authorization': self.headers['Authorization'], **(headers or {})}
+        
+        idempotent = method in ('GET', 'HEAD', 'PUT', 'DELETE')
+        
+        # JSON gövde bir kez serialize edilir (retry'larda tekrar kullanılır);
+        # Content-Type: application/json session header'larından gelir
+        if json is not None:
+            data = _json_dumps(json)
+        retry_statuses = RETRY_STATUSES if idempotent else NON_IDEMPOTENT_RETRY_STATUSES
+        
+        for attempt in range(MAX_RETRIES + 1):
+            payload = await asyncio.to_thread(data) if callable(data) else data
+            try:
+                async with self.session.request(method, url, params=params,
+                                                 data=payload, headers=headers) as response:
+                    # Ham byte'lar doğrudan parse edilir (bytes -> str decode adımı yok)
+                    raw = await response.read()
+                    if response.status not in retry_statuses or attempt == MAX_RETRIES:
+                        try:
+                            body = _json_loads(raw)
+                        except ValueError:
+                            body = raw.decode('utf-8', errors='replace')
+                        return response.status, body, response.headers
+                    delay = self._retry_delay(attempt, _retry_after(response.headers.get('Retry-After')))
+                    reason = f"status {response.status}"
+            
+            except aiohttp.ClientConnectorError as e:
+                # Bağlantı kurulamadı: istek sunucuya ulaşmadı, her metod için güvenli
+                if attempt == MAX_RETRIES:
+                    raise
+                delay, reason = self._retry_delay(attempt), repr(e)
+            
+            except (aiohttp.ServerDisconnectedError, asyncio.TimeoutError) as e:
+                if not idempotent or attempt == MAX_RETRIES:
+                    raise
+                delay, reason = self._retry_delay(attempt), repr(e)
+            
+            finally:
+                if payload is not data and hasattr(payload, 'close'):
+                    payload.close()
+            
+            print(f"⚠️ {method} {url} failed ({reason}), retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+    
+    async def _cached_get(self, url: str, params: Dict[str, Any] = None) -> Any:
+        """
+        Koşullu GET: max-age içinde bellekten döner, sonrasında If-None-Match /
+        If-Modified-Since ile doğrular (304 = cache'teki body)
+        """
+        key = (url, tuple(sorted((params or {}).items())))
+        entry = self._get_cache.get(key)
+        now = time.monotonic()
+        headers = {}
+        
+        if entry:
+            etag, last_modified, expires_at, body = entry
+            if now < expires_at:
+                return body
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+        
+        status, body, response_headers = await self._request('GET', url, params=params, headers=headers)
+        if status == 304 and entry:
+            body = entry[3]
+        elif status != 200:
+            raise Exception(f"GET {url} failed: {status} - {body}")
+        
+        etag = response_headers.get('ETag') or (entry[0] if entry else None)
+        last_modified = response_headers.get('Last-Modified') or (entry[1] if entry else None)
+        max_age = _max_age(response_headers.get('Cache-Control'))
+        
+        self._get_cache[key] = (etag, last_modified, now + max_age, body)
+        return body
+    
+    async def test_connection(self) -> bool:
         """Bağlantıyı test et"""
         try:
-            response = requests.get(f"{self.api_url}/posts", headers=self.headers)
-            print(f"Connection test: {response.status_code}")
-            return response.status_code == 200
+            await self._cached_get(f"{self.api_url}/posts", {'per_page': 1})
+            print("Connection test: 200")
+            return True
         except Exception as e:
             print(f"Connection error: {e}")
             return False
     
-    def create_post(self,
+    @staticmethod
+    def _post_payload(title: str, content: str, status: str, excerpt: str,
+                      categories: Optional[List[int]], tags: Optional[List[int]],
+                      featured_media: int, meta: Optional[Dict]) -> Dict[str, Any]:
+        """/posts gövdesi"""
+        post_data = {
+            'title': title,
+            'content': content,
+            'status': status,
+            'excerpt': excerpt,
+            'categories': categories or [],
+            'tags': tags or [],
+            'featured_media': featured_media
+        }
+        
+        if meta:
+            post_data['meta'] = meta
+        return post_data
+    
+    async def find_post_by_slug(self, slug: str) -> Optional[Dict[str, Any]]:
+        """
+        Slug'a sahip post'u bul (duplicate kontrolü); yoksa None
+        
+        Tekrarlanan sorgular koşullu GET ile gider: değişmemişse sunucu 304 döner
+        """
+        posts = await self._cached_get(
+            f"{self.api_url}/posts",
+            {
+                'slug': slug,
+                'status': 'publish,future,draft,pending,private',
+                '_fields': 'id,slug,link,status,modified'
+            }
+        )
+        return posts[0] if posts else None
+    
+    async def create_post(self,
                    title: str,
                    content: str,
                    status: str = 'draft',
@@ -87,126 +376,257 @@ class WordPressAPI:
             meta: Meta veriler (Yoast SEO vs.)
         """
         
-        post_data = {
-            'title': title,
-            'content': content,
-            'status': status,
-            'excerpt': excerpt,
-            'categories': categories or [],
-            'tags': tags or [],
-            'featured_media': featured_media
-        }
+        post_data = self._post_payload(title, content, status, excerpt,
+                                       categories, tags, featured_media, meta)
         
-        if meta:
-            post_data['meta'] = meta
-        
-        response = requests.post(
-            f"{self.api_url}/posts",
-            headers=self.headers,
-            json=post_data
+        status, created_post, _ = await self._request(
+            'POST', self._posts_url, json=post_data
         )
-        
-        if response.status_code == 201:
-            created_post = response.json()
+        if status == 201:
             print(f"✅ Post created: {created_post['link']}")
             return created_post
         else:
-            raise Exception(f"Post creation failed: {response.status_code} - {response.text}")
+            raise Exception(f"Post creation failed: {status} - {created_post}")
     
-    def upload_media(self, file_path: str, alt_text: str = '') -> int:
+    async def upload_media(self, file_path: str, alt_text: str = '') -> int:
         """
         Medya yükle
         
         Returns:
             Media ID
         """
-        with open(file_path, 'rb') as file:
-            files = {'file': file}
-            headers = self.headers.copy()
-            headers.pop('Content-Type')  # Let requests set this
-            
-            response = requests.post(
-                f"{self.api_url}/media",
-                headers=headers,
-                files=files
-            )
-            
-            if response.status_code == 201:
-                media = response.json()
-                media_id = media['id']
-                
-                # Alt text ekle
-                if alt_text:
-                    self.update_media(media_id, {'alt_text': alt_text})
-                
-                return media_id
-            else:
-                raise Exception(f"Media upload failed: {response.text}")
-    
-    def update_media(self, media_id: int, data: Dict) -> bool:
+        filename = os.path.basename(file_path)
+        disposition = (f'attachment; filename="{filename}"' if filename.isascii()
+                       else f"attachment; filename*=UTF-8''{quote(filename)}")
+        
+        # Ham gövde (multipart yok): aiohttp dosyayı parça parça stream eder, bellekte tamponlamaz
+        headers = {
+            'Content-Disposition': disposition,
+            'Content-Type': mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+        }
+        
+        status, media, _ = await self._request(
+            'POST',
+            self._media_url,
+            headers=headers,
+            data=lambda: open(file_path, 'rb')
+        )
+        if status != 201:
+            raise Exception(f"Media upload failed: {media}")
+        
+        media_id = media['id']
+        
+        # Alt text ekle
+        if alt_text:
+            await self.update_media(media_id, {'alt_text': alt_text})
+        
+        return media_id
+    
+    async def upload_media_many(self, files: List[Tuple[str, str]], max_concurrent: int = 5) -> List[int]:
+        """
+        Birden fazla medyayı eşzamanlı yükle
+        
+        Args:
+            files: (dosya yolu, alt text) listesi
+            max_concurrent: Aynı anda en fazla yükleme sayısı
+        
+        Returns:
+            Giriş sırasıyla Media ID listesi
+        """
+        sem = asyncio.Semaphore(max_concurrent)
+        
+        async def _one(file_path: str, alt_text: str) -> int:
+            async with sem:
+                return await self.upload_media(file_path, alt_text)
+        
+        return await asyncio.gather(*(_one(path, alt) for path, alt in files))
+    
+    async def publish_post_with_media(self,
+                                      file_path: str,
+                                      alt_text: str,
+                                      title: str,
+                                      content: str,
+                                      status: str = 'draft',
+                                      excerpt: str = '',
+                                      categories: List[int] = None,
+                                      tags: List[int] = None,
+                                      meta: Dict = None) -> Dict[str, Any]:
+        """
+        Öne çıkan görselle post oluştur
+        
+        Medya önce yüklenir (post'un featured_media ID'si gerekir); alt text güncellemesi
+        ve post oluşturma aynı anda gider (3 RTT -> 2). Batch kullanılmaz: WP core'un
+        medya endpoint'i batch'e izin vermez ve tüm batch doğrulamada reddedilir
+        
+        Returns:
+            Oluşturulan post (id, link, status)
+        """
+        media_id = await self.upload_media(file_path)
+        
+        create = self.create_post(title, content, status, excerpt,
+                                  categories, tags, media_id, meta)
+        if not alt_text:
+            return await create
+        
+        created_post, _ = await asyncio.gather(
+            create,
+            self.update_media(media_id, {'alt_text': alt_text})
+        )
+        return created_post
+    
+    async def update_media(self, media_id: int, data: Dict) -> bool:
         """Medya güncelle"""
-        response = requests.post(
-            f"{self.api_url}/media/{media_id}",
-            headers=self.headers,
-            json=data
+        status, _, _ = await self._request(
+            'POST', f"{self.api_url}/media/{media_id}", params=ID_FIELDS, json=data
         )
-        return response.status_code == 200
+        return status == 200
     
-    def create_category(self, name: str, description: str = '') -> int:
+    async def create_category(self, name: str, description: str = '') -> int:
         """Kategori oluştur"""
-        response = requests.post(
-            f"{self.api_url}/categories",
-            headers=self.headers,
+        status, body, _ = await self._request(
+            'POST',
+            self._term_urls['categories'],
             json={'name': name, 'description': description}
         )
-        if response.status_code == 201:
-            return response.json()['id']
+        if status == 201:
+            return body['id']
         return 0
     
-    def create_tag(self, name: str) -> int:
+    async def create_tag(self, name: str) -> int:
         """Etiket oluştur"""
-        response = requests.post(
-            f"{self.api_url}/tags",
-            headers=self.headers,
-            json={'name': name}
-        )
-        if response.status_code == 201:
-            return response.json()['id']
+        status, body, _ = await self._request('POST', self._term_urls['tags'], json={'name': name})
+        if status == 201:
+            return body['id']
         return 0
+    
+    async def _batch(self, sub_requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Alt istekleri /batch/v1 üzerinden gönder (25'lik parçalar halinde)
+        
+        Returns:
+            Sıralı alt yanıtlar ({'status': ..., 'body': ...})
+        """
+        responses = []
+        for start in range(0, len(sub_requests), BATCH_MAX_REQUESTS):
+            chunk = sub_requests[start:start + BATCH_MAX_REQUESTS]
+            status, body, _ = await self._request(
+                'POST',
+                self._batch_url,
+                json={'requests': chunk}
+            )
+            if status not in (200, 207):
+                raise Exception(f"Batch request failed: {status} - {body}")
+            responses.extend(body['responses'])
+        return responses
+    
+    async def _create_terms_batch(self, taxonomy: str, names: List[str]) -> List[int]:
+        """Taksonomi terimlerini tek batch'te oluştur; var olan terimlerin ID'sini döndür, hata = 0"""
+        # Daha önce çözülmüş isimler için istek atılmaz
+        missing = list(dict.fromkeys(
+            name for name in names if (taxonomy, name.lower()) not in self._term_cache
+        ))
+        
+        if missing:
+            responses = await self._batch([
+                {'method': 'POST', 'path': f'/wp/v2/{taxonomy}?_fields=id', 'body': {'name': name}}
+                for name in missing
+            ])
+            
+            for name, item in zip(missing, responses):
+                body = item.get('body') or {}
+                if item.get('status') == 201:
+                    term_id = body['id']
+                elif body.get('code') == 'term_exists':
+                    # WP var olan terimin ID'sini hata verisinde döndürür
+                    term_id = body.get('data', {}).get('term_id', 0)
+                else:
+                    term_id = 0
+                if term_id:
+                    self._term_cache[(taxonomy, name.lower())] = term_id
+        
+        return [self._term_cache.get((taxonomy, name.lower()), 0) for name in names]
+    
+    async def _get_or_create_term(self, taxonomy: str, name: str, **fields) -> int:
+        """Terimi önce ara (cache'li GET), yoksa oluştur"""
+        key = (taxonomy, name.lower())
+        if key in self._term_cache:
+            return self._term_cache[key]
+        
+        try:
+            matches = await self._cached_get(
+                f"{self.api_url}/{taxonomy}",
+                {'search': name, 'per_page': 10, '_fields': 'id,name'}
+            )
+        except Exception:
+            matches = []
+        
+        # search kısmi eşleşme döndürür; isim tam eşleşmeli (WP isimleri HTML-escape'li döner)
+        term_id = next(
+            (term['id'] for term in matches if html.unescape(term['name']).lower() == key[1]),
+            0
+        )
+        
+        if not term_id:
+            status, body, _ = await self._request(
+                'POST', self._term_urls[taxonomy], json={'name': name, **fields}
+            )
+            if status == 201:
+                term_id = body['id']
+            elif isinstance(body, dict) and body.get('code') == 'term_exists':
+                term_id = body.get('data', {}).get('term_id', 0)
+        
+        if term_id:
+            self._term_cache[key] = term_id
+        return term_id
+    
+    async def get_or_create_tag(self, name: str) -> int:
+        """Etiket ID'si: varsa mevcut olanı, yoksa yeni oluşturulanı döndür"""
+        return await self._get_or_create_term('tags', name)
+    
+    async def get_or_create_category(self, name: str, description: str = '') -> int:
+        """Kategori ID'si: varsa mevcut olanı, yoksa yeni oluşturulanı döndür"""
+        return await self._get_or_create_term('categories', name, description=description)
+    
+    async def create_tags_batch(self, names: List[str]) -> List[int]:
+        """Etiketleri tek istekte oluştur (isim sırasıyla ID listesi)"""
+        return await self._create_terms_batch('tags', names)
+    
+    async def create_categories_batch(self, names: List[str]) -> List[int]:
+        """Kategorileri tek istekte oluştur (isim sırasıyla ID listesi)"""
+        return await self._create_terms_batch('categories', names)
 
 # Test fonksiyonu
-def test_wordpress_connection():
+async def test_wordpress_connection():
     """WordPress bağlantısını test et"""
     
     print("🔌 WordPress Connection Test")
     print("-" * 40)
     
     # BURAYA BİLGİLERİNİZİ GİRİN
-    wp = WordPressAPI(
+    async with await WordPressAPI.create(
         url="http://localhost/wordpress",
         username="admin",
         password="2025*Ommer.",  # ← ŞİFRENİZİ GİRİN!
         use_jwt=False  # Basic Auth kullan
-    )
-    
-    # Bağlantı testi
-    if wp.test_connection():
-        print("✅ Bağlantı başarılı!")
-        
-        # Test postu oluştur
-        test_post = wp.create_post(
-            title="Test Post from Python",
-            content="<p>This is a <strong>test post</strong> created via REST API!</p>",
-            status="draft",
-            excerpt="Test excerpt"
-        )
-        
-        print(f"✅ Test post oluşturuldu!")
-        print(f"📝 Post ID: {test_post['id']}")
-        print(f"🔗 Edit URL: http://localhost/wordpress/wp-admin/post.php?post={test_post['id']}&action=edit")
-        
-    else:
-        print("❌ Bağlantı başarısız! Şifrenizi kontrol edin.")
+    ) as wp:
+        # Bağlantı testi
+        if await wp.test_connection():
+            print("✅ Bağlantı başarılı!")
+            
+            # Test postu oluştur
+            test_post = await wp.create_post(
+                title="Test Post from Python",
+                content="<p>This is a <strong>test post</strong> created via REST API!</p>",
+                status="draft",
+                excerpt="Test excerpt"
+            )
+            
+            print(f"✅ Test post oluşturuldu!")
+            print(f"📝 Post ID: {test_post['id']}")
+            print(f"🔗 Edit URL: http://localhost/wordpress/wp-admin/post.php?post={test_post['id']}&action=edit")
+            
+        else:
+            print("❌ Bağlantı başarısız! Şifrenizi kontrol edin.")
 
 if __name__ == "__main__":
-    test_wordpress_connection()
+    asyncio.run(test_wordpress_connection())
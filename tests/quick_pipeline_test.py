@@ -4,12 +4,23 @@ Run: python -c "import asyncio; exec(open('quick_test.py').read())"
 """
 
 import asyncio
+import functools
 import sys
 import os
 
 # Add to Python path
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+@functools.lru_cache(maxsize=1)
+def _gemini():
+    from services.gemini_service import GeminiService
+    return GeminiService()
+
+@functools.lru_cache(maxsize=1)
+def _seo():
+    from services.seo_tools import SEOToolsService
+    return SEOToolsService()
+
 async def quick_test():
     print("🚀 QUICK PIPELINE TEST - SESSION 3")
     print("=" * 50)
@@ -26,8 +37,8 @@ async def quick_test():
         print("✅ All imports successful")
         
         # Initialize services
-        gemini = GeminiService()
-        seo_tools = SEOToolsService()
+        gemini = _gemini()
+        seo_tools = _seo()
         
         print("✅ Services initialized")
         
@@ -104,6 +115,10 @@ async def quick_test():
         import traceback
         traceback.print_exc()
         return False
+    finally:
+        # Close the SEO service's HTTP sessions (only if it was created)
+        if _seo.cache_info().currsize:
+            await _seo().aclose()
 
 # Run test
 if __name__ == "__main__":
@@ -4,6 +4,7 @@ Test base_agent.py functionality with mock data
 """
 
 import asyncio
+import functools
 import sys
 import os
 
@@ -16,13 +17,19 @@ sys.path.append(parent_dir)
 from agents.base_agent import TestAgent, GeminiService
 
 
+@functools.lru_cache(maxsize=1)
+def _gemini() -> GeminiService:
+    """Testler arasında paylaşılan tek GeminiService (SDK client'ı bir kez kurulur)"""
+    return GeminiService()
+
+
 async def test_base_agent():
     """Base Agent'ı test et"""
     print("🚀 Starting Base Agent Test...")
     print("=" * 50)
     
     # Mock Gemini Service (gerçek API anahtarı olmadan test için)
-    gemini_service = GeminiService()
+    gemini_service = _gemini()
     
     # Test Agent oluştur
     agent = TestAgent(gemini_service)
@@ -99,7 +106,7 @@ async def test_tool_system():
     print("🔧 TESTING TOOL SYSTEM:")
     print("=" * 50)
     
-    gemini_service = GeminiService()
+    gemini_service = _gemini()
     agent = TestAgent(gemini_service)
     
     # Available tools listele
@@ -113,13 +120,18 @@ async def test_tool_system():
         ("validate_content", {"content": "This is a test content for validation."})
     ]
     
-    for tool_name, kwargs in test_tools:
-        try:
-            print(f"\n🔧 Testing {tool_name}...")
-            result = await agent.call_tool(tool_name, **kwargs)
+    # Tool çağrıları birbirinden bağımsız: hepsi eşzamanlı, çıktı sırası korunur
+    results = await asyncio.gather(
+        *(agent.call_tool(tool_name, **kwargs) for tool_name, kwargs in test_tools),
+        return_exceptions=True
+    )
+    
+    for (tool_name, _), result in zip(test_tools, results):
+        print(f"\n🔧 Testing {tool_name}...")
+        if isinstance(result, Exception):
+            print(f"   Error: {result}")
+        else:
             print(f"   Result: {result}")
-        except Exception as e:
-            print(f"   Error: {e}")
 
 
 async def main():
@@ -0,0 +1,95 @@
+"""
+Free SEO Trends Worker Test
+aclose() sırasında devam eden ve kuyrukta bekleyen Trends çağrılarının asılı
+kalmayıp mock veriye düştüğünü kontrol eder (pytrends veya ağ gerektirmez)
+"""
+
+import asyncio
+import sys
+import os
+
+# Path fix for tests/ directory
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import services.free_seo_tools as free_seo_tools
+from services.free_seo_tools import FreeSEOToolsService
+
+
+async def test_pending_calls_return_after_aclose():
+    """Biri işlenirken ikisi kuyrukta: aclose sonrası üçü de mock veriyle döner"""
+    print("🚀 Testing pending Trends calls after aclose...")
+
+    started = asyncio.Event()
+
+    async def hanging_call(clean_keywords, timeframe):
+        started.set()
+        await asyncio.Event().wait()  # Google hiç cevap vermiyor
+
+    # pytrends kurulu değilse de Trends yolu kullanılsın
+    tools = FreeSEOToolsService()
+    original_available = free_seo_tools.PYTRENDS_AVAILABLE
+    free_seo_tools.PYTRENDS_AVAILABLE = True
+    tools.pytrends = object()
+    tools._trends_call = hanging_call
+    try:
+        calls = [
+            asyncio.create_task(tools.get_google_trends([keyword]))
+            for keyword in ("gaming mouse", "mechanical keyboard", "usb microphone")
+        ]
+        await started.wait()
+        await asyncio.sleep(0)
+        assert tools._trends_queue.qsize() == 2
+
+        await tools.aclose()
+        results = await asyncio.wait_for(asyncio.gather(*calls), timeout=5)
+    finally:
+        free_seo_tools.PYTRENDS_AVAILABLE = original_available
+        await tools.aclose()
+
+    assert [list(result) for result in results] == [["gaming mouse"], ["mechanical keyboard"], ["usb microphone"]]
+    print("✅ In-flight and queued calls fell back to mock data")
+
+
+async def test_worker_restarts_after_aclose():
+    """aclose sonrası yeni çağrı yeni worker başlatır"""
+    print("🚀 Testing worker restart...")
+
+    async def quick_call(clean_keywords, timeframe):
+        return {keyword: {'trend_score': 77, 'trend_data': [77], 'related_queries': []}
+                for keyword in clean_keywords}
+
+    # pytrends kurulu değilse de Trends yolu kullanılsın
+    tools = FreeSEOToolsService()
+    original_available = free_seo_tools.PYTRENDS_AVAILABLE
+    free_seo_tools.PYTRENDS_AVAILABLE = True
+    tools.pytrends = object()
+    tools._trends_call = quick_call
+    try:
+        await tools.get_google_trends(["first"])
+        await tools.aclose()
+        result = await asyncio.wait_for(tools.get_google_trends(["second"]), timeout=5)
+    finally:
+        free_seo_tools.PYTRENDS_AVAILABLE = original_available
+        await tools.aclose()
+
+    assert result["second"]["trend_score"] == 77
+    print("✅ New worker served the next call")
+
+
+async def main():
+    """Ana test fonksiyonu"""
+    try:
+        await test_pending_calls_return_after_aclose()
+        await test_worker_restarts_after_aclose()
+        print("\n🎉 ALL TRENDS WORKER TESTS PASSED")
+    except Exception as e:
+        print(f"\n TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
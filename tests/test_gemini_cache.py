@@ -0,0 +1,109 @@
+"""
+Gemini Cache Test
+Exact ve semantic cache anahtarlarının ayrıştığını, TTL ve eviction'ı kontrol eder
+(API anahtarı veya encoder gerektirmez; embedding'ler elle üretilir)
+"""
+
+import asyncio
+import json
+import sys
+import os
+import time
+from types import SimpleNamespace
+
+# Path fix for tests/ directory
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import numpy as np
+
+from services.gemini_service import GeminiService, SemanticCache
+
+
+DIM = 8
+
+
+def _unit(*values: float) -> np.ndarray:
+    """DIM boyutlu birim vektör"""
+    vector = np.zeros(DIM, dtype=np.float32)
+    vector[:len(values)] = values
+    return vector / np.linalg.norm(vector)
+
+
+def _semantic_key(task: str, temperature: float = 0.2, max_tokens: int = 4096, json_mode: bool = False) -> str:
+    """generate_content'in kullandığı partition anahtarı"""
+    return json.dumps(["gemini-pro", temperature, max_tokens, json_mode, task])
+
+
+def test_exact_cache_key():
+    """Exact cache anahtarı model, prompt, temperature ve max_tokens'a bağlı"""
+    print("🚀 Testing exact cache keys...")
+
+    service = SimpleNamespace(model_name="gemini-pro")
+    key = GeminiService._exact_cache_key(service, "prompt", 0.2, 4096)
+
+    assert key == GeminiService._exact_cache_key(service, "prompt", 0.2, 4096)
+    assert key != GeminiService._exact_cache_key(service, "prompt ", 0.2, 4096)
+    assert key != GeminiService._exact_cache_key(service, "prompt", 0.3, 4096)
+    assert key != GeminiService._exact_cache_key(service, "prompt", 0.2, 2048)
+    assert key != GeminiService._exact_cache_key(SimpleNamespace(model_name="other"), "prompt", 0.2, 4096)
+    print("✅ Exact cache keys separate")
+
+
+def test_semantic_partitions():
+    """Benzer prompt sadece aynı task ve parametrelerle eşleşir"""
+    print("🚀 Testing semantic cache partitions...")
+
+    cache = SemanticCache(threshold=0.9, dim=DIM)
+    now = time.time()
+    cache.add(_semantic_key("keywords"), _unit(1, 0.05), "keyword answer", now)
+
+    near = _unit(1, 0.1)
+    assert cache.lookup(_semantic_key("keywords"), near) == "keyword answer"
+    assert cache.lookup(_semantic_key("outline"), near) is None
+    assert cache.lookup(_semantic_key("keywords", temperature=0.0), near) is None
+    assert cache.lookup(_semantic_key("keywords", max_tokens=1024), near) is None
+    assert cache.lookup(_semantic_key("keywords", json_mode=True), near) is None
+    assert cache.lookup(_semantic_key("keywords"), _unit(0, 1)) is None, "dissimilar prompt must miss"
+    print("✅ Semantic hits stay within their partition")
+
+
+def test_semantic_ttl_and_eviction():
+    """Süresi dolan kayıt düşer; maxsize aşılınca en eski kayıt (tüm partition'larda) çıkar"""
+    print("🚀 Testing semantic TTL and eviction...")
+
+    cache = SemanticCache(threshold=0.9, dim=DIM, maxsize=2, ttl=60)
+    now = time.time()
+
+    cache.add(_semantic_key("a"), _unit(1), "stale", now - 120)
+    assert cache.lookup(_semantic_key("a"), _unit(1)) is None
+    assert len(cache) == 0
+
+    cache.add(_semantic_key("a"), _unit(1), "first", now - 2)
+    cache.add(_semantic_key("b"), _unit(0, 1), "second", now - 1)
+    cache.add(_semantic_key("b"), _unit(0, 0, 1), "third", now)
+
+    assert len(cache) == 2
+    assert cache.lookup(_semantic_key("a"), _unit(1)) is None, "oldest entry must be evicted"
+    assert cache.lookup(_semantic_key("b"), _unit(0, 1)) == "second"
+    assert cache.lookup(_semantic_key("b"), _unit(0, 0, 1)) == "third"
+    print("✅ TTL and eviction work across partitions")
+
+
+async def main():
+    """Ana test fonksiyonu"""
+    try:
+        test_exact_cache_key()
+        test_semantic_partitions()
+        test_semantic_ttl_and_eviction()
+        print("\n🎉 ALL GEMINI CACHE TESTS PASSED")
+    except Exception as e:
+        print(f"\n TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
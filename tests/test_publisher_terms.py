@@ -0,0 +1,130 @@
+"""
+Publisher Term Fallback Test
+Batch endpoint başarısız olduğunda kategori/etiketlerin tek tek çözülmesini
+ve yazının yine de oluşturulmasını kontrol eder (WordPress gerektirmez)
+"""
+
+import asyncio
+import sys
+import os
+
+# Path fix for tests/ directory
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+import agents.publisher as publisher
+from agents.publisher import PublisherAgent
+
+
+class FakeWordPressAPI:
+    """Batch istekleri başarısız olan sahte WordPress istemcisi"""
+
+    def __init__(self, fail_batch: bool = True):
+        self.fail_batch = fail_batch
+        self.single_calls = []
+        self.created_post = None
+        self.closed = False
+
+    @classmethod
+    async def create(cls, **kwargs) -> 'FakeWordPressAPI':
+        return cls()
+
+    async def test_connection(self) -> bool:
+        return True
+
+    async def _batch_or_fail(self, names):
+        if self.fail_batch:
+            raise Exception("Batch request failed: 404 - rest_no_route")
+        return [100 + i for i, _ in enumerate(names)]
+
+    async def create_categories_batch(self, names):
+        return await self._batch_or_fail(names)
+
+    async def create_tags_batch(self, names):
+        return await self._batch_or_fail(names)
+
+    async def get_or_create_category(self, name: str, description: str = '') -> int:
+        self.single_calls.append(('categories', name))
+        return 10 + len(self.single_calls)
+
+    async def get_or_create_tag(self, name: str) -> int:
+        self.single_calls.append(('tags', name))
+        if name == "broken":
+            raise Exception("Tag creation failed")
+        return 20 + len(self.single_calls)
+
+    async def create_post(self, **kwargs):
+        self.created_post = kwargs
+        return {"id": 1, "link": "http://localhost/wordpress/?p=1"}
+
+    async def aclose(self):
+        self.closed = True
+
+
+async def test_batch_fallback():
+    """Batch başarısız → tek tek get_or_create, hatalı terim atlanır, yazı oluşturulur"""
+    print("🚀 Testing batch fallback...")
+
+    clients = []
+
+    async def create(**kwargs):
+        wp = FakeWordPressAPI()
+        clients.append(wp)
+        return wp
+
+    original_create = publisher.WordPressAPI.create
+    publisher.WordPressAPI.create = create
+    try:
+        agent = PublisherAgent(None)
+        result = await agent._publish_to_wordpress({
+            "title": "Test",
+            "content": "<p>Test</p>",
+            "status": "draft",
+            "excerpt": "",
+            "categories": ["Audio"],
+            "tags": ["bluetooth", "broken"]
+        })
+    finally:
+        publisher.WordPressAPI.create = original_create
+
+    wp = clients[0]
+    assert result["success"], result
+    assert sorted(wp.single_calls) == [('categories', 'Audio'), ('tags', 'bluetooth'), ('tags', 'broken')]
+    assert len(wp.created_post["categories"]) == 1
+    assert len(wp.created_post["tags"]) == 1, "failed term must be dropped, not block the post"
+    assert wp.closed
+    print("✅ Post created with per-term IDs after batch failure")
+
+
+async def test_batch_success():
+    """Batch başarılı → tek tek istek atılmaz"""
+    print("🚀 Testing batch path...")
+
+    wp = FakeWordPressAPI(fail_batch=False)
+    agent = PublisherAgent(None)
+    ids = await agent._resolve_terms(
+        wp.create_tags_batch, wp.get_or_create_tag, ["a", "b"], "tags"
+    )
+
+    assert ids == [100, 101]
+    assert not wp.single_calls
+    assert await agent._resolve_terms(wp.create_tags_batch, wp.get_or_create_tag, [], "tags") == []
+    print("✅ Batch IDs used as-is")
+
+
+async def main():
+    """Ana test fonksiyonu"""
+    try:
+        await test_batch_fallback()
+        await test_batch_success()
+        print("\n🎉 ALL PUBLISHER TERM TESTS PASSED")
+    except Exception as e:
+        print(f"\n TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,88 @@
+"""
+Rate Limiter Test
+AsyncTokenBucket'ın burst'e izin verip sonra istekleri `rate`'e göre aralıkladığını kontrol eder
+"""
+
+import asyncio
+import sys
+import os
+import time
+
+# Path fix for tests/ directory
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+from utils.rate_limiter import AsyncTokenBucket
+
+
+async def test_burst():
+    """Kapasite kadar istek beklemeden geçer"""
+    print("🚀 Testing burst...")
+
+    bucket = AsyncTokenBucket(rate=5, capacity=5)
+    start = time.monotonic()
+    for _ in range(5):
+        await bucket.acquire()
+    elapsed = time.monotonic() - start
+
+    assert elapsed < 0.05, f"burst took {elapsed:.3f}s"
+    print(f"✅ 5 requests in {elapsed * 1000:.1f}ms")
+
+
+async def test_pacing():
+    """Kapasite bittikten sonra istekler 1/rate aralıkla geçer (eşzamanlı çağıranlarda da)"""
+    print("🚀 Testing pacing...")
+
+    bucket = AsyncTokenBucket(rate=20, capacity=2)
+    times = []
+
+    async def _one():
+        await bucket.acquire()
+        times.append(time.monotonic())
+
+    start = time.monotonic()
+    await asyncio.gather(*(_one() for _ in range(8)))
+
+    # 2 burst + 6 istek * 50ms = ~300ms
+    elapsed = times[-1] - start
+    assert 0.27 <= elapsed < 0.5, f"8 requests took {elapsed:.3f}s"
+    gaps = [b - a for a, b in zip(times[2:], times[3:])]
+    assert min(gaps) >= 0.045, f"requests too close: {min(gaps):.3f}s"
+    print(f"✅ 8 requests paced over {elapsed:.3f}s")
+
+
+async def test_refill():
+    """Boşta geçen süre token'ları (kapasiteye kadar) doldurur"""
+    print("🚀 Testing refill...")
+
+    bucket = AsyncTokenBucket(rate=20, capacity=2)
+    await bucket.acquire()
+    await bucket.acquire()
+    await asyncio.sleep(0.2)  # 4 token'lık süre, kapasite 2
+
+    start = time.monotonic()
+    await bucket.acquire()
+    await bucket.acquire()
+    assert time.monotonic() - start < 0.02
+    await bucket.acquire()
+    assert time.monotonic() - start >= 0.045, "refill must be capped at capacity"
+    print("✅ Refill capped at capacity")
+
+
+async def main():
+    """Ana test fonksiyonu"""
+    try:
+        await test_burst()
+        await test_pacing()
+        await test_refill()
+        print("\n🎉 ALL RATE LIMITER TESTS PASSED")
+    except Exception as e:
+        print(f"\n TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,62 @@
+"""
+SEO Keyword Density Test
+Tek regex geçişinin her keyword'ü ayrı saydığını kontrol eder; iç içe ve aynı yerde
+başlayan keyword'ler birbirinin sayımını düşürmemeli (API anahtarı gerektirmez)
+"""
+
+import asyncio
+import sys
+import os
+
+# Path fix for tests/ directory
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+from services.seo_tools import SEOToolsService
+
+
+async def _occurrences(seo: SEOToolsService, content: str, keywords) -> dict:
+    result = await seo.get_content_optimization_suggestions(content, list(keywords))
+    return {keyword: stats['occurrences'] for keyword, stats in result['keyword_density'].items()}
+
+
+async def test_overlapping_keywords(seo: SEOToolsService):
+    """Uzun keyword kısa olanı içeriyorsa ikisi de tam sayılır"""
+    print("🚀 Testing overlapping keywords...")
+
+    counts = await _occurrences(seo, "Best gaming mouse for gaming", ("gaming", "gaming mouse", "mouse"))
+    assert counts == {"gaming": 2, "gaming mouse": 1, "mouse": 1}, counts
+
+    counts = await _occurrences(seo, "wireless earbuds vs wireless earbuds pro", ("wireless earbuds", "wireless earbuds pro", "earbuds"))
+    assert counts == {"wireless earbuds": 2, "wireless earbuds pro": 1, "earbuds": 2}, counts
+    print("✅ Nested keywords counted independently")
+
+
+async def test_word_edges(seo: SEOToolsService):
+    """Kelime içinde geçen keyword sayılmaz; noktalama ile biten keyword'ler sayılır"""
+    print("🚀 Testing word edges...")
+
+    counts = await _occurrences(seo, "A mousepad is not a mouse. C++ beats c++11? c++!", ("mouse", "c++", "Mouse"))
+    assert counts == {"mouse": 1, "c++": 2, "Mouse": 1}, counts
+    print("✅ Word edges respected")
+
+
+async def main():
+    """Ana test fonksiyonu"""
+    seo = SEOToolsService()
+    try:
+        await test_overlapping_keywords(seo)
+        await test_word_edges(seo)
+        print("\n🎉 ALL KEYWORD DENSITY TESTS PASSED")
+    except Exception as e:
+        print(f"\n TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        await seo.aclose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,145 @@
+"""
+SEO Single-Flight Test
+Aynı key için eşzamanlı çağrıların tek isteği paylaştığını ve iptallerin
+doğru kişiye yansıdığını kontrol eder (API anahtarı gerektirmez)
+"""
+
+import asyncio
+import sys
+import os
+
+# Path fix for tests/ directory
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+from services.seo_tools import SEOToolsService
+
+
+class FakeFetch:
+    """Çağrı sayısını tutan, release edilene kadar bekleyen sahte istek"""
+
+    def __init__(self, result="data"):
+        self.result = result
+        self.calls = 0
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+
+    async def __call__(self):
+        self.calls += 1
+        self.started.set()
+        await self.release.wait()
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+
+async def test_fan_out(seo: SEOToolsService):
+    """10 eşzamanlı çağrı → tek istek, herkes aynı sonucu alır"""
+    print("🚀 Testing fan-out...")
+
+    fetch = FakeFetch()
+    key = ('serpapi', 'fan-out', 'us')
+    tasks = [asyncio.create_task(seo._single_flight(key, fetch)) for _ in range(10)]
+    await fetch.started.wait()
+    fetch.release.set()
+    results = await asyncio.gather(*tasks)
+
+    assert fetch.calls == 1, f"{fetch.calls} requests sent"
+    assert results == ["data"] * 10
+    assert key not in seo._inflight
+    print("✅ 10 callers shared 1 request")
+
+
+async def test_error_fan_out(seo: SEOToolsService):
+    """İsteğin hatası bekleyen herkese iletilir"""
+    print("🚀 Testing error fan-out...")
+
+    fetch = FakeFetch(ValueError("boom"))
+    key = ('serpapi', 'error', 'us')
+    tasks = [asyncio.create_task(seo._single_flight(key, fetch)) for _ in range(3)]
+    await fetch.started.wait()
+    fetch.release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    assert fetch.calls == 1
+    assert all(isinstance(r, ValueError) for r in results)
+    assert key not in seo._inflight
+    print("✅ Error delivered to every caller")
+
+
+async def test_waiter_cancel(seo: SEOToolsService):
+    """Bekleyen bir çağıranın iptali paylaşılan isteği iptal etmez"""
+    print("🚀 Testing waiter cancellation...")
+
+    fetch = FakeFetch()
+    key = ('serpapi', 'waiter-cancel', 'us')
+    owner = asyncio.create_task(seo._single_flight(key, fetch))
+    await fetch.started.wait()
+    waiter = asyncio.create_task(seo._single_flight(key, fetch))
+    await asyncio.sleep(0)
+
+    waiter.cancel()
+    try:
+        await waiter
+        raise AssertionError("waiter was not cancelled")
+    except asyncio.CancelledError:
+        pass
+
+    fetch.release.set()
+    assert await owner == "data"
+    assert fetch.calls == 1
+    print("✅ Owner finished after waiter was cancelled")
+
+
+async def test_owner_cancel(seo: SEOToolsService):
+    """İsteğin sahibi iptal edilirse bekleyenler iptali devralmaz, isteği yeniden başlatır"""
+    print("🚀 Testing owner cancellation...")
+
+    fetch = FakeFetch()
+    key = ('serpapi', 'owner-cancel', 'us')
+    owner = asyncio.create_task(seo._single_flight(key, fetch))
+    await fetch.started.wait()
+    waiters = [asyncio.create_task(seo._single_flight(key, fetch)) for _ in range(3)]
+    await asyncio.sleep(0)
+
+    owner.cancel()
+    try:
+        await owner
+        raise AssertionError("owner was not cancelled")
+    except asyncio.CancelledError:
+        pass
+
+    # Bekleyenlerden biri isteği yeniden başlatır, diğerleri onu bekler
+    while fetch.calls < 2:
+        await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    fetch.release.set()
+    results = await asyncio.gather(*waiters)
+
+    assert results == ["data"] * 3
+    assert fetch.calls == 2, f"{fetch.calls} requests sent"
+    assert key not in seo._inflight
+    print("✅ Waiters re-ran the request once")
+
+
+async def main():
+    """Ana test fonksiyonu"""
+    seo = SEOToolsService()
+    try:
+        await test_fan_out(seo)
+        await test_error_fan_out(seo)
+        await test_waiter_cancel(seo)
+        await test_owner_cancel(seo)
+        print("\n🎉 ALL SINGLE-FLIGHT TESTS PASSED")
+    except Exception as e:
+        print(f"\n TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+    finally:
+        await seo.aclose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,89 @@
+"""
+WordPress JWT Refresh Test
+Sunucu token'ı reddettiğinde (401) yeni token alınıp isteğin tekrarlandığını kontrol eder
+(yerel aiohttp sunucusu ile; WordPress gerektirmez)
+"""
+
+import asyncio
+import sys
+import os
+import time
+
+# Path fix for tests/ directory
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+sys.path.append(parent_dir)
+
+from aiohttp import web
+
+import services.wordpress_api as wordpress_api
+from services.wordpress_api import WordPressAPI
+
+
+class FakeWordPress:
+    """jwt-auth eklentisi gibi davranan sahte sunucu"""
+
+    def __init__(self):
+        self.valid_token = "fresh-token"
+        self.token_requests = []
+
+    async def token(self, request: web.Request) -> web.Response:
+        # jwt-auth gelen her Bearer header'ı doğrular; geçersizse token isteğini reddeder
+        self.token_requests.append(request.headers.get('Authorization'))
+        if request.headers.get('Authorization', '').startswith('Bearer '):
+            return web.json_response({'code': 'jwt_auth_invalid_token'}, status=403)
+        return web.json_response({'token': self.valid_token})
+
+    async def posts(self, request: web.Request) -> web.Response:
+        if request.headers.get('Authorization') != f'Bearer {self.valid_token}':
+            return web.json_response({'code': 'jwt_auth_invalid_token'}, status=401)
+        return web.json_response({'id': 1, 'link': 'http://localhost/?p=1', 'status': 'draft'}, status=201)
+
+
+async def test_refresh_on_401():
+    """Cache'teki süresi dolmuş token 401 alır → yeni token Authorization'sız istenir → post oluşur"""
+    print("🚀 Testing JWT refresh on 401...")
+
+    fake = FakeWordPress()
+    app = web.Application()
+    app.router.add_post('/wp-json/jwt-auth/v1/token', fake.token)
+    app.router.add_post('/wp-json/wp/v2/posts', fake.posts)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    base_url = f"http://127.0.0.1:{port}"
+
+    # Sunucunun artık kabul etmediği token cache'te (süresi henüz dolmamış görünüyor)
+    wordpress_api._jwt_tokens[(base_url, 'admin')] = ("revoked-token", time.monotonic() + 3600)
+    try:
+        async with await WordPressAPI.create(base_url, 'admin', 'secret', use_jwt=True) as wp:
+            assert wp.token == "revoked-token"
+            post = await wp.create_post(title="Test", content="<p>Test</p>")
+
+            assert post['id'] == 1
+            assert wp.token == "fresh-token"
+            assert fake.token_requests == [None], f"token request headers: {fake.token_requests}"
+            assert wordpress_api._jwt_tokens[(base_url, 'admin')][0] == "fresh-token"
+    finally:
+        wordpress_api._jwt_tokens.pop((base_url, 'admin'), None)
+        await runner.cleanup()
+
+    print("✅ Token refreshed without the stale Authorization header")
+
+
+async def main():
+    """Ana test fonksiyonu"""
+    try:
+        await test_refresh_on_401()
+        print("\n🎉 ALL WORDPRESS JWT TESTS PASSED")
+    except Exception as e:
+        print(f"\n TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -10,15 +10,51 @@ Bu modül keyword'lerin değerini hesaplar ve scoring yapar:
 Her keyword için 0-100 arası bir skor üretir.
 """
 
+import bisect
+import functools
+import heapq
+import importlib.util
 import logging
 import math
-from typing import Dict, List, Any, Optional, Tuple
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Tuple, NamedTuple
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-import statistics
 
+# numpy sadece vektörize yolda, ilk çağrıda import edilir; tekil skorlama import maliyeti ödemez
+NUMPY_AVAILABLE = importlib.util.find_spec("numpy") is not None
 
-@dataclass
+
+# Recommendation parçaları (genel skor bandı: düşükten yükseğe)
+_REC_OVERALL = (
+    "Low-value keyword - consider alternatives",
+    "Moderate keyword - may be worth targeting",
+    "Good keyword - consider targeting",
+    "Excellent keyword - high priority target",
+)
+_REC_LOW_VOLUME = "Low search volume - consider long-tail variations"
+_REC_HIGH_COMPETITION = "High competition - may be difficult to rank"
+_REC_CPC = (None, "High commercial value - good for monetization",
+            "Low commercial intent - focus on traffic volume")
+_REC_TREND = (None, "Declining trend - monitor performance closely",
+              "Rising trend - opportunity for growth")
+
+
+@functools.lru_cache(maxsize=None)
+def _join_recommendation(band: int, low_volume: bool, high_competition: bool,
+                         cpc_state: int, trend_state: int) -> str:
+    """Parça kombinasyonundan recommendation metni (en fazla 4*2*2*3*3 = 144 farklı metin)"""
+    fragments = (
+        _REC_OVERALL[band],
+        _REC_LOW_VOLUME if low_volume else None,
+        _REC_HIGH_COMPETITION if high_competition else None,
+        _REC_CPC[cpc_state],
+        _REC_TREND[trend_state],
+    )
+    return " | ".join(fragment for fragment in fragments if fragment)
+
+
+@dataclass(slots=True, frozen=True)
 class KeywordMetrics:
     """Keyword metrikleri için veri yapısı"""
     keyword: str
@@ -30,15 +66,59 @@ class KeywordMetrics:
     last_updated: datetime
 
 
-@dataclass
+class ComponentScores(NamedTuple):
+    """Component skorları (0-100); alan sırası KeywordScorer._WEIGHT_KEYS ile aynı"""
+    search_volume: float
+    keyword_difficulty: float
+    cpc: float
+    trend: float
+    
+    def __getitem__(self, key):
+        # Geriye uyumluluk: component_scores['cpc'] gibi string anahtarlar
+        if isinstance(key, str):
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
+    
+    def asdict(self) -> Dict[str, float]:
+        return self._asdict()
+
+
 class KeywordScore:
-    """Keyword skoru sonuç yapısı"""
-    keyword: str
-    total_score: float  # 0-100
-    component_scores: Dict[str, float]
-    grade: str  # A+, A, B+, B, C+, C, D
-    recommendation: str
-    metrics: KeywordMetrics
+    """
+    Keyword skoru sonuç yapısı
+    
+    recommendation ilk erişimde üretilir: büyük listelerde sadece gösterilen
+    keyword'ler için string üretim maliyeti ödenir
+    
+    metrics sadece retain_metrics=True ile tutulur; aksi halde None olur ve
+    skor, girdi KeywordMetrics nesnelerini bellekte tutmaz (keyword ile eşleştirilir)
+    """
+    __slots__ = ('keyword', 'total_score', 'component_scores', 'grade', 'metrics',
+                 '_recommendation', '_scorer')
+    
+    def __init__(self, keyword: str, total_score: float, component_scores: ComponentScores,
+                 grade: str, metrics: Optional[KeywordMetrics] = None, recommendation: Optional[str] = None,
+                 scorer: Optional['KeywordScorer'] = None):
+        self.keyword = keyword
+        self.total_score = total_score  # 0-100
+        self.component_scores = component_scores
+        self.grade = grade  # A+, A, B+, B, C+, C, D
+        self.metrics = metrics
+        self._recommendation = recommendation
+        self._scorer = scorer
+    
+    @property
+    def recommendation(self) -> str:
+        if self._recommendation is None:
+            self._recommendation = self._scorer._generate_recommendation(
+                self.total_score, self.component_scores, self.metrics
+            )
+            self._scorer = None
+        return self._recommendation
+    
+    def __repr__(self) -> str:
+        return (f"KeywordScore(keyword={self.keyword!r}, total_score={self.total_score!r}, "
+                f"grade={self.grade!r})")
 
 
 class KeywordScorer:
@@ -60,6 +140,10 @@ class KeywordScorer:
         'trend': 0.10
     }
     
+    # Hesaplamada kullanılan sabit sıralı ağırlık vektörü (component sırası _WEIGHT_KEYS)
+    _WEIGHT_KEYS = ('search_volume', 'keyword_difficulty', 'cpc', 'trend')
+    _WEIGHT_VECTOR = tuple(map(WEIGHTS.get, _WEIGHT_KEYS))
+    
     # Grade thresholds
     GRADE_THRESHOLDS = {
         'A+': 90,
@@ -71,10 +155,17 @@ class KeywordScorer:
         'D': 0
     }
     
+    # Artan eşikler ve paralel grade etiketleri (bisect / searchsorted için)
+    _GRADE_CUTOFFS = tuple(sorted(GRADE_THRESHOLDS.values()))
+    _GRADE_LABELS = tuple(sorted(GRADE_THRESHOLDS, key=GRADE_THRESHOLDS.get))
+    
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         
-        # Normalizasyon için benchmark değerler
+        # Aynı metrikler (re-ranking, A/B varyantları) tekrar hesaplanmasın
+        self._score_cached = functools.lru_cache(maxsize=16384)(self._score_components)
+        
+        # Normalizasyon için benchmark değerler (setter türetilmiş değerleri de kurar)
         self.benchmarks = {
             'high_volume': 100000,     # Yüksek arama hacmi
             'medium_volume': 10000,    # Orta arama hacmi
@@ -84,23 +175,44 @@ class KeywordScorer:
             'low_cpc': 0.5            # Düşük CPC ($)
         }
     
+    @property
+    def benchmarks(self) -> Mapping[str, float]:
+        """
+        Salt okunur benchmark değerleri
+        
+        Değiştirmek için tüm sözlük atanır (scorer.benchmarks = {...}); türetilmiş
+        değerler yeniden hesaplanır ve skor cache'i temizlenir
+        """
+        return self._benchmarks
+    
+    @benchmarks.setter
+    def benchmarks(self, values: Mapping[str, float]):
+        benchmarks = dict(values)
+        self._benchmarks = MappingProxyType(benchmarks)
+        
+        # Her keyword'de tekrar hesaplanmasın: sabit log ve bölenlerin tersleri
+        self._inv_log_high_volume = 1.0 / math.log10(benchmarks['high_volume'])
+        self._cpc_hi_med_inv = 1.0 / (benchmarks['high_cpc'] - benchmarks['medium_cpc'])
+        self._cpc_med_low_inv = 1.0 / (benchmarks['medium_cpc'] - benchmarks['low_cpc'])
+        self._cpc_low_inv = 1.0 / benchmarks['low_cpc']
+        
+        # normalize_cpc'nin kırılma noktaları: aralar lineer, 0 altı 0, high_cpc üstü 100
+        self._cpc_breaks = (0.0, benchmarks['low_cpc'], benchmarks['medium_cpc'], benchmarks['high_cpc'])
+        self._cpc_values = (0.0, 20.0, 60.0, 100.0)
+        
+        # Eski benchmark'larla hesaplanmış skorlar geçersiz
+        self.cache_clear()
+    
     def normalize_search_volume(self, volume: int) -> float:
         """
         Arama hacmini 0-100 arasında normalize eder
         
         Logaritmik ölçekleme kullanır çünkü arama hacmi exponential dağılır
         """
-        if volume <= 0:
+        # Logaritmik normalizasyon, 0-100 arası scale et; 1'in altı log10 ile 0'a düşer
+        if volume < 1:
             return 0.0
-        
-        # Logaritmik normalizasyon
-        log_volume = math.log10(max(volume, 1))
-        log_high = math.log10(self.benchmarks['high_volume'])
-        
-        # 0-100 arası scale et
-        normalized = (log_volume / log_high) * 100
-        
-        return min(normalized, 100.0)
+        return min(100.0, math.log10(volume) * self._inv_log_high_volume * 100.0)
     
     def normalize_keyword_difficulty(self, difficulty: float) -> float:
         """
@@ -108,13 +220,8 @@ class KeywordScorer:
         
         Difficulty 0-100 arası gelir, biz tersine çeviriyoruz
         """
-        if difficulty < 0:
-            difficulty = 0
-        elif difficulty > 100:
-            difficulty = 100
-        
         # Ters çevirme: düşük difficulty = yüksek skor
-        return 100 - difficulty
+        return 100.0 - max(0.0, min(100.0, difficulty))
     
     def normalize_cpc(self, cpc: float) -> float:
         """
@@ -130,15 +237,15 @@ class KeywordScorer:
             return 100.0
         elif cpc >= self.benchmarks['medium_cpc']:
             # Medium-High arası linear interpolation
-            ratio = (cpc - self.benchmarks['medium_cpc']) / (self.benchmarks['high_cpc'] - self.benchmarks['medium_cpc'])
+            ratio = (cpc - self.benchmarks['medium_cpc']) * self._cpc_hi_med_inv
             return 60 + (ratio * 40)  # 60-100 arası
         elif cpc >= self.benchmarks['low_cpc']:
             # Low-Medium arası linear interpolation
-            ratio = (cpc - self.benchmarks['low_cpc']) / (self.benchmarks['medium_cpc'] - self.benchmarks['low_cpc'])
+            ratio = (cpc - self.benchmarks['low_cpc']) * self._cpc_med_low_inv
             return 20 + (ratio * 40)  # 20-60 arası
         else:
             # Very low CPC
-            ratio = cpc / self.benchmarks['low_cpc']
+            ratio = cpc * self._cpc_low_inv
             return ratio * 20  # 0-20 arası
     
     def calculate_trend_score(self, trend_data: Any) -> float:
@@ -148,117 +255,153 @@ class KeywordScorer:
         Args:
             trend_data: Trend verisi (basit implementation için 0-100 arası değer)
         """
+        # min/max sırası NaN'ı korur (kırpılıp geçerli skora dönüşmez)
         if isinstance(trend_data, (int, float)):
-            return max(0, min(100, float(trend_data)))
+            return min(max(float(trend_data), 0.0), 100.0)
         
         # Gelecekte Google Trends API entegrasyonu için
         # trend_data kompleks veri yapısı olabilir
         if isinstance(trend_data, dict):
             if 'score' in trend_data:
-                return max(0, min(100, float(trend_data['score'])))
+                return min(max(float(trend_data['score']), 0.0), 100.0)
             elif 'values' in trend_data:
                 # Son 3 ayın ortalaması
                 values = trend_data['values'][-12:]  # Son 12 hafta
-                return statistics.mean(values) if values else 50.0
+                if not len(values):
+                    return 50.0
+                # numpy dizisi doğrudan C'de ortalanır; liste için sum/len
+                if hasattr(values, 'mean'):
+                    return float(values.mean())
+                return sum(values) / len(values)
         
         # Default: orta değer
         return 50.0
     
-    def calculate_keyword_score(self, metrics: KeywordMetrics) -> KeywordScore:
+    def calculate_keyword_score(self, metrics: KeywordMetrics, retain_metrics: bool = True) -> KeywordScore:
         """
         Ana keyword scoring algoritması
         
         Args:
             metrics: Keyword metrikleri
+            retain_metrics: False ise KeywordScore.metrics None bırakılır
             
         Returns:
             KeywordScore: Hesaplanmış keyword skoru
         """
         
+        # trend_score dict olabilir (hashlenemez); cache anahtarı çözülmüş trend skoru
+        total_score, component_scores, grade = self._score_cached(*self._metric_values(metrics))
+        
+        # Recommendation ilk erişimde üretilir
+        return KeywordScore(
+            keyword=metrics.keyword,
+            total_score=total_score,
+            component_scores=component_scores,
+            grade=grade,
+            metrics=metrics if retain_metrics else None,
+            scorer=self
+        )
+    
+    def _metric_values(self, metrics: KeywordMetrics) -> Tuple[float, float, float, float]:
+        """
+        Skorlamaya girecek (volume, difficulty, cpc, trend) değerleri
+        
+        Sayıya çevrilemeyen (None vb.) ya da sonlu olmayan (NaN/inf) değerde hata fırlatır;
+        tekil ve vektörize yol aynı keyword'leri eler
+        """
+        values = (
+            float(metrics.search_volume),
+            float(metrics.keyword_difficulty),
+            float(metrics.cpc),
+            self.calculate_trend_score(metrics.trend_score)
+        )
+        if not all(map(math.isfinite, values)):
+            raise ValueError(f"non-finite metric values {values}")
+        return values
+    
+    def _score_components(self, search_volume: int, keyword_difficulty: float, cpc: float,
+                          trend: float) -> Tuple[float, ComponentScores, str]:
+        """Sayısal skor çekirdeği: (total, component skorları, grade)"""
+        
         # Her component için skor hesapla
-        volume_score = self.normalize_search_volume(metrics.search_volume)
-        difficulty_score = self.normalize_keyword_difficulty(metrics.keyword_difficulty)
-        cpc_score = self.normalize_cpc(metrics.cpc)
-        trend_score = self.calculate_trend_score(metrics.trend_score)
+        volume_score = self.normalize_search_volume(search_volume)
+        difficulty_score = self.normalize_keyword_difficulty(keyword_difficulty)
+        cpc_score = self.normalize_cpc(cpc)
+        trend_score = self.calculate_trend_score(trend)
         
         # Ağırlıklı toplam hesapla
+        w_volume, w_difficulty, w_cpc, w_trend = self._WEIGHT_VECTOR
         total_score = (
-            volume_score * self.WEIGHTS['search_volume'] +
-            difficulty_score * self.WEIGHTS['keyword_difficulty'] +
-            cpc_score * self.WEIGHTS['cpc'] +
-            trend_score * self.WEIGHTS['trend']
+            volume_score * w_volume +
+            difficulty_score * w_difficulty +
+            cpc_score * w_cpc +
+            trend_score * w_trend
         )
         
-        # Component scores
-        component_scores = {
-            'search_volume': volume_score,
-            'keyword_difficulty': difficulty_score,
-            'cpc': cpc_score,
-            'trend': trend_score
-        }
-        
         # Grade hesapla
         grade = self._calculate_grade(total_score)
         
-        # Recommendation oluştur
-        recommendation = self._generate_recommendation(total_score, component_scores, metrics)
-        
-        return KeywordScore(
-            keyword=metrics.keyword,
-            total_score=total_score,
-            component_scores=component_scores,
-            grade=grade,
-            recommendation=recommendation,
-            metrics=metrics
-        )
+        component_scores = ComponentScores(volume_score, difficulty_score, cpc_score, trend_score)
+        return total_score, component_scores, grade
+    
+    def cache_clear(self):
+        """Skor cache'ini temizle (testler için; benchmark ataması bunu kendisi çağırır)"""
+        self._score_cached.cache_clear()
     
     def _calculate_grade(self, score: float) -> str:
         """Skordan grade hesaplar"""
-        for grade, threshold in self.GRADE_THRESHOLDS.items():
-            if score >= threshold:
-                return grade
-        return 'D'
+        # En düşük eşiğin altı (negatif skor) en düşük grade'e düşer
+        index = bisect.bisect_right(self._GRADE_CUTOFFS, score) - 1
+        return self._GRADE_LABELS[max(index, 0)]
     
-    def _generate_recommendation(self, total_score: float, component_scores: Dict[str, float], metrics: KeywordMetrics) -> str:
-        """Skor ve metriklere göre recommendation üretir"""
+    def _calculate_grades(self, totals: "np.ndarray") -> List[str]:
+        """Skor dizisinden grade listesi (tek searchsorted çağrısı)"""
+        import numpy as np
         
-        recommendations = []
+        index = np.searchsorted(self._GRADE_CUTOFFS, totals, side='right') - 1
+        labels = np.array(self._GRADE_LABELS)
+        return labels[np.maximum(index, 0)].tolist()
+    
+    def _generate_recommendation(self, total_score: float, component_scores: ComponentScores,
+                                 metrics: Optional[KeywordMetrics] = None) -> str:
+        """Skor ve metriklere göre recommendation üretir"""
         
         # Genel skor değerlendirmesi
         if total_score >= 80:
-            recommendations.append("Excellent keyword - high priority target")
+            band = 3
         elif total_score >= 60:
-            recommendations.append("Good keyword - consider targeting")
+            band = 2
         elif total_score >= 40:
-            recommendations.append("Moderate keyword - may be worth targeting")
+            band = 1
         else:
-            recommendations.append("Low-value keyword - consider alternatives")
+            band = 0
         
         # Component-specific öneriler
-        if component_scores['search_volume'] < 30:
-            recommendations.append("Low search volume - consider long-tail variations")
-        
-        if component_scores['keyword_difficulty'] < 40:
-            recommendations.append("High competition - may be difficult to rank")
-        
-        if component_scores['cpc'] > 80:
-            recommendations.append("High commercial value - good for monetization")
-        elif component_scores['cpc'] < 20:
-            recommendations.append("Low commercial intent - focus on traffic volume")
-        
-        if component_scores['trend'] < 30:
-            recommendations.append("Declining trend - monitor performance closely")
-        elif component_scores['trend'] > 70:
-            recommendations.append("Rising trend - opportunity for growth")
-        
-        return " | ".join(recommendations)
+        cpc = component_scores.cpc
+        cpc_state = 1 if cpc > 80 else 2 if cpc < 20 else 0
+        
+        trend = component_scores.trend
+        trend_state = 1 if trend < 30 else 2 if trend > 70 else 0
+        
+        # Aynı kombinasyon aynı metni üretir: join sonucu cache'ten döner
+        return _join_recommendation(
+            band,
+            component_scores.search_volume < 30,
+            component_scores.keyword_difficulty < 40,
+            cpc_state,
+            trend_state
+        )
     
-    def score_keyword_list(self, keywords_metrics: List[KeywordMetrics]) -> List[KeywordScore]:
+    def score_keyword_list(self, keywords_metrics: List[KeywordMetrics],
+                           top_k: Optional[int] = None,
+                           retain_metrics: bool = False) -> List[KeywordScore]:
         """
         Keyword listesini toplu olarak skorlar
         
         Args:
             keywords_metrics: Keyword metrikleri listesi
+            top_k: Sadece en iyi K keyword gerekiyorsa (tüm liste sıralanmaz)
+            retain_metrics: True ise her skor girdi metriklerini .metrics'te tutar
             
         Returns:
             List[KeywordScore]: Skorlanmış keyword'ler (yüksek skordan düşüğe)
@@ -267,17 +410,105 @@ class KeywordScorer:
         
         for metrics in keywords_metrics:
             try:
-                score = self.calculate_keyword_score(metrics)
+                score = self.calculate_keyword_score(metrics, retain_metrics)
                 scores.append(score)
                 self.logger.debug(f"Scored '{metrics.keyword}': {score.total_score:.1f} ({score.grade})")
             except Exception as e:
                 self.logger.error(f"Failed to score keyword '{metrics.keyword}': {str(e)}")
         
         # Skorlara göre sırala (yüksekten düşüğe)
+        if top_k is not None:
+            return heapq.nlargest(top_k, scores, key=lambda x: x.total_score)
         scores.sort(key=lambda x: x.total_score, reverse=True)
         
         return scores
     
+    def score_keyword_list_vectorized(self, keywords_metrics: List[KeywordMetrics],
+                                      top_k: Optional[int] = None,
+                                      retain_metrics: bool = False) -> List[KeywordScore]:
+        """
+        score_keyword_list'in NumPy versiyonu: metrikler sütun dizilerine (SoA) alınır,
+        tüm component skorları tek geçişte vektör işlemleriyle hesaplanır
+        
+        Büyük keyword listeleri (1k+) için; numpy yoksa score_keyword_list'e düşer.
+        top_k verilirse sadece en iyi K keyword için KeywordScore oluşturulur.
+        retain_metrics score_keyword_list'teki gibi.
+        
+        Returns:
+            List[KeywordScore]: Skorlanmış keyword'ler (yüksek skordan düşüğe)
+        """
+        if not NUMPY_AVAILABLE or not keywords_metrics:
+            return self.score_keyword_list(keywords_metrics, top_k, retain_metrics)
+        if top_k is not None and top_k <= 0:
+            return []
+        
+        import numpy as np
+        
+        n = len(keywords_metrics)
+        try:
+            vol = np.fromiter((m.search_volume for m in keywords_metrics), dtype=np.float64, count=n)
+            diff = np.fromiter((m.keyword_difficulty for m in keywords_metrics), dtype=np.float64, count=n)
+            cpc = np.fromiter((m.cpc for m in keywords_metrics), dtype=np.float64, count=n)
+            # trend_score sayı ya da dict olabilir; tek tek çözülür
+            trend = np.fromiter((self.calculate_trend_score(m.trend_score) for m in keywords_metrics),
+                                dtype=np.float64, count=n)
+            valid = np.isfinite(vol) & np.isfinite(diff) & np.isfinite(cpc) & np.isfinite(trend)
+        except Exception:
+            valid = None
+        
+        # Hatalı satır varsa: satır satır doğrula, score_keyword_list ile aynı log ve eleme
+        if valid is None or not valid.all():
+            kept, columns = [], []
+            for metrics in keywords_metrics:
+                try:
+                    columns.append(self._metric_values(metrics))
+                    kept.append(metrics)
+                except Exception as e:
+                    self.logger.error(f"Failed to score keyword '{metrics.keyword}': {str(e)}")
+            if not kept:
+                return []
+            keywords_metrics = kept
+            n = len(kept)
+            vol, diff, cpc, trend = np.array(columns, dtype=np.float64).T
+        
+        # Search volume: logaritmik, 0-100
+        vol_s = np.where(vol > 0, np.minimum(np.log10(np.maximum(vol, 1)) * (self._inv_log_high_volume * 100), 100.0), 0.0)
+        
+        # Difficulty: ters çevrilmiş
+        diff_s = 100 - np.clip(diff, 0, 100)
+        
+        # CPC: benchmark'lar arası parçalı lineer; np.interp uçlarda sabitler (dallanma yok)
+        cpc_s = np.interp(cpc, self._cpc_breaks, self._cpc_values)
+        
+        components = np.stack([vol_s, diff_s, cpc_s, trend])
+        totals = np.asarray(self._WEIGHT_VECTOR) @ components
+        
+        # Stabil sıralama: eşit skorlarda giriş sırası korunur (list.sort ile aynı)
+        if top_k is not None and top_k < n:
+            # K. en büyük skor eşik; eşitler dahil adaylar sıralanır (O(N + C log C))
+            kth = np.partition(totals, n - top_k)[n - top_k]
+            candidates = np.flatnonzero(totals >= kth)
+            order = candidates[np.argsort(-totals[candidates], kind='stable')][:top_k]
+        else:
+            order = np.argsort(-totals, kind='stable')
+        grades = self._calculate_grades(totals[order])
+        # Seçilen satırlar (keyword başına 4 component) tek tolist ile Python float'a
+        rows = components.T[order].tolist()
+        
+        scores = []
+        for i, grade, row in zip(order.tolist(), grades, rows):
+            metrics = keywords_metrics[i]
+            scores.append(KeywordScore(
+                keyword=metrics.keyword,
+                total_score=float(totals[i]),
+                component_scores=ComponentScores(*row),
+                grade=grade,
+                metrics=metrics if retain_metrics else None,
+                scorer=self
+            ))
+        
+        return scores
+    
     def get_top_keywords(self, keyword_scores: List[KeywordScore], count: int = 10, min_grade: str = 'C') -> List[KeywordScore]:
         """
         En iyi keyword'leri filtreler
@@ -310,24 +541,30 @@ class KeywordScorer:
             return {"error": "No keyword scores provided"}
         
         total_keywords = len(keyword_scores)
-        avg_score = statistics.mean([score.total_score for score in keyword_scores])
         
-        # Grade dağılımı
+        # Tek geçiş: toplam skor, component toplamları ve grade dağılımı (ilk görülme sırasıyla)
+        total_sum = volume_sum = difficulty_sum = cpc_sum = trend_sum = 0.0
         grade_distribution = {}
         for score in keyword_scores:
-            grade = score.grade
-            grade_distribution[grade] = grade_distribution.get(grade, 0) + 1
+            total_sum += score.total_score
+            volume, difficulty, cpc, trend = score.component_scores
+            volume_sum += volume
+            difficulty_sum += difficulty
+            cpc_sum += cpc
+            trend_sum += trend
+            grade_distribution[score.grade] = grade_distribution.get(score.grade, 0) + 1
+        
+        avg_score = total_sum / total_keywords
+        avg_components = dict(zip(
+            self._WEIGHT_KEYS,
+            (volume_sum / total_keywords, difficulty_sum / total_keywords,
+             cpc_sum / total_keywords, trend_sum / total_keywords)
+        ))
         
         # En iyi ve en kötü keyword'ler
         best_keywords = keyword_scores[:5]
         worst_keywords = keyword_scores[-5:]
         
-        # Component analizi
-        avg_components = {
-            component: statistics.mean([score.component_scores[component] for score in keyword_scores])
-            for component in ['search_volume', 'keyword_difficulty', 'cpc', 'trend']
-        }
-        
         return {
             "summary": {
                 "total_keywords": total_keywords,
@@ -0,0 +1,36 @@
+"""
+Rate Limiting - AI SEO Blog Generator
+
+SEO servislerinin (free tools ve paid API'ler) ortak kullandığı rate limiter
+"""
+
+import asyncio
+import time
+
+
+class AsyncTokenBucket:
+    """
+    Async token bucket rate limiter
+    
+    Kapasite kadar burst'e izin verir, uzun vadede `rate` istek/saniye sınırlar
+    """
+    
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last = time.monotonic()
+        self.lock = asyncio.Lock()
+    
+    async def acquire(self, n: float = 1):
+        async with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            
+            if self.tokens < n:
+                await asyncio.sleep((n - self.tokens) / self.rate)
+                self.last = time.monotonic()
+                self.tokens = 0
+            else:
+                self.tokens -= n